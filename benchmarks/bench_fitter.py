@@ -0,0 +1,96 @@
+"""Benchmarks of fitter, run with airspeed velocity (https://asv.readthedocs.io)::
+
+    pip install asv
+    asv run                      # benchmark the latest commit of the main branch
+    asv continuous main HEAD     # compare a branch against main
+    asv publish && asv preview   # browse the history of the results
+
+A single benchmark may be selected with ``asv run --bench FitSize``. ``time_*``
+benchmarks measure the wall time, ``peakmem_*`` the peak memory (resident set
+size) of the process and ``timeraw_*`` run in a fresh interpreter.
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+from scipy import stats
+
+from fitter import Fitter, HistFit, get_common_distributions, get_distributions
+
+
+def _gamma_data(n):
+    return stats.gamma.rvs(2, loc=1.5, scale=2, size=n, random_state=np.random.default_rng(0))
+
+
+class FitSize:
+    """Fitter.fit on the common distributions for increasing data sizes."""
+
+    params = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+    param_names = ["n"]
+    timeout = 1800
+
+    def setup(self, n):
+        self.data = _gamma_data(n)
+
+    def time_fit(self, n):
+        Fitter(self.data, distributions=get_common_distributions(), verbose=False).fit()
+
+    def peakmem_fit(self, n):
+        Fitter(self.data, distributions=get_common_distributions(), verbose=False).fit()
+
+    def time_fit_subsample(self, n):
+        Fitter(self.data, distributions=get_common_distributions(), verbose=False).fit(subsample=10_000)
+
+
+class FitDistributions:
+    """Fitter.fit on the common and on all scipy distributions."""
+
+    params = ["common", "all"]
+    param_names = ["distributions"]
+    timeout = 3600
+
+    def setup(self, distributions):
+        self.data = _gamma_data(10_000)
+        self.distributions = get_common_distributions() if distributions == "common" else get_distributions()
+
+    def time_fit(self, distributions):
+        Fitter(self.data, distributions=self.distributions, timeout=30, verbose=False).fit()
+
+
+class FitBackend:
+    """Fitter.fit with the joblib backends and the sandbox pool, for several numbers of workers."""
+
+    params = (["processes", "threads", "sandbox"], [1, 2, 4, -1])
+    param_names = ["prefer", "max_workers"]
+    timeout = 1800
+
+    def setup(self, prefer, max_workers):
+        self.data = _gamma_data(100_000)
+
+    def time_fit(self, prefer, max_workers):
+        Fitter(self.data, distributions=get_common_distributions(), verbose=False).fit(prefer=prefer, max_workers=max_workers)
+
+
+class HistFitNfit:
+    """HistFit.fit for increasing numbers of Monte Carlo iterations."""
+
+    params = [10, 100, 1000]
+    param_names = ["Nfit"]
+
+    def setup(self, Nfit):
+        self.data = stats.norm.rvs(2, 3.4, size=10_000, random_state=np.random.default_rng(0))
+
+    def time_fit(self, Nfit):
+        HistFit(self.data, bins=30).fit(error_rate=0.03, Nfit=Nfit)
+
+    def time_fit_headless(self, Nfit):
+        HistFit(self.data, bins=30).fit(error_rate=0.03, Nfit=Nfit, plot=False)
+
+
+class Import:
+    """Import time of the package, in a fresh interpreter."""
+
+    def timeraw_import_fitter(self):
+        return "import fitter"
@@ -1,7 +1,6 @@
-from importlib import metadata
-
-
 def get_package_version(package_name):
+    from importlib import metadata
+
     try:
         version = metadata.version(package_name)
         return version
@@ -9,8 +8,57 @@ def get_package_version(package_name):
         return f"{package_name} not found"
 
 
-version = get_package_version("fitter")
+# public objects and the submodule defining them, imported on first access so
+# that "import fitter" does not load scipy, pandas or matplotlib
+_LAZY_ATTRIBUTES = {
+    "BatchFitter": "batch",
+    "FitCache": "cache",
+    "Fitter": "fitter",
+    "get_common_distributions": "catalog",
+    "get_distributions": "catalog",
+    "HistFit": "histfit",
+    "FitPool": "pool",
+    "SharedArray": "pool",
+}
+
+# submodules, also imported on first access (e.g. fitter.fitter.Fitter)
+_SUBMODULES = (
+    "batch",
+    "binned",
+    "cache",
+    "catalog",
+    "estimators",
+    "fitter",
+    "guesses",
+    "histfit",
+    "io",
+    "main",
+    "pool",
+    "profiling",
+    "results",
+    "streaming",
+    "weighted",
+)
+
+__all__ = ["version", *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name):
+    if name == "version":
+        globals()["version"] = get_package_version("fitter")
+        return globals()["version"]
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        value = getattr(importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        import importlib
+
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-from .fitter import Fitter, get_common_distributions, get_distributions
-from .histfit import HistFit
+def __dir__():
+    return sorted({*globals(), *__all__, *_SUBMODULES})
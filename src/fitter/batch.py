@@ -0,0 +1,327 @@
+"""Fit the same distributions to many independent samples.
+
+Fitting a list of distributions to thousands of small samples with one
+:class:`~fitter.Fitter` per sample is dominated by per-sample overheads (histogram,
+worker pool, DataFrame). :class:`BatchFitter` handles all the samples at once:
+
+- all samples are concatenated once; histograms, log-likelihoods and
+  Kolmogorov-Smirnov statistics are computed for all samples together with
+  vectorized segment reductions,
+- distributions with closed-form estimators (norm, expon, uniform) are fitted to
+  all samples at once,
+- the other fits are scheduled in chunks of samples over a single
+  :class:`~fitter.pool.FitPool`.
+
+The results are gathered in a single long-format DataFrame.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import scipy.stats
+from loguru import logger
+from scipy.stats import entropy as kl_div
+
+from .catalog import get_common_distributions, get_distributions
+from .estimators import get_estimator
+from .fitter import _quiet_warnings
+from .pool import FitPool
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = ["BatchFitter"]
+
+
+def _batch_norm(values: np.ndarray, offsets: np.ndarray, lengths: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    means = np.add.reduceat(values, offsets) / lengths
+    stds = np.sqrt(np.add.reduceat((values - means[ids]) ** 2, offsets) / lengths)
+    return np.column_stack([means, stds])
+
+
+def _batch_expon(values: np.ndarray, offsets: np.ndarray, lengths: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    # values are sorted within each sample: the first one is the minimum
+    mins = values[offsets]
+    return np.column_stack([mins, np.add.reduceat(values, offsets) / lengths - mins])
+
+
+def _batch_uniform(values: np.ndarray, offsets: np.ndarray, lengths: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    mins = values[offsets]
+    return np.column_stack([mins, values[offsets + lengths - 1] - mins])
+
+
+#: estimators computing the parameters of all samples at once
+_BATCH_ESTIMATORS: dict[str, Callable[..., np.ndarray]] = {
+    "norm": _batch_norm,
+    "expon": _batch_expon,
+    "uniform": _batch_uniform,
+}
+
+
+def _fit_chunk(distribution: str, samples: list[np.ndarray]) -> list[tuple | None]:
+    """Fit one distribution to each sample of a chunk (run in a worker)."""
+    dist = getattr(scipy.stats, distribution)
+    estimator = get_estimator(distribution)
+    params = []
+    # numerical warnings are silenced as in the fits of Fitter (see _quiet_warnings)
+    with _quiet_warnings():
+        for data in samples:
+            try:
+                param = estimator(data) if estimator is not None else None
+                params.append(param if param is not None else dist.fit(data))
+            except Exception:
+                params.append(None)
+    return params
+
+
+class BatchFitter:
+    """Fit the same distributions to many independent samples
+
+    ::
+
+        >>> from scipy import stats
+        >>> from fitter import BatchFitter
+        >>> samples = {f"sensor{i}": stats.norm.rvs(size=200) for i in range(1000)}
+        >>> bf = BatchFitter(samples, distributions="common")
+        >>> bf.fit()
+        >>> bf.df_errors.head()
+             sample distribution  status  sumsquare_error  ...
+        0   sensor0       cauchy success         0.031853  ...
+        >>> bf.get_best(method="aic")
+
+    Each sample gets its own histogram with :attr:`bins` bins over its own range,
+    exactly as :class:`~fitter.Fitter` would do. The results are stored in
+    :attr:`df_errors` (one row per sample and distribution, with the same metrics
+    as :attr:`fitter.Fitter.df_errors`) and :attr:`fitted_param` (indexed by
+    ``(sample, distribution)``).
+    """
+
+    def __init__(
+        self,
+        samples: Mapping[Any, Sequence[float]] | Sequence[Sequence[float]],
+        distributions: list[str] | str | None = "common",
+        bins: int = 100,
+        timeout: int = 30,
+        verbose: bool = False,
+    ) -> None:
+        """.. rubric:: Constructor
+
+        :param samples: a mapping from sample names to data or a sequence of data
+            (samples are then named by their position). Samples may have
+            different lengths.
+        :param list distributions: distributions to fit, as in :class:`~fitter.Fitter`
+            (None for all, 'common', a name or a list of names).
+        :param int bins: numbers of bins of the histogram of each sample.
+        :param timeout: max time for fitting a distribution to one sample. Fits are
+            run by chunks of samples, each chunk being given a time budget of
+            *timeout* per sample; if it is exceeded, the fits of the whole chunk are
+            reported with the "timeout" status.
+        :param bool verbose: if True, log fitting progress messages.
+        """
+        if isinstance(samples, Mapping):
+            self.names: list[Any] = list(samples)
+            arrays = [np.asarray(samples[name], dtype=float).ravel() for name in self.names]
+        else:
+            self.names = list(range(len(samples)))
+            arrays = [np.asarray(sample, dtype=float).ravel() for sample in samples]
+
+        if distributions is None:
+            self.distributions: list[str] = get_distributions()
+        elif distributions == "common":
+            self.distributions = get_common_distributions()
+        elif isinstance(distributions, str):
+            self.distributions = [distributions]
+        else:
+            self.distributions = list(distributions)
+
+        self.bins = bins
+        self.timeout = timeout
+        self.verbose = verbose
+
+        # concatenate all samples, sorted within each sample
+        self._lengths = np.array([len(array) for array in arrays], dtype=np.intp)
+        self._offsets = np.concatenate([[0], np.cumsum(self._lengths)[:-1]]).astype(np.intp)
+        self._ids = np.repeat(np.arange(len(arrays)), self._lengths)
+        values = np.concatenate(arrays) if arrays else np.empty(0)
+        self._values = values[np.lexsort((values, self._ids))]
+        self._update_data_pdf()
+
+    def _update_data_pdf(self) -> None:
+        """Compute the histograms of all samples at once (one row per sample)."""
+        lengths, offsets, bins = self._lengths, self._offsets, self.bins
+        # samples with less than 2 distinct values cannot be fitted
+        self._valid = lengths >= 2
+        mins = np.where(self._valid, self._values[np.minimum(offsets, len(self._values) - 1)], 0.0)
+        maxs = np.where(self._valid, self._values[np.minimum(offsets + lengths - 1, len(self._values) - 1)], 1.0)
+        self._valid &= maxs > mins
+        widths = np.where(self._valid, (maxs - mins) / bins, 1.0)
+
+        index = ((self._values - mins[self._ids]) / widths[self._ids]).astype(np.intp)
+        index = np.clip(index, 0, bins - 1)
+        counts = np.bincount(self._ids * bins + index, minlength=len(lengths) * bins).reshape(len(lengths), bins)
+        #: bin centers (one row per sample)
+        self.x: np.ndarray = mins[:, None] + (np.arange(bins) + 0.5) * widths[:, None]
+        #: histogram densities (one row per sample)
+        self.y: np.ndarray = counts / (np.maximum(lengths, 1)[:, None] * widths[:, None])
+
+    def _fit_params(self, distribution: str, pool: FitPool, chunksize: int) -> tuple[np.ndarray, np.ndarray]:
+        """Fit one distribution to all valid samples.
+
+        Returns:
+            The parameters (one row per sample, NaN if the fit failed) and the
+            status of each fit.
+
+        """
+        dist = getattr(scipy.stats, distribution)
+        n_params = dist.numargs + 2
+        n_samples = len(self._lengths)
+        params = np.full((n_samples, n_params), np.nan)
+        status = np.where(self._valid, "success", "failed").astype(object)
+        valid = np.flatnonzero(self._valid)
+        if not len(valid):
+            return params, status
+
+        if distribution in _BATCH_ESTIMATORS:
+            # empty samples have no value: work on the non-empty ones
+            nonempty = self._lengths > 0
+            ids = (np.cumsum(nonempty) - 1)[self._ids]
+            estimator = _BATCH_ESTIMATORS[distribution]
+            params[nonempty] = estimator(self._values, self._offsets[nonempty], self._lengths[nonempty], ids)
+            params[~self._valid] = np.nan
+            return params, status
+
+        chunks = [valid[i : i + chunksize] for i in range(0, len(valid), chunksize)]
+        tasks = (
+            (distribution, [self._values[self._offsets[j] : self._offsets[j] + self._lengths[j]] for j in chunk])
+            for chunk in chunks
+        )
+        for index, chunk_status, result in pool.imap_unordered(_fit_chunk, tasks, timeout=self.timeout * chunksize):
+            chunk = chunks[index]
+            if chunk_status != "success":
+                status[chunk] = chunk_status
+                continue
+            for j, param in zip(chunk, result):
+                if param is None:
+                    status[j] = "failed"
+                else:
+                    params[j] = param
+        return params, status
+
+    def _metrics(self, distribution: str, params: np.ndarray) -> np.ndarray:
+        """Compute the goodness-of-fit metrics of all samples at once.
+
+        Returns:
+            Array with one row per sample and the columns sumsquare_error, aic, bic,
+            kl_div, ks_statistic and ks_pvalue.
+
+        """
+        dist = getattr(scipy.stats, distribution)
+        k = params.shape[1]
+        ids, lengths, offsets = self._ids, self._lengths, self._offsets
+        # metrics of failed fits (NaN parameters) are overwritten below
+        failed = np.isnan(params).any(axis=1)
+        columns = [params[:, j] for j in range(k)]
+
+        # runs in the caller's thread: no change of the (global) warnings filters
+        with _quiet_warnings():
+            pdf = dist.pdf(self.x, *(col[:, None] for col in columns))
+            sq_error = np.sum((pdf - self.y) ** 2, axis=1)
+            eps = 1e-10
+            kullback_leibler = kl_div(pdf + eps, self.y + eps, axis=1)
+
+            # same sanity check as Fitter: CDF must be within [0, 1]
+            cdf_x = dist.cdf(self.x, *(col[:, None] for col in columns))
+            failed |= np.any((cdf_x > 1) | (cdf_x < 0), axis=1)
+
+            nonempty = lengths > 0
+            logpdf = dist.logpdf(self._values, *(col[ids] for col in columns))
+            loglik = np.full(len(lengths), -np.inf)
+            loglik[nonempty] = np.add.reduceat(logpdf, offsets[nonempty]) if len(logpdf) else 0.0
+            aic = 2 * k - 2 * loglik
+            bic = k * np.log(np.maximum(lengths, 1)) - 2 * loglik
+
+            # Kolmogorov-Smirnov statistic on the sorted samples
+            cdf = dist.cdf(self._values, *(col[ids] for col in columns))
+            rank = np.arange(len(self._values)) - offsets[ids]
+            n = lengths[ids]
+            distance = np.maximum((rank + 1) / n - cdf, cdf - rank / n)
+            ks_stat = np.full(len(lengths), np.inf)
+            ks_stat[nonempty] = np.maximum.reduceat(distance, offsets[nonempty]) if len(distance) else np.inf
+            ks_pval = scipy.stats.kstwo.sf(ks_stat, np.maximum(lengths, 1))
+
+        metrics = np.column_stack([sq_error, aic, bic, kullback_leibler, ks_stat, ks_pval])
+        failed |= ~np.isfinite(metrics[:, :5]).all(axis=1)
+        metrics[failed] = (np.inf, np.inf, np.inf, np.inf, np.inf, 0.0)
+        return metrics
+
+    def fit(self, max_workers: int = -1, pool: FitPool | None = None, chunksize: int = 64) -> None:
+        """Fit all distributions to all samples.
+
+        Populates :attr:`df_errors` and :attr:`fitted_param`.
+
+        Args:
+            max_workers: Number of worker processes (-1 for all CPUs), if no *pool* is given.
+            pool: A :class:`~fitter.pool.FitPool` to run the fits in. If None, a
+                temporary pool is used.
+            chunksize: Number of samples fitted per task.
+
+        """
+        import pandas as pd
+
+        own_pool = pool is None
+        pool = FitPool(max_workers=max_workers) if own_pool else pool
+        frames = []
+        #: fitted parameters indexed by (sample, distribution)
+        self.fitted_param: dict[tuple[Any, str], tuple] = {}
+        try:
+            for distribution in self.distributions:
+                try:
+                    params, status = self._fit_params(distribution, pool, chunksize)
+                    metrics = self._metrics(distribution, params)
+                except Exception as err:  # pragma: no cover
+                    if self.verbose:
+                        logger.warning(f"SKIPPED {distribution}: {type(err).__name__}")
+                    params = np.full((len(self.names), 1), np.nan)
+                    status = np.full(len(self.names), "failed", dtype=object)
+                    metrics = np.tile((np.inf, np.inf, np.inf, np.inf, np.inf, 0.0), (len(self.names), 1))
+                status[(status == "success") & np.isinf(metrics[:, 0])] = "failed"
+                for j in np.flatnonzero(status == "success"):
+                    self.fitted_param[(self.names[j], distribution)] = tuple(params[j])
+                frame = pd.DataFrame(
+                    metrics, columns=["sumsquare_error", "aic", "bic", "kl_div", "ks_statistic", "ks_pvalue"]
+                )
+                frame.insert(0, "status", status)
+                frame.insert(0, "distribution", distribution)
+                frame.insert(0, "sample", self.names)
+                frames.append(frame)
+                if self.verbose:
+                    logger.info(f"Fitted {distribution} to {int((status == 'success').sum())} samples")
+        finally:
+            if own_pool:
+                pool.close()
+
+        #: long-format results: one row per sample and distribution
+        self.df_errors: pd.DataFrame = pd.concat(frames, ignore_index=True)
+
+    def get_best(self, method: str = "sumsquare_error") -> pd.DataFrame:
+        """Return the best distribution of each sample.
+
+        Args:
+            method: Metric to use for ranking ('sumsquare_error', 'aic', 'bic', etc.).
+
+        Returns:
+            DataFrame indexed by sample with the best distribution, its parameters and
+            the value of *method*.
+
+        """
+        import pandas as pd
+
+        best = self.df_errors.loc[self.df_errors.groupby("sample", sort=False)[method].idxmin()]
+        params = [self.fitted_param.get((name, dist)) for name, dist in zip(best["sample"], best["distribution"])]
+        return pd.DataFrame(
+            {"distribution": best["distribution"].values, "params": params, method: best[method].values},
+            index=pd.Index(best["sample"].values, name="sample"),
+        )
@@ -0,0 +1,160 @@
+"""Fits on pre-binned data.
+
+When only a histogram of the data is available (bin edges and counts), the
+distributions are fitted by maximizing the multinomial likelihood of the counts,
+whose bin probabilities are differences of the CDF at the bin edges::
+
+    log L = sum_i counts_i * log(F(edges_{i+1}) - F(edges_i))
+
+The cost of a fit then depends on the number of bins, not on the number of
+values. :class:`BinnedData` holds the histogram with a small representative
+sample drawn from it (see :func:`histogram_sample`), used for the starting
+points of the optimizer. See :meth:`fitter.Fitter.from_histogram`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+__all__ = ["BinnedData", "binned_loglikelihood", "binned_ks_statistic", "fit_binned", "histogram_sample"]
+
+
+def histogram_sample(edges: np.ndarray, counts: np.ndarray, size: int) -> np.ndarray:
+    """Return *size* sorted points following the distribution of a histogram.
+
+    The points are the quantiles at probabilities ``(i + 0.5) / size`` of the
+    distribution with uniform density within each bin (no randomness).
+
+    Args:
+        edges: Bin edges (increasing), of length m + 1.
+        counts: Counts of the m bins.
+        size: Number of points.
+
+    Returns:
+        Sorted array of *size* points.
+
+    """
+    cumulative = np.concatenate([[0.0], np.cumsum(counts, dtype=float)])
+    return np.interp((np.arange(size) + 0.5) / size * cumulative[-1], cumulative, edges)
+
+
+def binned_loglikelihood(dist: Any, param: tuple, lower: np.ndarray, upper: np.ndarray, counts: np.ndarray) -> float:
+    """Multinomial log-likelihood of the counts of bins [*lower*, *upper*] under ``dist(*param)``.
+
+    Returns -inf if a bin with a positive count has a null (or undefined) probability.
+    """
+    with np.errstate(all="ignore"):
+        cdf_lower, cdf_upper = dist.cdf(lower, *param), dist.cdf(upper, *param)
+        # differences of the survival function are more accurate in the right tail
+        probabilities = np.where(
+            cdf_lower > 0.5, dist.sf(lower, *param) - dist.sf(upper, *param), cdf_upper - cdf_lower
+        )
+    observed = counts > 0
+    probabilities = probabilities[observed]
+    if not np.all(probabilities > 0):
+        return -np.inf
+    return float(np.sum(counts[observed] * np.log(probabilities)))
+
+
+def binned_ks_statistic(cdf: np.ndarray, counts: np.ndarray) -> float:
+    """Kolmogorov-Smirnov statistic of a histogram, computed at the bin edges.
+
+    Args:
+        cdf: Fitted CDF at the m + 1 edges of contiguous bins.
+        counts: Counts of the m bins.
+
+    Returns:
+        The largest difference between the fitted and the empirical CDF at the
+        edges, which is a lower bound of the statistic of the raw data.
+
+    """
+    empirical = np.concatenate([[0.0], np.cumsum(counts, dtype=float)])
+    return float(np.max(np.abs(cdf - empirical / empirical[-1])))
+
+
+def fit_binned(
+    dist: Any,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    counts: np.ndarray,
+    start: tuple,
+    optimizer: Callable | None = None,
+) -> tuple:
+    """Maximize the multinomial likelihood of the counts (see :func:`binned_loglikelihood`).
+
+    Args:
+        dist: A scipy.stats distribution.
+        lower: Lower edges of the bins.
+        upper: Upper edges of the bins.
+        counts: Counts of the bins.
+        start: Starting parameters (shapes, loc, scale).
+        optimizer: Function ``optimizer(func, x0)`` returning the minimum of *func*
+            (:func:`scipy.optimize.fmin` by default, as scipy's ``fit``).
+
+    Returns:
+        The fitted parameters.
+
+    """
+    if optimizer is None:
+        from scipy.optimize import fmin
+
+        def optimizer(func, x0):
+            return fmin(func, x0, disp=0)
+
+    def negative_loglikelihood(param: np.ndarray) -> float:
+        return -binned_loglikelihood(dist, tuple(param), lower, upper, counts)
+
+    return tuple(float(value) for value in optimizer(negative_loglikelihood, np.asarray(start, dtype=float)))
+
+
+class BinnedData:
+    """Histogram (bin edges and counts) used as data by :class:`~fitter.Fitter`
+
+    ::
+
+        >>> binned = BinnedData([0, 1, 2, 3], [10, 25, 5])
+        >>> binned.n, binned.min, binned.max
+        (40, 0.0, 3.0)
+    """
+
+    def __init__(self, edges: np.ndarray | list[float], counts: np.ndarray | list[float], sample_size: int = 10_000) -> None:
+        """.. rubric:: Constructor
+
+        :param edges: increasing bin edges (one more than counts).
+        :param counts: non-negative counts (or weights) of the bins.
+        :param int sample_size: size of the representative sample (see :func:`histogram_sample`).
+        :raises ValueError: if the histogram is invalid or empty.
+        """
+        edges = np.asarray(edges, dtype=float)
+        counts = np.asarray(counts, dtype=float)
+        if edges.ndim != 1 or counts.ndim != 1 or len(edges) != len(counts) + 1:
+            raise ValueError("edges must be a 1-D array with one more value than counts")
+        if not np.all(np.diff(edges) > 0):
+            raise ValueError("edges must be strictly increasing")
+        if np.any(counts < 0) or not counts.sum() > 0:
+            raise ValueError("counts must be non-negative with a positive sum")
+        #: bin edges
+        self.edges: np.ndarray = edges
+        #: bin counts
+        self.counts: np.ndarray = counts
+        #: representative sorted sample of the histogram
+        self.sample: np.ndarray = histogram_sample(edges, counts, sample_size)
+
+    @property
+    def n(self) -> float:
+        """Total count."""
+        total = self.counts.sum()
+        return int(total) if float(total).is_integer() else float(total)
+
+    @property
+    def min(self) -> float:
+        """Lower edge of the first non-empty bin."""
+        return float(self.edges[np.flatnonzero(self.counts)[0]])
+
+    @property
+    def max(self) -> float:
+        """Upper edge of the last non-empty bin."""
+        return float(self.edges[np.flatnonzero(self.counts)[-1] + 1])
@@ -0,0 +1,138 @@
+"""On-disk cache of fitting results.
+
+Refitting the same data with the same distributions gives the same results. With a
+:class:`FitCache`, :meth:`fitter.Fitter.fit` stores the fitted parameters and metrics
+of each distribution on disk and only fits the distributions that are missing::
+
+    from fitter import FitCache, Fitter
+
+    cache = FitCache()  # ~/.cache/fitter/fits by default
+    f = Fitter(data, distributions="common")
+    f.fit(cache=cache)  # slow the first time, fast afterwards
+
+Entries are keyed by a fingerprint of the data and histogram (which depends on
+``bins``, ``xmin`` and ``xmax``), the scipy and fitter versions and the
+distribution name. They are small JSON files; the least recently used ones are
+removed when the cache grows above its maximum size. Only deterministic outcomes
+are stored: transient failures (timeouts, crashed workers...) are fitted again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import scipy
+
+__all__ = ["FitCache", "default_cache_directory"]
+
+
+def default_cache_directory() -> Path:
+    """Return the ``fitter`` directory in the user cache directory (``$XDG_CACHE_HOME`` or ``~/.cache``)."""
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "fitter"
+
+
+class FitCache:
+    """Directory of cached fitting results with size-based LRU eviction"""
+
+    def __init__(self, directory: str | os.PathLike | None = None, max_size: int = 100_000_000) -> None:
+        """.. rubric:: Constructor
+
+        :param directory: where to store the cache. Defaults to ``fits`` in
+            :func:`default_cache_directory`.
+        :param int max_size: maximum size of the cache in bytes.
+        """
+        self.directory = Path(default_cache_directory() / "fits" if directory is None else directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        # size of the entries (bytes), updated by set; None until the directory is scanned
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(data: np.ndarray, x: np.ndarray, y: np.ndarray, options: str = "") -> str:
+        """Return a hash of the data, the histogram, the library versions and fitting *options*."""
+        from fitter import version
+
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{scipy.__version__}/{version}/{options}".encode())
+        for array in (data, x, y):
+            array = np.ascontiguousarray(array, dtype=float)
+            digest.update(str(array.shape).encode())
+            digest.update(array.view(np.uint8))
+        return digest.hexdigest()
+
+    def _path(self, fingerprint: str, distribution: str) -> Path:
+        return self.directory / f"{fingerprint}-{distribution}.json"
+
+    def get(self, fingerprint: str, distribution: str) -> tuple[tuple | None, tuple, str] | None:
+        """Return the cached (param, metrics, status) of a fit, or None if not cached."""
+        path = self._path(fingerprint, distribution)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        # mark as recently used (unless another process evicted it meanwhile)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        param = tuple(entry["param"]) if entry["param"] is not None else None
+        return param, tuple(entry["metrics"]), entry["status"]
+
+    def set(self, fingerprint: str, distribution: str, param: tuple | None, metrics: tuple, status: str) -> None:
+        """Store the results of a fit."""
+        entry = {
+            "param": None if param is None else [float(value) for value in param],
+            "metrics": [float(value) for value in metrics],
+            "status": status,
+        }
+        text = json.dumps(entry)
+        path = self._path(fingerprint, distribution)
+        try:
+            previous = path.stat().st_size
+        except OSError:
+            previous = 0
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(text)
+        # atomic, in case several processes or threads share the cache
+        tmp.replace(path)
+        with self._lock:
+            if self._size is not None:
+                self._size += len(text) - previous
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in :attr:`max_size`.
+
+        The directory is only scanned the first time and when the size of the
+        entries written since (by this instance) exceeds :attr:`max_size`.
+        """
+        with self._lock:
+            if self._size is not None and self._size <= self.max_size:
+                return
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:  # pragma: no cover
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        with self._lock:
+            self._size = total
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._size = 0
@@ -0,0 +1,280 @@
+"""Catalog of the scipy.stats distributions.
+
+Looking up the distributions of :mod:`scipy.stats` requires importing it and
+scanning its namespace, which is slow and picks up objects that are not
+distributions. The catalog lists the distributions once per scipy version, with
+metadata useful to choose the candidates of a fit::
+
+    >>> from fitter.catalog import get_catalog
+    >>> info = get_catalog()["gamma"]
+    >>> info.params, info.support, info.fit_cost
+    (('a', 'loc', 'scale'), (0.0, inf), 'low')
+
+The catalog is built in memory once per process. :func:`save_catalog` saves it
+in the user cache directory (see :func:`fitter.cache.default_cache_directory`),
+in a file named after the scipy version and :data:`CATALOG_VERSION`, so that
+later processes do not need to import scipy.stats to list the distributions.
+Nothing is written unless it is called.
+
+:func:`filter_candidates` and :func:`cover_data` use the catalog to discard the
+distributions that cannot be fitted to some data and to fix starting points
+before any fit is run.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+from dataclasses import asdict, dataclass
+from importlib import metadata
+from pathlib import Path
+
+import numpy as np
+
+from .cache import default_cache_directory
+
+__all__ = [
+    "CATALOG_VERSION",
+    "DistributionInfo",
+    "cover_data",
+    "filter_candidates",
+    "get_catalog",
+    "get_common_distributions",
+    "get_distributions",
+    "save_catalog",
+]
+
+#: version of the catalog format, to be increased when the metadata change
+CATALOG_VERSION = 1
+
+# distributions whose fit is usually very slow (densities computed by numerical
+# integration or series expansions), based on the benchmarks
+_SLOW = frozenset(
+    {
+        "gausshyper",
+        "genhyperbolic",
+        "geninvgauss",
+        "kappa4",
+        "ksone",
+        "kstwo",
+        "levy_stable",
+        "ncf",
+        "nct",
+        "ncx2",
+        "norminvgauss",
+        "studentized_range",
+        "vonmises",
+    }
+)
+
+# distributions whose fits often fail or return invalid results (e.g. CDF
+# outside [0, 1]) because of numerical issues
+_UNSTABLE = frozenset({"geninvgauss", "kappa4", "ksone", "kstwo", "levy_stable", "studentized_range", "tukeylambda"})
+
+
+@dataclass(frozen=True)
+class DistributionInfo:
+    """Metadata of a scipy.stats distribution"""
+
+    #: name in scipy.stats
+    name: str
+    #: names of the parameters, in the order of the fitted parameters
+    params: tuple[str, ...]
+    #: support of the standardized distribution (loc=0, scale=1)
+    support: tuple[float, float]
+    #: True if the support also depends on the shape parameters
+    shape_dependent_support: bool
+    #: True for discrete distributions (which cannot be fitted)
+    discrete: bool
+    #: True if the fit is known to often fail or be numerically unreliable
+    unstable: bool
+
+    @property
+    def fit_cost(self) -> str:
+        """Typical cost of a fit: "low" (closed-form estimator, see
+        :mod:`fitter.estimators`), "high" (known to be slow) or "medium".
+        """
+        from .estimators import ESTIMATORS
+
+        if self.name in ESTIMATORS:
+            return "low"
+        return "high" if self.name in _SLOW else "medium"
+
+
+def _scan_scipy() -> list[DistributionInfo]:
+    """List the distributions of scipy.stats."""
+    import scipy.stats
+
+    catalog = []
+    for name in dir(scipy.stats):
+        dist = getattr(scipy.stats, name)
+        if not isinstance(dist, (scipy.stats.rv_continuous, scipy.stats.rv_discrete)):
+            continue
+        discrete = isinstance(dist, scipy.stats.rv_discrete)
+        shapes = tuple(shape.strip() for shape in dist.shapes.split(",")) if dist.shapes else ()
+        base = scipy.stats.rv_discrete if discrete else scipy.stats.rv_continuous
+        catalog.append(
+            DistributionInfo(
+                name=name,
+                params=(*shapes, "loc") if discrete else (*shapes, "loc", "scale"),
+                support=(float(dist.a), float(dist.b)),
+                shape_dependent_support=type(dist)._get_support is not base._get_support,
+                discrete=discrete,
+                unstable=name in _UNSTABLE,
+            )
+        )
+    return catalog
+
+
+def _catalog_path() -> Path:
+    """File of the saved catalog of the installed scipy version."""
+    return default_cache_directory() / f"catalog-scipy{metadata.version('scipy')}-v{CATALOG_VERSION}.json"
+
+
+@functools.lru_cache(maxsize=None)
+def get_catalog() -> dict[str, DistributionInfo]:
+    """Return the catalog of scipy.stats distributions, indexed by name.
+
+    The catalog is read from the user cache directory if it was saved for the
+    installed scipy version (see :func:`save_catalog`), and built in memory
+    otherwise.
+    """
+    try:
+        entries = json.loads(_catalog_path().read_text())
+        catalog = [
+            DistributionInfo(**{**entry, "params": tuple(entry["params"]), "support": tuple(entry["support"])})
+            for entry in entries
+        ]
+    except (OSError, ValueError, TypeError, KeyError):
+        catalog = _scan_scipy()
+    return {info.name: info for info in catalog}
+
+
+def save_catalog() -> Path:
+    """Save the catalog in the user cache directory, so that later processes read it.
+
+    Returns:
+        The path of the saved file.
+
+    """
+    path = _catalog_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps([asdict(info) for info in get_catalog().values()]))
+    return path
+
+
+def get_distributions() -> list[str]:
+    """Get all scipy.stats distributions that have a fit method.
+
+    Returns:
+        List of distribution names as strings (continuous distributions of the catalog).
+
+    """
+    return [name for name, info in get_catalog().items() if not info.discrete]
+
+
+def get_common_distributions() -> list[str]:
+    """Get commonly used distributions that are available in scipy.stats.
+
+    Returns:
+        List of common distribution names that have fit methods.
+
+    Note:
+        Filters based on scipy version to avoid errors with missing distributions.
+
+    """
+    distributions = get_distributions()
+    # Convert to set for O(1) lookup (much faster than list membership)
+    dist_set = set(distributions)
+    # Common distributions to avoid error due to changes in scipy
+    common = [
+        "cauchy",
+        "chi2",
+        "expon",
+        "exponpow",
+        "gamma",
+        "lognorm",
+        "norm",
+        "powerlaw",
+        "rayleigh",
+        "uniform",
+    ]
+    # Single-pass filter with set lookup (O(n) instead of O(n²))
+    return [x for x in common if x in dist_set]
+
+
+def filter_candidates(distributions: list[str], data: np.ndarray) -> tuple[list[str], dict[str, str]]:
+    """Drop the distributions that cannot be fitted to *data* before any fit is run.
+
+    Since the fits estimate the location and scale, a distribution can be
+    shifted and stretched over any data and its support alone never rules it
+    out (see :func:`cover_data` for the starting points, which are not
+    estimated). The distributions dropped are:
+
+    - names that are not continuous distributions of scipy.stats,
+    - distributions with more parameters than distinct values in the data,
+    - all distributions if the data are constant.
+
+    Args:
+        distributions: Names of the candidate distributions.
+        data: Sorted data.
+
+    Returns:
+        Tuple (kept distributions, {skipped distribution: reason}).
+
+    """
+    catalog = get_catalog()
+    n_distinct = 1 + int(np.count_nonzero(np.diff(data))) if len(data) else 0
+    kept, skipped = [], {}
+    for name in distributions:
+        info = catalog.get(name)
+        if n_distinct < 2:
+            skipped[name] = "constant data"
+        elif info is None:
+            skipped[name] = "not a scipy.stats distribution"
+        elif info.discrete:
+            skipped[name] = "discrete distribution"
+        elif len(info.params) > n_distinct:
+            skipped[name] = f"{len(info.params)} parameters for {n_distinct} distinct values"
+        else:
+            kept.append(name)
+    return kept, skipped
+
+
+def cover_data(distribution: str, start: tuple, data_min: float, data_max: float) -> tuple:
+    """Shift and stretch starting parameters so that the support covers the data.
+
+    The optimizer cannot start from parameters under which some data points are
+    impossible (the likelihood is null). The location and scale of *start* are
+    changed, if needed, so that the support of the distribution contains
+    [*data_min*, *data_max*] with a small margin; shape parameters are unchanged.
+
+    Args:
+        distribution: Name of the scipy.stats distribution.
+        start: Starting parameters (shapes, loc, scale).
+        data_min: Data minimum.
+        data_max: Data maximum.
+
+    Returns:
+        The new starting parameters.
+
+    """
+    import scipy.stats
+
+    *shapes, loc, scale = start
+    lower, upper = getattr(scipy.stats, distribution).support(*start)
+    if not (scale > 0 and np.isfinite(lower) | np.isfinite(upper)):
+        return start
+    if lower <= data_min and data_max <= upper:
+        return start
+    # standardized bounds and margin
+    lower, upper = (lower - loc) / scale, (upper - loc) / scale
+    margin = 1e-3 * (data_max - data_min)
+    if np.isfinite(lower) and np.isfinite(upper):
+        scale = (data_max - data_min + 2 * margin) / (upper - lower)
+        loc = data_min - margin - lower * scale
+    elif np.isfinite(lower):
+        loc = min(loc, data_min - margin - lower * scale)
+    else:
+        loc = max(loc, data_max + margin - upper * scale)
+    return (*shapes, float(loc), float(scale))
@@ -0,0 +1,194 @@
+"""Fast maximum likelihood estimators for common distributions.
+
+:meth:`scipy.stats.rv_continuous.fit` is generic: for most distributions it runs a
+numerical optimizer over all the parameters, which is slow on large samples. For a
+few common distributions, the maximum likelihood estimates are known in closed form
+or reduce to a one-dimensional root finding problem on the location parameter.
+
+This module keeps a registry of such estimators. :class:`~fitter.Fitter` looks up
+the registry before falling back to the generic scipy fit::
+
+    >>> import numpy as np
+    >>> from fitter.estimators import get_estimator
+    >>> get_estimator("norm")(np.array([1.0, 2.0, 3.0]))
+    (2.0, 0.816496580927726)
+
+An estimator takes the data and returns the parameters in the order used by scipy
+(shapes, loc, scale), or None if it cannot handle the data, in which case the
+generic fit is used. New estimators can be added with :func:`register_estimator`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+from scipy.optimize import brentq
+from scipy.special import digamma, polygamma
+
+__all__ = ["ESTIMATORS", "get_estimator", "register_estimator"]
+
+#: registry of fast estimators, indexed by scipy distribution name
+ESTIMATORS: dict[str, Callable[[np.ndarray], tuple | None]] = {}
+
+
+def register_estimator(name: str) -> Callable:
+    """Decorator registering a fast estimator for the distribution *name*.
+
+    Args:
+        name: Name of the scipy.stats distribution.
+
+    Returns:
+        Decorator that stores the function in :data:`ESTIMATORS`.
+
+    """
+
+    def decorator(func: Callable[[np.ndarray], tuple | None]) -> Callable[[np.ndarray], tuple | None]:
+        ESTIMATORS[name] = func
+        return func
+
+    return decorator
+
+
+def get_estimator(name: str) -> Callable[[np.ndarray], tuple | None] | None:
+    """Return the fast estimator of the distribution *name* or None if there is none."""
+    return ESTIMATORS.get(name)
+
+
+def _find_root_left_of(func: Callable[[float], float], rbrack: float, step: float) -> float | None:
+    """Find a root of *func* on the left of *rbrack*.
+
+    The left end of the bracket is searched by doubling the distance to *rbrack*
+    (at most 64 times). Returns None if no sign change is found.
+    """
+    f_right = func(rbrack)
+    if not np.isfinite(f_right):
+        return None
+    for _ in range(64):
+        lbrack = rbrack - step
+        f_left = func(lbrack)
+        if not (np.isfinite(lbrack) and np.isfinite(f_left)):
+            return None
+        if np.sign(f_left) != np.sign(f_right):
+            return brentq(func, lbrack, rbrack)
+        step *= 2
+    return None
+
+
+@register_estimator("norm")
+def _fit_norm(data: np.ndarray) -> tuple:
+    return float(np.mean(data)), float(np.std(data))
+
+
+@register_estimator("expon")
+def _fit_expon(data: np.ndarray) -> tuple:
+    loc = float(np.min(data))
+    return loc, float(np.mean(data)) - loc
+
+
+@register_estimator("uniform")
+def _fit_uniform(data: np.ndarray) -> tuple:
+    loc = float(np.min(data))
+    return loc, float(np.max(data)) - loc
+
+
+@register_estimator("rayleigh")
+def _fit_rayleigh(data: np.ndarray) -> tuple | None:
+    # first order condition on loc once the scale is replaced by its MLE
+    # sqrt(sum((x - loc)**2) / 2n); see Evans, Hastings and Peacock (2000)
+    n = len(data)
+
+    def dlogl_dloc(loc: float) -> float:
+        shifted = data - loc
+        return shifted.sum() - (shifted**2).sum() / (2 * n) * (1 / shifted).sum()
+
+    data_min = float(np.min(data))
+    loc = _find_root_left_of(dlogl_dloc, np.nextafter(data_min, -np.inf), 1.0)
+    if loc is None:
+        return None
+    return loc, float(np.sqrt(np.sum((data - loc) ** 2) / (2 * n)))
+
+
+@register_estimator("lognorm")
+def _fit_lognorm(data: np.ndarray) -> tuple | None:
+    # first order condition on loc once shape and scale are replaced by their
+    # explicit MLE; see Cohen & Whitten (1980), equation 3.1
+    def shape_scale(loc: float) -> tuple[float, float, np.ndarray]:
+        logs = np.log(data - loc)
+        mu = logs.mean()
+        return np.sqrt(np.mean((logs - mu) ** 2)), mu, logs
+
+    def dlogl_dloc(loc: float) -> float:
+        shape, mu, logs = shape_scale(loc)
+        return np.sum((1 + (logs - mu) / shape**2) / (data - loc))
+
+    def logl(loc: float) -> float:
+        shape, _, logs = shape_scale(loc)
+        return -len(data) * np.log(shape) - logs.sum()
+
+    data_min = float(np.min(data))
+    spacing = abs(np.spacing(data_min))
+    rbrack = data_min - spacing
+    # move away from the minimum until the slope becomes negative
+    delta = 2 * spacing
+    while dlogl_dloc(rbrack) >= -1e-6:
+        rbrack = data_min - delta
+        delta *= 2
+        if not np.isfinite(rbrack):
+            return None
+    loc = _find_root_left_of(dlogl_dloc, rbrack, max(1.0, rbrack - np.nextafter(rbrack, -np.inf)))
+    if loc is None:
+        return None
+    # the likelihood may be larger next to the data minimum than at the root
+    if logl(data_min - spacing) > logl(loc):
+        loc = data_min - spacing
+    shape, mu, _ = shape_scale(loc)
+    if not (shape > 0 and np.isfinite(mu)):
+        return None
+    return float(shape), float(loc), float(np.exp(mu))
+
+
+def _gamma_shape(log_mean: float, mean_log: float) -> float:
+    """Solve log(a) - digamma(a) = log(mean(x)) - mean(log(x)) for the shape a."""
+    s = log_mean - mean_log
+    # initial approximation from Minka (2002), then Newton iterations
+    a = (3 - s + np.sqrt((s - 3) ** 2 + 24 * s)) / (12 * s)
+    for _ in range(10):
+        step = (np.log(a) - digamma(a) - s) / (1 / a - polygamma(1, a))
+        a -= step
+        if abs(step) < 1e-12 * a:
+            break
+    return a
+
+
+@register_estimator("gamma")
+def _fit_gamma(data: np.ndarray) -> tuple | None:
+    # profile likelihood: for a given loc, the shape solves a 1-D equation and
+    # the scale is mean(x - loc) / shape; loc then solves dlogL/dloc = 0
+    n = len(data)
+
+    def profile(loc: float) -> tuple[float, float, np.ndarray]:
+        shifted = data - loc
+        mean = shifted.mean()
+        return _gamma_shape(np.log(mean), np.log(shifted).mean()), mean, shifted
+
+    def dlogl_dloc(loc: float) -> float:
+        a, mean, shifted = profile(loc)
+        return n * a / mean - (a - 1) * (1 / shifted).sum()
+
+    data_min = float(np.min(data))
+    data_std = float(np.std(data))
+    if data_std == 0:
+        return None
+    rbrack = data_min - 1e-8 * data_std
+    # with a shape below 1 next to the data minimum, the likelihood is unbounded
+    # there: leave this case to the generic optimizer
+    if not profile(rbrack)[0] > 1:
+        return None
+    loc = _find_root_left_of(dlogl_dloc, rbrack, data_std)
+    if loc is None:
+        return None
+    a, mean, _ = profile(loc)
+    if not (np.isfinite(a) and a > 1):
+        return None
+    return float(a), float(loc), float(mean / a)
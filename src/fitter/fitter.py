@@ -23,99 +23,170 @@ to data samples and comparing their goodness of fit using various metrics.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import contextvars
+import functools
 import multiprocessing
-from typing import Any
+import os
+import sys
+import threading
+import warnings
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any
 
-import joblib
 import numpy as np
-import pandas as pd
+import scipy.optimize
 import scipy.stats
-from joblib.parallel import Parallel, delayed
 from loguru import logger
-from matplotlib import pyplot as plt
 from scipy.integrate import IntegrationWarning
 from scipy.stats import entropy as kl_div
-from scipy.stats import kstest
-from tqdm import tqdm
+
+from .binned import BinnedData, binned_ks_statistic, binned_loglikelihood, fit_binned, histogram_sample
+from .cache import FitCache
+from .catalog import cover_data, filter_candidates, get_common_distributions, get_distributions
+from .estimators import get_estimator
+from .guesses import DataSummary, guess_starts
+from .io import iter_chunks, read_column
+from .pool import FitPool
+from .profiling import StageTimer, timings_to_dataframe, write_chrome_trace
+from .results import METRICS, PDFView, ParamView, ResultTable, StatusView
+from .streaming import StreamSummary
+from .weighted import deduplicate as _deduplicate
+from .weighted import fit_weighted, weighted_ks_statistic, weighted_loglikelihood, weighted_sample
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# pandas, matplotlib, joblib and tqdm are imported when first needed, to keep
+# the import of fitter (and of the worker processes) fast
 
 __all__ = ["Fitter", "get_common_distributions", "get_distributions"]
 
 
-# A solution to wrap joblib parallel call in tqdm from
-# https://stackoverflow.com/questions/24983493/tracking-progress-of-joblib-parallel-execution/58936697#58936697
-# and https://github.com/louisabraham/tqdm_joblib
-@contextlib.contextmanager
-def tqdm_joblib(*args: Any, **kwargs: Any) -> Any:
-    """Context manager to patch joblib to report into tqdm progress bar.
+# racing mode (see Fitter.fit): default screening size, z-score of the confidence
+# bound on the log-likelihood, risk of the DKW bound on the KS statistic and
+# relative tolerance on the histogram-based metrics
+_RACE_SUBSAMPLE = 5000
+_RACE_Z = 3.0
+_RACE_ALPHA = 1e-3
+_RACE_RTOL = 0.5
 
-    Args:
-        *args: Positional arguments passed to tqdm.
-        **kwargs: Keyword arguments passed to tqdm.
+# size of the representative sample of weighted data (see Fitter._get_sorted_data)
+_WEIGHTED_SAMPLE_SIZE = 10_000
+
+
+# worker processes of joblib (loky) and FitPool, in which the warnings filters
+# can be changed without affecting the caller
+_WORKER_PROCESS_PREFIXES = ("LokyProcess", "FitPoolWorker")
+
+
+@functools.cache
+def _ignore_warnings_in_process() -> None:
+    warnings.filterwarnings("ignore", category=RuntimeWarning)
+    warnings.filterwarnings("ignore", category=IntegrationWarning)
 
-    Yields:
-        tqdm object for progress tracking.
 
+@contextlib.contextmanager
+def _quiet_warnings() -> Iterator[None]:
+    """Silence the numerical warnings of a fit without changing global state.
+
+    Floating point errors are ignored with :func:`numpy.errstate`, which is
+    local to the thread (and asyncio task). The warnings filters are global to
+    the process before Python 3.14 (and its context-aware warnings), so they are
+    only changed in worker processes; fits run in the caller's process or
+    threads leave them untouched and may emit warnings.
     """
-    tqdm_object = tqdm(*args, **kwargs)
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(np.errstate(all="ignore"))
+        if getattr(sys.flags, "context_aware_warnings", False):  # pragma: no cover
+            stack.enter_context(warnings.catch_warnings())
+            warnings.filterwarnings("ignore", category=RuntimeWarning)
+            warnings.filterwarnings("ignore", category=IntegrationWarning)
+        elif multiprocessing.current_process().name.startswith(_WORKER_PROCESS_PREFIXES):
+            _ignore_warnings_in_process()
+        yield
+
+
+class _NoProgress:
+    """Stand-in for a disabled tqdm progress bar (without importing tqdm)"""
+
+    def __enter__(self) -> _NoProgress:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+    def update(self, n: int = 1) -> None:
+        pass
+
 
-    class TqdmBatchCompletionCallback(joblib.parallel.BatchCompletionCallBack):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
+def _progress_bar(desc: str, total: int, progress: bool) -> Any:
+    """Return a tqdm progress bar, or a stand-in doing nothing if *progress* is False."""
+    if not progress:
+        return _NoProgress()
+    from tqdm import tqdm
 
-        def __call__(self, *args, **kwargs):
-            tqdm_object.update(n=self.batch_size)
-            return super().__call__(*args, **kwargs)
+    return tqdm(desc=desc, total=total)
 
-    old_batch_callback = joblib.parallel.BatchCompletionCallBack
-    joblib.parallel.BatchCompletionCallBack = TqdmBatchCompletionCallback
-    try:
-        yield tqdm_object
-    finally:
-        joblib.parallel.BatchCompletionCallBack = old_batch_callback
-        tqdm_object.close()
 
+def _stratified_subsample(data: np.ndarray, size: int) -> np.ndarray:
+    """Return a deterministic stratified subsample of the data.
 
-def get_distributions() -> list[str]:
-    """Get all scipy.stats distributions that have a fit method.
+    The sorted data is split into ``size`` strata holding the same number of
+    points and the median point of each stratum is kept, so that the subsample
+    follows the empirical quantile function of the full data.
+
+    Args:
+        data: Data array to subsample.
+        size: Number of points to keep.
 
     Returns:
-        List of distribution names as strings.
+        Sorted array of ``size`` points (or all the data if it is smaller).
 
     """
-    # BUGFIX: Replace eval() with getattr() - safer and faster
-    distributions = [name for name in dir(scipy.stats) if hasattr(getattr(scipy.stats, name, None), "fit")]
-    return distributions
+    n = len(data)
+    if size >= n:
+        return np.sort(data)
+    indices = ((np.arange(size) + 0.5) * n / size).astype(np.intp)
+    return np.partition(data, indices)[indices]
 
 
-def get_common_distributions() -> list[str]:
-    """Get commonly used distributions that are available in scipy.stats.
+def _kstest_sorted(data: np.ndarray, cdf: np.ndarray, method: str = "auto") -> tuple[float, float]:
+    """Two-sided Kolmogorov-Smirnov test of sorted data against a fitted CDF.
 
-    Returns:
-        List of common distribution names that have fit methods.
+    Equivalent to :func:`scipy.stats.kstest` but without sorting the data again,
+    for each distribution.
 
-    Note:
-        Filters based on scipy version to avoid errors with missing distributions.
+    Args:
+        data: Sorted data.
+        cdf: Values of the fitted CDF at *data*.
+        method: How to compute the p-value: "exact" (distribution of the statistic
+            for *n* points), "asymp" (Kolmogorov distribution, much faster for large
+            samples) or "auto" (exact up to 10000 points, as scipy).
+
+    Returns:
+        Tuple (statistic, p-value).
 
     """
-    distributions = get_distributions()
-    # Convert to set for O(1) lookup (much faster than list membership)
-    dist_set = set(distributions)
-    # Common distributions to avoid error due to changes in scipy
-    common = [
-        "cauchy",
-        "chi2",
-        "expon",
-        "exponpow",
-        "gamma",
-        "lognorm",
-        "norm",
-        "powerlaw",
-        "rayleigh",
-        "uniform",
-    ]
-    # Single-pass filter with set lookup (O(n) instead of O(n²))
-    return [x for x in common if x in dist_set]
+    n = len(data)
+    d_plus = np.max(np.arange(1, n + 1) / n - cdf)
+    d_minus = np.max(cdf - np.arange(n) / n)
+    statistic = float(max(d_plus, d_minus))
+    return statistic, _ks_pvalue(statistic, n, method)
+
+
+def _ks_pvalue(statistic: float, n: int, method: str = "auto") -> float:
+    """Return the p-value of a Kolmogorov-Smirnov statistic for *n* points (see :func:`_kstest_sorted`)."""
+    if method == "auto":
+        method = "exact" if n <= 10000 else "asymp"
+    if method == "exact":
+        pvalue = scipy.stats.kstwo.sf(statistic, n)
+    elif method == "asymp":
+        pvalue = scipy.stats.kstwobign.sf(statistic * np.sqrt(n))
+    else:
+        raise ValueError(f"ks_method must be 'auto', 'exact' or 'asymp', not {method!r}")
+    return float(np.clip(pvalue, 0, 1))
 
 
 class Fitter:
@@ -180,11 +251,22 @@ class Fitter:
     :attr:`bins` binning or to ignore data below or above a certain range. This can be achieved
     by setting the :attr:`xmin` and :attr:`xmax` attributes. If you set xmin, you can come back to
     the original data by setting xmin to None (same for xmax) or just recreate an instance.
+
+    Different instances can be fitted at the same time from several threads, or
+    from an asyncio event loop with :func:`asyncio.to_thread`, with any
+    ``prefer`` backend; a :class:`~fitter.pool.FitPool` can be shared by these
+    fits. The fits keep their state on the instance and do not change global
+    state: the numerical warnings are only silenced in the worker processes and
+    floating point errors with a thread-local :func:`numpy.errstate`. The same
+    instance must not be fitted (or modified) from several threads at once.
+
+    .. versionchanged:: 1.9.0
+        Concurrent fits of different instances are supported.
     """
 
     def __init__(
         self,
-        data: np.ndarray | list[float],
+        data: np.ndarray | list[float] | str | os.PathLike | StreamSummary | BinnedData,
         xmin: float | None = None,
         xmax: float | None = None,
         bins: int = 100,
@@ -192,10 +274,16 @@ class Fitter:
         timeout: int = 30,
         density: bool = True,
         verbose: bool = True,
+        weights: np.ndarray | list[float] | None = None,
+        deduplicate: bool | str = False,
     ) -> None:
         """.. rubric:: Constructor
 
-        :param list data: a numpy array or a list
+        :param list data: a numpy array or a list. May also be a file name (see
+            :func:`fitter.io.read_column`; ``.npy`` and raw binary files are
+            memory-mapped) or a raw buffer of float64 values. See also
+            :meth:`from_stream` for data that do not fit in memory and
+            :meth:`from_histogram` for pre-binned data.
         :param float xmin: if None, use the data minimum value, otherwise histogram and
             fits will be cut
         :param float xmax: if None, use the data maximum value, otherwise histogram and
@@ -212,12 +300,23 @@ class Fitter:
             reached, the distribution is skipped.
         :param bool verbose: if True (default), log fitting progress messages. Set to
             False to suppress all informational output.
-
+        :param weights: frequency of each value of *data* (e.g. the counts
+            returned by :func:`numpy.unique`). The repeated values are merged and
+            the fits, the likelihood (AIC, BIC) and the Kolmogorov-Smirnov test
+            run on the distinct values with their weights (see
+            :mod:`fitter.weighted`), with *n* the total weight.
+        :param deduplicate: if True, merge the repeated values of *data* into
+            weights (as if given with *weights*). If "auto", only when fewer than
+            half of the values are distinct. Heavily quantized data are then
+            fitted at the cost of their number of distinct values.
+
+        .. versionchanged:: 1.9.0 add the *weights* and *deduplicate* arguments.
         .. versionchanged:: 1.3.0 re-add verbose argument to allow suppressing log output.
         .. versionchanged:: 1.0.8 increase timeout from 10 to 30 seconds.
         """
         self.verbose = verbose
         self.timeout = timeout
+        self._ks_method = "auto"
         # USER input
         self._data = None
 
@@ -240,12 +339,57 @@ class Fitter:
         else:
             self.distributions = distributions
 
-        self.bins = bins
-
-        self._alldata: np.ndarray = np.asarray(data)
+        self._bins = bins
+
+        #: summary of the data when built from a stream (see :meth:`from_stream`)
+        self._stream: StreamSummary | None = None
+        #: histogram when the data are pre-binned (see :meth:`from_histogram`)
+        self._binned: BinnedData | None = None
+        #: weights of the distinct values of weighted data (see :mod:`fitter.weighted`)
+        self._weights: np.ndarray | None = None
+        if (weights is not None or deduplicate) and isinstance(data, (BinnedData, StreamSummary)):
+            raise ValueError("weights and deduplicate are not available for streamed or pre-binned data")
+        if isinstance(data, BinnedData):
+            # the fits use the counts; the representative sample only gives starting points
+            self._binned = data
+            self._alldata = data.sample
+            self._data_min = data.min
+            self._data_max = data.max
+        elif isinstance(data, StreamSummary):
+            # only a sample of the data is kept; the histogram comes from the summary
+            self._stream = data
+            self._alldata: np.ndarray = data.sample
+            self._data_min: float = data.min
+            self._data_max: float = data.max
+        else:
+            if isinstance(data, (str, os.PathLike)):
+                data = read_column(data)
+            elif isinstance(data, (bytes, bytearray, memoryview)):
+                data = np.frombuffer(data, dtype=float)
+            # 1-D view (e.g. of a column vector), so that the untrimmed data can be used as is
+            self._alldata = np.asarray(data).ravel()
+            if weights is not None:
+                weights = np.asarray(weights, dtype=float).ravel()
+                if weights.shape != self._alldata.shape:
+                    raise ValueError("weights must have the same shape as data")
+                if np.any(weights < 0) or not weights.sum() > 0:
+                    raise ValueError("weights must be non-negative with a positive sum")
+                self._alldata, self._weights = _deduplicate(self._alldata, weights)
+            elif deduplicate:
+                if deduplicate not in (True, "auto"):
+                    raise ValueError(f"deduplicate must be True, False or 'auto', not {deduplicate!r}")
+                values, counts = _deduplicate(self._alldata)
+                if deduplicate is True or 2 * len(values) <= len(self._alldata):
+                    self._alldata, self._weights = values, counts
+            if self._weights is not None:
+                # values with a null weight do not belong to the data
+                kept = self._weights > 0
+                self._alldata, self._weights = self._alldata[kept], self._weights[kept]
+            self._data_min = self._alldata.min()
+            self._data_max = self._alldata.max()
         # Use ternary for cleaner code
-        self._xmin: float = self._alldata.min() if xmin is None else xmin
-        self._xmax: float = self._alldata.max() if xmax is None else xmax
+        self._xmin: float = self._data_min if xmin is None else xmin
+        self._xmax: float = self._data_max if xmax is None else xmax
 
         self._trim_data()
         self._update_data_pdf()
@@ -253,16 +397,110 @@ class Fitter:
         # Other attributes
         self._init()
 
+    @classmethod
+    def from_stream(
+        cls,
+        source: str | os.PathLike | Iterable,
+        sample_size: int = 100_000,
+        random_state: int | None = None,
+        column: int = 1,
+        delimiter: str = ",",
+        chunksize: int = 1_000_000,
+        **kwargs: Any,
+    ) -> Fitter:
+        """Create a :class:`Fitter` from data read in one pass, chunk by chunk.
+
+        The full data set is never held in memory: the histogram, minimum, maximum
+        and moments are accumulated over the whole stream (see
+        :class:`~fitter.streaming.StreamSummary`) while a uniform random sample of
+        *sample_size* values is kept for the fits, the likelihood (AIC, BIC) and the
+        Kolmogorov-Smirnov test::
+
+            f = Fitter.from_stream("telemetry.npy", sample_size=200000, distributions="common")
+            f.fit()
+
+        Args:
+            source: A file name (``.npy`` files are memory-mapped, other files are
+                read as delimited text) or an iterable of array-like chunks.
+            sample_size: Size of the random sample used for fitting.
+            random_state: Seed of the random sampling.
+            column: Column to read (1-indexed) in files.
+            delimiter: Column delimiter of text files.
+            chunksize: Number of values read at once from files.
+            **kwargs: Other arguments of :class:`Fitter` (bins, xmin, xmax, distributions...).
+
+        Returns:
+            A new :class:`Fitter`. Its :attr:`stream_summary` holds the summary of
+            the whole data.
+
+        .. versionadded:: 1.9.0
+        """
+        summary = StreamSummary(sample_size=sample_size, random_state=random_state)
+        for chunk in iter_chunks(source, chunksize=chunksize, column=column, delimiter=delimiter):
+            summary.update(chunk)
+        return cls(summary, **kwargs)
+
+    @classmethod
+    def from_histogram(
+        cls,
+        counts: np.ndarray | list[float],
+        edges: np.ndarray | list[float],
+        sample_size: int = 10_000,
+        **kwargs: Any,
+    ) -> Fitter:
+        """Create a :class:`Fitter` from a histogram (pre-binned data).
+
+        The distributions are fitted by maximizing the multinomial likelihood of
+        the counts (see :mod:`fitter.binned`), so the cost of the fits depends on
+        the number of bins, not on the number of values::
+
+            f = Fitter.from_histogram(counts, edges, distributions="common")
+            f.fit()
+
+        The metrics are computed from the bins: the AIC and BIC use the binned
+        log-likelihood (which differs from the likelihood of the raw data by a
+        constant, the same for all distributions) with *n* the total count, and
+        the Kolmogorov-Smirnov statistic is evaluated at the bin edges. The
+        histogram of the data is the given one: :attr:`bins` cannot be changed
+        and :attr:`xmin`/:attr:`xmax` select the bins whose centers are in range.
+
+        Args:
+            counts: Counts (or weights) of the bins.
+            edges: Bin edges (one more than *counts*).
+            sample_size: Size of the representative sample of the histogram used
+                for the starting points of the fits (see
+                :func:`~fitter.binned.histogram_sample`).
+            **kwargs: Other arguments of :class:`Fitter` (xmin, xmax, distributions...).
+
+        Returns:
+            A new :class:`Fitter`.
+
+        .. versionadded:: 1.9.0
+        """
+        return cls(BinnedData(edges, counts, sample_size=sample_size), **kwargs)
+
+    @property
+    def stream_summary(self) -> StreamSummary | None:
+        """Summary of the whole data for instances created with :meth:`from_stream`, None otherwise."""
+        return self._stream
+
     def _init(self) -> None:
         """Initialize result storage dictionaries."""
-        self.fitted_param: dict[str, tuple] = {}
-        self.fitted_pdf: dict[str, np.ndarray] = {}
-        self._fitted_errors: dict[str, float] = {}
-        self._aic: dict[str, float] = {}
-        self._bic: dict[str, float] = {}
-        self._kldiv: dict[str, float] = {}
-        self._ks_stat: dict[str, float] = {}
-        self._ks_pval: dict[str, float] = {}
+        #: status, metrics and parameters of the fitted distributions
+        self._results = ResultTable()
+        #: parameters of the fitted distributions (read-only view on the results)
+        self.fitted_param = ParamView(self._results)
+        #: PDFs of the fitted distributions on the bin centers, computed when accessed
+        self.fitted_pdf = PDFView(self._results, functools.partial(getattr, self, "x"))
+        #: outcome of the fit of each distribution
+        self.fit_status = StatusView(self._results)
+        #: reason why each skipped distribution was not fitted
+        self.skipped: dict[str, str] = {}
+        #: stage timings of each fit (see :attr:`df_timings`)
+        self.timings: dict[str, dict] = {}
+        # state of the data and histogram the results correspond to (see refit)
+        self._fitted_range: tuple[float, float] | None = None
+        self._fitted_bins: int | None = None
         self._fit_i: int = 0  # fit progress
 
     def _update_data_pdf(self) -> None:
@@ -274,14 +512,92 @@ class Fitter:
         """
         self.y: np.ndarray
         self.x: np.ndarray
-        self.y, bin_edges = np.histogram(self._data, bins=self.bins, density=self._density)
+        if self._binned is not None:
+            edges, counts = self._binned.edges, self._binned.counts
+            selected = self._select_bins(self._xmin, self._xmax)
+            bin_edges = edges[selected[0] : selected[-1] + 2]
+            self._bin_counts: np.ndarray = counts[selected]
+            self.y = self._bin_counts / (self._bin_counts.sum() * np.diff(bin_edges))
+            self._bins = len(selected)
+        elif self._stream is not None:
+            xmin, xmax = max(self._xmin, self._data_min), min(self._xmax, self._data_max)
+            self.y, bin_edges = self._stream.histogram(self.bins, xmin, xmax, density=self._density)
+        else:
+            self.y, bin_edges = np.histogram(self._data, bins=self.bins, weights=self._data_weights, density=self._density)
+        self._bin_edges: np.ndarray = bin_edges
         # OPTIMIZATION: Vectorized bin center calculation (much faster than list comprehension)
         self.x = (bin_edges[:-1] + bin_edges[1:]) / 2.0
 
+    def _select_bins(self, xmin: float, xmax: float) -> np.ndarray:
+        """Return the indices of the pre-binned bins whose centers are in [*xmin*, *xmax*].
+
+        Raises:
+            ValueError: If the range selects no bins.
+
+        """
+        edges = self._binned.edges
+        centers = (edges[:-1] + edges[1:]) / 2
+        selected = np.flatnonzero((centers >= xmin) & (centers <= xmax))
+        if not len(selected):
+            raise ValueError(f"The range [{xmin}, {xmax}] selects no bins of the histogram")
+        return selected
+
     def _trim_data(self) -> None:
         """Filter data to be within [xmin, xmax] range."""
+        self._sorted_data: np.ndarray | None = None
+        self._data_weights: np.ndarray | None = self._weights
+        if self._xmin <= self._data_min and self._xmax >= self._data_max:
+            # nothing to filter: avoid a copy of the (possibly memory-mapped) data
+            self._data: np.ndarray = self._alldata
+            return
         # Vectorized boolean indexing (efficient)
-        self._data: np.ndarray = self._alldata[(self._alldata >= self._xmin) & (self._alldata <= self._xmax)]
+        selected = (self._alldata >= self._xmin) & (self._alldata <= self._xmax)
+        self._data = self._alldata[selected]
+        if self._weights is not None:
+            self._data_weights = self._weights[selected]
+
+    def _get_size(self) -> float:
+        """Return the number of (trimmed) data values, i.e. the total weight of weighted data."""
+        return len(self._data) if self._data_weights is None else float(self._data_weights.sum())
+
+    def _get_sorted_data(self) -> np.ndarray:
+        """Return the trimmed data, sorted once and shared by all the fits.
+
+        The sorted copy is released (see :meth:`_release_sorted_data`) at the end
+        of :meth:`fit`, :meth:`refit` and :meth:`iter_fit_async`, so that a fitted
+        instance only keeps a single copy of the data.
+
+        For weighted data, a representative sorted sample of the weighted values
+        (see :func:`~fitter.weighted.weighted_sample`), used for the starting
+        points and the screening pass.
+        """
+        if self._sorted_data is None:
+            if self._data_weights is None:
+                self._sorted_data = np.sort(self._data)
+            else:
+                size = min(_WEIGHTED_SAMPLE_SIZE, max(len(self._data), int(round(self._get_size()))))
+                self._sorted_data = weighted_sample(self._data, self._data_weights, size)
+        return self._sorted_data
+
+    def _release_sorted_data(self) -> None:
+        """Drop the sorted copy of the data (see :meth:`_get_sorted_data`)."""
+        self._sorted_data = None
+
+    def _get_fit_data(self) -> tuple[np.ndarray, str]:
+        """Return the data passed to the fits and how to fit them (see :meth:`_fit_single_distribution`).
+
+        Returns:
+            Tuple (data, mode): the sorted data ("sample" mode), the distinct
+            values and weights of weighted data stacked in a 2 x m array
+            ("weighted" mode), or the lower edges, upper edges and counts of the
+            bins of pre-binned data stacked in a 3 x m array ("binned" mode).
+
+        """
+        if self._data_weights is not None:
+            return np.vstack([self._data, self._data_weights]), "weighted"
+        if self._binned is not None:
+            return np.vstack([self._bin_edges[:-1], self._bin_edges[1:], self._bin_counts]), "binned"
+        return self._get_sorted_data(), "sample"
 
     def _get_xmin(self) -> float:
         """Get the minimum x value for data filtering."""
@@ -289,8 +605,10 @@ class Fitter:
 
     def _set_xmin(self, value: float | None) -> None:
         """Set the minimum x value for data filtering."""
-        if value is None or value < self._alldata.min():
-            value = self._alldata.min()
+        if value is None or value < self._data_min:
+            value = self._data_min
+        if self._binned is not None:
+            self._select_bins(value, self._xmax)
         self._xmin = value
         self._trim_data()
         self._update_data_pdf()
@@ -303,14 +621,29 @@ class Fitter:
 
     def _set_xmax(self, value: float | None) -> None:
         """Set the maximum x value for data filtering."""
-        if value is None or value > self._alldata.max():
-            value = self._alldata.max()
+        if value is None or value > self._data_max:
+            value = self._data_max
+        if self._binned is not None:
+            self._select_bins(self._xmin, value)
         self._xmax = value
         self._trim_data()
         self._update_data_pdf()
 
     xmax = property(_get_xmax, _set_xmax, doc="consider only data below xmax. reset if None")
 
+    def _get_bins(self) -> int:
+        """Get the number of bins of the histogram."""
+        return self._bins
+
+    def _set_bins(self, value: int) -> None:
+        """Set the number of bins of the histogram."""
+        if self._binned is not None:
+            raise ValueError("The bins of a pre-binned histogram cannot be changed")
+        self._bins = value
+        self._update_data_pdf()
+
+    bins = property(_get_bins, _set_bins, doc="number of bins of the histogram")
+
     def _load_all_distributions(self) -> None:
         """Replace the :attr:`distributions` attribute with all scipy distributions."""
         self.distributions = get_distributions()
@@ -325,7 +658,12 @@ class Fitter:
             >>> fitter.Fitter(data).hist()
 
         """
-        plt.hist(self._data, bins=self.bins, density=self._density)
+        from matplotlib import pyplot as plt
+
+        if self._stream is not None or self._binned is not None:
+            plt.stairs(self.y, self._bin_edges, fill=True)
+        else:
+            plt.hist(self._data, bins=self.bins, weights=self._data_weights, density=self._density)
         plt.grid(True)
 
     @staticmethod
@@ -336,44 +674,148 @@ class Fitter:
         y: np.ndarray,
         timeout: int,
         verbose: bool = True,
-    ) -> tuple[str, tuple | None]:
+        start: tuple | None = None,
+        ks_method: str = "auto",
+        mode: str = "sample",
+    ) -> tuple[str, tuple | None, str, dict]:
         """Fit a single distribution to data and compute goodness-of-fit metrics.
 
         Args:
             distribution: Name of the scipy.stats distribution to fit.
-            data: Raw data array to fit.
+            data: Sorted data array to fit (sorted here if it is not), the values
+                and weights of weighted data, or the bins of pre-binned data,
+                depending on *mode* (see :meth:`_get_fit_data`).
             x: Bin centers for histogram comparison.
             y: Histogram density values.
-            timeout: Maximum time allowed for fitting (seconds).
+            timeout: Maximum time allowed for fitting (seconds). If None, the fit
+                runs without time limit (the caller is then in charge of it).
             verbose: If True, log fitting progress messages.
+            start: Optional initial parameters (shapes, loc, scale) used as
+                starting point of the optimizer.
+            ks_method: Method of the Kolmogorov-Smirnov p-value (see :func:`_kstest_sorted`).
+            mode: "sample" (maximum likelihood on the data), "weighted" (weighted
+                maximum likelihood, see :mod:`fitter.weighted`) or "binned" (binned
+                maximum likelihood, see :mod:`fitter.binned`).
 
         Returns:
-            Tuple of (distribution_name, results_tuple) where results_tuple contains
+            Tuple of (distribution_name, results_tuple, status, timings) where results_tuple contains
             (params, pdf_fitted, sq_error, aic, bic, kl_div, ks_stat, ks_pval)
-            or None if fitting failed.
+            or None if fitting failed. status is "success", "failed" or "timeout".
+            timings are the stage timings (see :class:`~fitter.profiling.StageTimer`),
+            with ``"rejected"`` set to True if the fitted CDF failed the sanity
+            check (a deterministic failure, unlike errors and timeouts).
 
         """
-        import warnings
+        timer = StageTimer()
+        # numerical warnings are silenced for this task only (see _quiet_warnings)
+        with _quiet_warnings():
 
-        warnings.filterwarnings("ignore", category=RuntimeWarning)
-        warnings.filterwarnings("ignore", category=IntegrationWarning)
-        try:
-            # BUGFIX: Replace eval() with getattr() - safer and faster
-            dist = getattr(scipy.stats, distribution)
+            def optimizer(func, x0, args=(), disp=0):
+                # default optimizer of scipy, recording the number of iterations
+                xopt, _, timer.iterations, _, _ = scipy.optimize.fmin(func, x0, args=args, disp=disp, full_output=True)
+                return xopt
 
-            param = Fitter._with_timeout(dist.fit, args=(data,), timeout=timeout)
+            try:
+                # BUGFIX: Replace eval() with getattr() - safer and faster
+                dist = getattr(scipy.stats, distribution)
 
+                if mode == "weighted":
+                    return Fitter._fit_weighted_distribution(
+                        distribution, data, x, y, timeout, verbose, start, ks_method, timer, optimizer
+                    )
+                if mode == "binned":
+                    return Fitter._fit_binned_distribution(
+                        distribution, data, x, y, timeout, verbose, start, ks_method, timer, optimizer
+                    )
+                if mode != "sample" or data.ndim != 1:
+                    raise ValueError(f"invalid fit mode {mode!r} for data of shape {data.shape}")
+
+                def fit() -> tuple:
+                    # closed-form or semi-analytic MLE when available, generic scipy fit otherwise
+                    estimator = get_estimator(distribution)
+                    param = estimator(data) if estimator is not None else None
+                    if param is None and start is None:
+                        param = Fitter._with_timeout(dist.fit, args=(data,), kwargs={"optimizer": optimizer}, timeout=timeout)
+                    elif param is None:
+                        # scipy expects shape guesses as positional arguments and
+                        # loc/scale guesses as keywords
+                        param = Fitter._with_timeout(
+                            dist.fit,
+                            args=(data, *start[:-2]),
+                            kwargs={"loc": start[-2], "scale": start[-1], "optimizer": optimizer},
+                            timeout=timeout,
+                        )
+                    return param
+
+                def ks_test(dist_fitted: Any) -> tuple[float, float]:
+                    # single vectorized CDF evaluation on the sorted data
+                    sorted_data = np.sort(data) if np.any(data[1:] < data[:-1]) else data
+                    return _kstest_sorted(sorted_data, dist_fitted.cdf(sorted_data), ks_method)
+
+                # CRITICAL BUGFIX: logLik should be computed on DATA, not bin centers
+                # Original used x (bins) which gives wrong likelihood
+                return Fitter._evaluate_fit(
+                    distribution, fit, lambda param: np.sum(dist.logpdf(data, *param)), ks_test, len(data), x, y, verbose, timer
+                )
+            except multiprocessing.TimeoutError:
+                if verbose:
+                    logger.warning(f"SKIPPED {distribution}: timeout={timeout}s reached")
+                return distribution, None, "timeout", timer.to_dict()
+            except Exception as e:  # pragma: no cover
+                if verbose:
+                    logger.warning(f"SKIPPED {distribution}: {type(e).__name__} " f"(fitting failed)")
+                return distribution, None, "failed", timer.to_dict()
+
+    @staticmethod
+    def _evaluate_fit(
+        distribution: str,
+        fit: Callable[[], tuple],
+        loglikelihood: Callable[[tuple], float],
+        ks_test: Callable[[Any], tuple[float, float]],
+        n: float,
+        x: np.ndarray,
+        y: np.ndarray,
+        verbose: bool,
+        timer: StageTimer,
+    ) -> tuple[str, tuple | None, str, dict]:
+        """Run a fit and compute its goodness-of-fit metrics (see :meth:`_fit_single_distribution`).
+
+        Args:
+            distribution: Name of the scipy.stats distribution.
+            fit: Function returning the fitted parameters.
+            loglikelihood: Function returning the log-likelihood of the data for
+                some parameters.
+            ks_test: Function returning the Kolmogorov-Smirnov statistic and
+                p-value of the data for a frozen distribution.
+            n: Number of data points (used by the BIC).
+            x: Bin centers for histogram comparison.
+            y: Histogram density values.
+            verbose: If True, log fitting progress messages.
+            timer: Timer of the stages of the fit.
+
+        Returns:
+            Raw result, as :meth:`_fit_single_distribution`.
+
+        """
+        dist = getattr(scipy.stats, distribution)
+        with timer("fit"):
+            param = fit()
+
+        with timer("pdf"):
             # Compute PDF at bin centers for visualization
             pdf_fitted = dist.pdf(x, *param)
 
             # Calculate sum of squared errors between fitted PDF and histogram
             sq_error = np.sum((pdf_fitted - y) ** 2)
 
-            # CRITICAL BUGFIX: logLik should be computed on DATA, not bin centers
-            # Original used x (bins) which gives wrong likelihood
-            logLik = np.sum(dist.logpdf(data, *param))
+            # Calculate Kullback-Leibler divergence (requires positive values)
+            # Add small epsilon to avoid log(0) issues
+            eps = 1e-10
+            kullback_leibler = kl_div(pdf_fitted + eps, y + eps)
+
+        with timer("logpdf"):
+            logLik = loglikelihood(param)
             k = len(param)  # Number of parameters
-            n = len(data)  # Number of data points
 
             # Akaike Information Criterion: AIC = 2k - 2*ln(L)
             aic = 2 * k - 2 * logLik
@@ -381,46 +823,384 @@ class Fitter:
             # Bayesian Information Criterion: BIC = k*ln(n) - 2*ln(L)
             bic = k * np.log(n) - 2 * logLik
 
-            # Calculate Kullback-Leibler divergence (requires positive values)
-            # Add small epsilon to avoid log(0) issues
-            eps = 1e-10
-            kullback_leibler = kl_div(pdf_fitted + eps, y + eps)
-
-            # Create frozen distribution for efficient CDF evaluation
-            dist_fitted = dist(*param)
+        # Create frozen distribution for efficient CDF evaluation
+        dist_fitted = dist(*param)
 
-            # Validate that the CDF is bounded within [0, 1] over the data range.
-            # Some distributions (e.g. geninvgauss) can return CDF values slightly
-            # above 1 due to numerical issues, which indicates an invalid fit.
+        # Validate that the CDF is bounded within [0, 1] over the data range.
+        # Some distributions (e.g. geninvgauss) can return CDF values slightly
+        # above 1 due to numerical issues, which indicates an invalid fit.
+        with timer("cdf_check"):
             cdf_values = dist_fitted.cdf(x)
-            if np.any(cdf_values > 1) or np.any(cdf_values < 0):
-                if verbose:
-                    logger.warning(
-                        f"SKIPPED {distribution}: CDF values outside [0, 1] "
-                        f"(min={cdf_values.min():.6g}, max={cdf_values.max():.6g})"
-                    )
-                return distribution, None
+        if np.any(cdf_values > 1) or np.any(cdf_values < 0):
+            if verbose:
+                logger.warning(
+                    f"SKIPPED {distribution}: CDF values outside [0, 1] "
+                    f"(min={cdf_values.min():.6g}, max={cdf_values.max():.6g})"
+                )
+            return distribution, None, "failed", {**timer.to_dict(), "rejected": True}
 
-            # Calculate Kolmogorov-Smirnov goodness-of-fit statistic
-            ks_stat, ks_pval = kstest(data, dist_fitted.cdf)
+        with timer("ks"):
+            ks_stat, ks_pval = ks_test(dist_fitted)
 
-            if verbose:
-                logger.info(f"Fitted {distribution}: error={sq_error:.6f}, " f"AIC={aic:.2f}, KS={ks_stat:.4f}")
-
-            return distribution, (
-                param,
-                pdf_fitted,
-                sq_error,
-                aic,
-                bic,
-                kullback_leibler,
-                ks_stat,
-                ks_pval,
+        if verbose:
+            logger.info(f"Fitted {distribution}: error={sq_error:.6f}, " f"AIC={aic:.2f}, KS={ks_stat:.4f}")
+        return distribution, (param, pdf_fitted, sq_error, aic, bic, kullback_leibler, ks_stat, ks_pval), "success", timer.to_dict()
+
+    @staticmethod
+    def _start_from_sample(distribution: str, sample: np.ndarray, timeout: int) -> tuple:
+        """Starting point of a binned or weighted fit, fitted to a representative sample of the data."""
+        estimator = get_estimator(distribution)
+        start = estimator(sample) if estimator is not None else None
+        if start is None:
+            start = Fitter._with_timeout(getattr(scipy.stats, distribution).fit, args=(sample,), timeout=timeout)
+        return start
+
+    @staticmethod
+    def _fit_binned_distribution(
+        distribution: str,
+        bins: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        timeout: int,
+        verbose: bool,
+        start: tuple | None,
+        ks_method: str,
+        timer: StageTimer,
+        optimizer: Any,
+    ) -> tuple[str, tuple | None, str, dict]:
+        """Binned counterpart of :meth:`_fit_single_distribution` (see :mod:`fitter.binned`).
+
+        *bins* stacks the lower edges, upper edges and counts of the bins.
+        """
+        dist = getattr(scipy.stats, distribution)
+        lower, upper, counts = bins
+        edges = np.append(lower, upper[-1])
+        n = counts.sum()
+
+        def fit() -> tuple:
+            first = start
+            if first is None:
+                sample = histogram_sample(edges, counts, min(2000, max(100, int(n))))
+                first = Fitter._start_from_sample(distribution, sample, timeout)
+            return Fitter._with_timeout(fit_binned, args=(dist, lower, upper, counts, first, optimizer), timeout=timeout)
+
+        def ks_test(dist_fitted: Any) -> tuple[float, float]:
+            # statistic at the bin edges
+            ks_stat = binned_ks_statistic(dist_fitted.cdf(edges), counts)
+            return ks_stat, _ks_pvalue(ks_stat, max(1, int(round(n))), ks_method)
+
+        # multinomial log-likelihood of the counts
+        return Fitter._evaluate_fit(
+            distribution,
+            fit,
+            lambda param: binned_loglikelihood(dist, param, lower, upper, counts),
+            ks_test,
+            n,
+            x,
+            y,
+            verbose,
+            timer,
+        )
+
+    @staticmethod
+    def _fit_weighted_distribution(
+        distribution: str,
+        weighted: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        timeout: int,
+        verbose: bool,
+        start: tuple | None,
+        ks_method: str,
+        timer: StageTimer,
+        optimizer: Any,
+    ) -> tuple[str, tuple | None, str, dict]:
+        """Weighted counterpart of :meth:`_fit_single_distribution` (see :mod:`fitter.weighted`).
+
+        *weighted* stacks the sorted distinct values and their weights.
+        """
+        dist = getattr(scipy.stats, distribution)
+        values, weights = weighted
+        n = weights.sum()
+
+        def fit() -> tuple:
+            first = start
+            if first is None:
+                sample = weighted_sample(values, weights, min(2000, max(100, int(n))))
+                first = Fitter._start_from_sample(distribution, sample, timeout)
+            return Fitter._with_timeout(fit_weighted, args=(dist, values, weights, first, optimizer), timeout=timeout)
+
+        def ks_test(dist_fitted: Any) -> tuple[float, float]:
+            # one CDF evaluation per distinct value
+            ks_stat = weighted_ks_statistic(dist_fitted.cdf(values), weights)
+            return ks_stat, _ks_pvalue(ks_stat, max(1, int(round(n))), ks_method)
+
+        # same log-likelihood as the data with each value repeated by its weight
+        return Fitter._evaluate_fit(
+            distribution,
+            fit,
+            lambda param: weighted_loglikelihood(dist, param, values, weights),
+            ks_test,
+            n,
+            x,
+            y,
+            verbose,
+            timer,
+        )
+
+    def _run(
+        self,
+        distributions: list[str],
+        data: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        starts: dict[str, tuple] | None = None,
+        progress: bool = False,
+        max_workers: int = -1,
+        prefer: str = "processes",
+        pool: FitPool | None = None,
+        cache: FitCache | None = None,
+        mode: str = "sample",
+    ) -> list[tuple[str, tuple | None, str, dict]]:
+        """Fit the given distributions in parallel and return the raw results.
+
+        *data* and *mode* are as returned by :meth:`_get_fit_data`.
+        """
+        starts = starts or {}
+        if cache is not None:
+            return self._run_cached(cache, distributions, data, x, y, starts, progress, max_workers, prefer, pool, mode)
+        n_dists = len(distributions)
+        if pool is not None:
+            return self._run_in_pool(pool, distributions, data, x, y, starts, progress, mode)
+        if prefer == "sandbox":
+            with FitPool(max_workers=max_workers) as pool:
+                return self._run_in_pool(pool, distributions, data, x, y, starts, progress, mode)
+
+        from joblib.parallel import Parallel, delayed
+
+        # results are collected as they come (rather than by patching joblib's
+        # callbacks to update the progress bar, which is not thread safe)
+        parallel = Parallel(n_jobs=max_workers, prefer=prefer, return_as="generator_unordered")
+        tasks = (
+            delayed(Fitter._fit_single_distribution)(
+                dist, data, x, y, self.timeout, self.verbose, starts.get(dist), self._ks_method, mode
             )
-        except Exception as e:  # pragma: no cover
-            if verbose:
-                logger.warning(f"SKIPPED {distribution}: {type(e).__name__} " f"(timeout={timeout}s or fitting failed)")
-            return distribution, None
+            for dist in distributions
+        )
+        results = []
+        with _progress_bar(f"Fitting {n_dists} distributions", n_dists, progress) as progress_bar:
+            for result in parallel(tasks):
+                results.append(result)
+                progress_bar.update()
+        return results
+
+    def _run_in_pool(
+        self,
+        pool: FitPool,
+        distributions: list[str],
+        data: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        starts: dict[str, tuple],
+        progress: bool = False,
+        mode: str = "sample",
+    ) -> list[tuple[str, tuple | None, str, dict]]:
+        """Fit the given distributions in a :class:`~fitter.pool.FitPool`.
+
+        The timeout is enforced by the pool, which kills the worker of a fit that
+        runs for too long instead of leaving it running in the background. Large
+        data are published once with :meth:`~fitter.pool.FitPool.share` rather
+        than pickled for every distribution.
+        """
+        results = []
+        with _progress_bar(f"Fitting {len(distributions)} distributions", len(distributions), progress) as progress_bar:
+            for result in self._iter_pool(pool, distributions, data, x, y, starts, mode=mode):
+                results.append(result)
+                progress_bar.update()
+        return results
+
+    def _iter_pool(
+        self,
+        pool: FitPool,
+        distributions: list[str],
+        data: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        starts: dict[str, tuple],
+        stop: threading.Event | None = None,
+        mode: str = "sample",
+    ) -> Iterator[tuple[str, tuple | None, str, dict]]:
+        """Yield the raw results of the fits run in *pool* as they complete (see :meth:`_run_in_pool`).
+
+        The iteration ends early, killing the fits still running, when *stop* is set.
+        """
+        shared = pool.share(data) if data.nbytes > pool.max_nbytes else data
+        tasks = ((dist, shared, x, y, None, self.verbose, starts.get(dist), self._ks_method, mode) for dist in distributions)
+        try:
+            for index, status, result in pool.imap_unordered(Fitter._fit_single_distribution, tasks, timeout=self.timeout, stop=stop):
+                distribution = distributions[index]
+                if status == "success":
+                    yield result
+                else:
+                    if self.verbose:
+                        logger.warning(f"SKIPPED {distribution}: {status} ({result or f'timeout={self.timeout}s reached'})")
+                    yield distribution, None, status, {}
+        finally:
+            if shared is not data:
+                pool.release(shared)
+
+    def _run_cached(
+        self,
+        cache: FitCache,
+        distributions: list[str],
+        data: np.ndarray,
+        x: np.ndarray,
+        y: np.ndarray,
+        starts: dict[str, tuple],
+        progress: bool,
+        max_workers: int,
+        prefer: str,
+        pool: FitPool | None,
+        mode: str = "sample",
+    ) -> list[tuple[str, tuple | None, str, dict]]:
+        """As :meth:`_run` but only fit the distributions missing from *cache*.
+
+        Cached results are returned with their PDF recomputed on *x*. Only the
+        deterministic outcomes of the new fits are stored: successes and fits
+        rejected by the CDF check. Timeouts, crashed workers and other errors
+        (e.g. out of memory) may succeed later and are fitted again.
+        """
+        fingerprint = FitCache.fingerprint(data, x, y, options=f"ks_method={self._ks_method},mode={mode}")
+        results = []
+        missing = []
+        for distribution in distributions:
+            entry = cache.get(fingerprint, distribution)
+            if entry is None:
+                missing.append(distribution)
+                continue
+            param, metrics, status = entry
+            if param is None:
+                results.append((distribution, None, status, {}))
+            else:
+                pdf_fitted = getattr(scipy.stats, distribution).pdf(x, *param)
+                results.append((distribution, (param, pdf_fitted, *metrics), status, {}))
+        if self.verbose and results:
+            logger.info(f"Found {len(results)} fits in the cache")
+
+        if missing:
+            written = False
+            for distribution, values, status, timings in self._run(missing, data, x, y, starts, progress, max_workers, prefer, pool, mode=mode):
+                results.append((distribution, values, status, timings))
+                if status == "success" and values is not None:
+                    cache.set(fingerprint, distribution, values[0], values[2:], status)
+                    written = True
+                elif timings.get("rejected"):
+                    cache.set(fingerprint, distribution, None, (), status)
+                    written = True
+            if written:
+                cache.evict()
+        return results
+
+    @staticmethod
+    def _results_to_dataframe(results: list[tuple[str, tuple | None, str, dict]]) -> pd.DataFrame:
+        """Build an errors DataFrame (one row per distribution) from raw results."""
+        import pandas as pd
+
+        failed = (np.inf, np.inf, np.inf, np.inf, np.inf, 0.0)
+        rows = {name: (values[2:] if values is not None else failed) for name, values, _, _ in results}
+        return pd.DataFrame.from_dict(rows, orient="index", columns=list(METRICS), dtype=float).sort_index()
+
+    def _race_bounds(self, screening: list[tuple[str, tuple | None, str, dict]], sample: np.ndarray, method: str) -> dict[str, float]:
+        """Optimistic estimates of the full-data *method* score of each screened distribution.
+
+        For AIC and BIC, the log-likelihood of the full data is extrapolated from
+        the subsample, minus :data:`_RACE_Z` standard errors of the mean
+        log-density. For the KS statistic, the deviation between the empirical CDFs
+        of the subsample and the full data is bounded with the
+        Dvoretzky-Kiefer-Wolfowitz inequality. Other (histogram-based) metrics are
+        reduced by a relative tolerance. Failed fits get an infinite bound.
+        """
+        n, m = self._get_size(), len(sample)
+        column = METRICS.index(method)
+        bounds = {}
+        for name, values, _, _ in screening:
+            if values is None:
+                bounds[name] = np.inf
+                continue
+            param = values[0]
+            if method in ("aic", "bic"):
+                logpdf = getattr(scipy.stats, name).logpdf(sample, *param)
+                nll = -logpdf.mean() - _RACE_Z * logpdf.std() / np.sqrt(m)
+                penalty = 2 * len(param) if method == "aic" else len(param) * np.log(n)
+                bound = penalty + 2 * n * nll
+            elif method == "ks_statistic":
+                bound = values[2 + column] - np.sqrt(np.log(2 / _RACE_ALPHA) / (2 * m))
+            else:
+                bound = values[2 + column] * (1 - _RACE_RTOL)
+            bounds[name] = np.inf if np.isnan(bound) else bound
+        return bounds
+
+    def _race(
+        self,
+        order: list[str],
+        bounds: dict[str, float],
+        starts: dict[str, tuple],
+        top_k: int,
+        method: str,
+        progress: bool,
+        max_workers: int,
+        pool: FitPool | None,
+    ) -> list[tuple[str, tuple | None, str, dict]]:
+        """Fit the distributions on the full data in *order* until the *top_k* best are known.
+
+        A distribution is only dispatched if its bound (see :meth:`_race_bounds`)
+        is better than the *top_k*-th best score obtained so far. The race stops,
+        killing the fits still running, as soon as none of the remaining
+        distributions can enter the *top_k*.
+        """
+        if pool is None:
+            with FitPool(max_workers=max_workers) as pool:
+                return self._race(order, bounds, starts, top_k, method, progress, max_workers, pool)
+
+        column = METRICS.index(method)
+        scores: list[float] = []
+        dispatched: list[str] = []
+        done: set[str] = set()
+
+        def threshold() -> float:
+            return sorted(scores)[top_k - 1] if len(scores) >= top_k else np.inf
+
+        def tasks():
+            for name in order:
+                if bounds[name] < threshold():
+                    dispatched.append(name)
+                    yield (name, shared, self.x, self.y, None, self.verbose, starts.get(name), self._ks_method, mode)
+
+        data, mode = self._get_fit_data()
+        shared = pool.share(data) if data.nbytes > pool.max_nbytes else data
+        results = []
+        try:
+            with _progress_bar(f"Racing {len(order)} distributions", len(order), progress) as progress_bar:
+                for index, status, result in pool.imap_unordered(Fitter._fit_single_distribution, tasks(), timeout=self.timeout):
+                    distribution = dispatched[index]
+                    done.add(distribution)
+                    if status == "success":
+                        results.append(result)
+                        if result[1] is not None:
+                            scores.append(result[1][2 + column])
+                    else:
+                        if self.verbose:
+                            logger.warning(f"SKIPPED {distribution}: {status} ({result or f'timeout={self.timeout}s reached'})")
+                        results.append((distribution, None, status, {}))
+                    progress_bar.update()
+                    if all(bounds[name] >= threshold() for name in order if name not in done):
+                        break
+        finally:
+            if shared is not data:
+                pool.release(shared)
+        if self.verbose:
+            logger.info(f"Racing fitted {len(results)} distributions out of {len(order)}")
+        return results
 
     def fit(
         self,
@@ -428,6 +1208,13 @@ class Fitter:
         n_jobs: int = -1,
         max_workers: int = -1,
         prefer: str = "processes",
+        subsample: int | None = None,
+        top_k: int = 5,
+        method: str = "sumsquare_error",
+        pool: FitPool | None = None,
+        cache: FitCache | None = None,
+        race: bool = False,
+        ks_method: str = "auto",
     ) -> None:
         r"""Fit all distributions to the data and compute goodness-of-fit metrics.
 
@@ -436,73 +1223,381 @@ class Fitter:
 
             - :attr:`df_errors`: DataFrame with sum of squared errors and information criteria
             - :attr:`fitted_param`: Parameters that best fit the data for each distribution
-            - :attr:`fitted_pdf`: PDF values generated with the fitted parameters
+            - :attr:`fitted_pdf`: PDF values generated with the fitted parameters (computed when accessed)
+
+        With large data sets, fitting every distribution on all the data can be
+        very slow. Setting *subsample* enables a two-stage mode: all distributions
+        are first fitted on a stratified subsample of *subsample* points and ranked
+        using *method*; only the *top_k* best candidates are then fitted on the full
+        data, using the subsample parameters as starting points. The screening
+        results are stored in :attr:`df_screening`; the screened-out distributions
+        are reported with infinite errors in :attr:`df_errors`, like failed fits::
+
+            f = Fitter(data)
+            f.fit(subsample=10000, top_k=5, method="sumsquare_error")
+
+        When only the best distributions matter (e.g. for :meth:`get_best`), the
+        racing mode (*race* set to True) goes further: after the screening pass,
+        distributions are fitted on the full data from the most to the least
+        promising, and the remaining ones are discarded (and those still running
+        killed) as soon as they cannot enter the *top_k* under *method*, given a
+        statistical bound on their full-data score derived from the subsample.
+        The discarded distributions have the "pruned" status::
+
+            f.fit(race=True, top_k=1, method="aic")
+            f.get_best(method="aic")
 
         Args:
             progress: If True, display progress bar during fitting.
             n_jobs: Number of jobs for parallel processing (deprecated, use max_workers).
             max_workers: Number of parallel workers (-1 for all CPUs).
-            prefer: Joblib parallelization method ('processes' or 'threads').
+            prefer: Joblib parallelization method ('processes' or 'threads'), or
+                'sandbox' to run the fits in a :class:`~fitter.pool.FitPool` of worker
+                processes that are killed when a fit exceeds :attr:`timeout`.
+            subsample: If set and smaller than the data size, size of the subsample
+                used for the screening pass.
+            top_k: Number of distributions refitted on the full data after screening.
+            method: Metric used to rank distributions during screening.
+            pool: A :class:`~fitter.pool.FitPool` to run the fits in (as with
+                'sandbox' but the worker processes are reused across calls and can be
+                shared by several :class:`Fitter`). *prefer* and *max_workers* are then
+                ignored.
+            cache: A :class:`~fitter.cache.FitCache` where the results are stored.
+                Distributions already fitted on the same data, histogram and
+                library versions are read from it instead of being fitted again.
+                In racing mode, only the screening pass uses the cache.
+            race: If True, use the racing mode. *subsample* then defaults to 5000 and
+                the fits run in a :class:`~fitter.pool.FitPool` (*pool* if given).
+            ks_method: Method of the Kolmogorov-Smirnov p-value: "exact", "asymp"
+                (asymptotic Kolmogorov distribution, fast for large data) or "auto"
+                (exact up to 10000 points). The data are sorted once for all the
+                distributions.
 
         Note:
             The fitting uses parallel processing for speed. Distributions that fail
             or timeout are assigned infinite error values.
 
+        The outcome of each fit ("success", "failed", "timeout", "screened" for
+        distributions discarded by the screening pass or "pruned" for distributions
+        discarded by the racing mode) is stored in :attr:`fit_status`.
+
+        Distributions that cannot be fitted to the data (unknown or discrete
+        distributions, more parameters than distinct values, constant data; see
+        :func:`~fitter.catalog.filter_candidates`) are not dispatched: they get the
+        "skipped" status and the reason is stored in :attr:`skipped`. Starting
+        points (from the screening pass or :meth:`refit`) are moved so that the
+        support of the distribution contains the data.
+
+        The numerical fits start from moment or quantile matching guesses when
+        available (see :mod:`fitter.guesses`), or from the screening results.
+
+        .. versionchanged:: 1.9.0 add the *subsample*, *top_k* and *method* arguments,
+            the 'sandbox' mode, the *pool*, *cache*, *race* and *ks_method* arguments
+            and :attr:`fit_status`.
         """
-        n_dists = len(self.distributions)
-        with tqdm_joblib(
-            desc=f"Fitting {n_dists} distributions",
-            total=n_dists,
-            disable=not progress,
-        ) as progress_bar:
-            results = Parallel(n_jobs=max_workers, prefer=prefer)(
-                delayed(Fitter._fit_single_distribution)(dist, self._data, self.x, self.y, self.timeout, self.verbose)
-                for dist in self.distributions
+        if ks_method not in ("auto", "exact", "asymp"):
+            raise ValueError(f"ks_method must be 'auto', 'exact' or 'asymp', not {ks_method!r}")
+        self._ks_method = ks_method
+        if self._binned is not None and (subsample is not None or race):
+            raise ValueError("subsample and race are not available for pre-binned data")
+        distributions = self._filter_candidates(self.distributions)
+        # moment/quantile guesses, replaced by the screening results if any
+        starts = self._cover_data(guess_starts(distributions, DataSummary.from_sorted(self._get_sorted_data())))
+        self.df_screening: pd.DataFrame | None = None
+        results = None
+        if race and subsample is None:
+            subsample = _RACE_SUBSAMPLE
+
+        if subsample is not None and subsample < self._get_size():
+            sample = _stratified_subsample(self._get_sorted_data(), subsample)
+            # same bin edges as the full histogram so that histogram-based
+            # metrics are comparable across stages
+            y_sample, _ = np.histogram(sample, bins=self._bin_edges, density=self._density)
+            sample_starts = guess_starts(distributions, DataSummary.from_sorted(sample))
+            screening = self._run(
+                distributions, sample, self.x, y_sample, sample_starts, progress=progress, max_workers=max_workers, prefer=prefer, pool=pool, cache=cache
             )
+            self.df_screening = self._results_to_dataframe(screening)
+            starts.update(self._cover_data({name: values[0] for name, values, _, _ in screening if values is not None}))
+            ranking = list(self.df_screening.sort_values(method).index)
+            if race:
+                bounds = self._race_bounds(screening, sample, method)
+                results = self._race(ranking, bounds, starts, top_k, method, progress, max_workers, pool)
+                distributions = [name for name, _, _, _ in results]
+            else:
+                distributions = ranking[:top_k]
+                if self.verbose:
+                    logger.info(f"Screening on {len(sample)} points kept {distributions}")
 
-        # Process results and populate dictionaries
-        for distribution, values in results:
+        if results is None:
+            data, mode = self._get_fit_data()
+            results = self._run(distributions, data, self.x, self.y, starts, progress, max_workers, prefer, pool, cache, mode)
+
+        self._store_results(results)
+
+        # distributions discarded by the screening pass are not fitted on the full data
+        for distribution in set(self.distributions) - set(distributions) - set(self.skipped):
+            self._results.set(distribution, "pruned" if race else "screened")
+
+        self._update_df_errors()
+        self._release_sorted_data()
+
+    def refit(
+        self,
+        progress: bool = False,
+        max_workers: int = -1,
+        prefer: str = "processes",
+        pool: FitPool | None = None,
+        cache: FitCache | None = None,
+    ) -> None:
+        """Update the results of :meth:`fit` after a change of :attr:`xmin`, :attr:`xmax` or :attr:`bins`.
+
+        When only :attr:`bins` changed, the fitted parameters do not change: only
+        the histogram-based metrics (sum of squared errors, KL divergence) and
+        :attr:`fitted_pdf` are recomputed, which is almost instantaneous. When
+        :attr:`xmin` or :attr:`xmax` changed, the distributions are fitted again on
+        the trimmed data, starting from the previous parameters::
+
+            f = Fitter(data)
+            f.fit()
+            f.xmax = 100
+            f.refit()
+
+        Distributions discarded by a screening pass or the racing mode (see
+        :meth:`fit`) are not refitted.
+
+        Args:
+            progress: If True, display progress bar during fitting.
+            max_workers: Number of parallel workers (-1 for all CPUs).
+            prefer: See :meth:`fit`.
+            pool: See :meth:`fit`.
+            cache: See :meth:`fit`.
+
+        Raises:
+            RuntimeError: If no distribution was fitted yet (e.g. :meth:`fit` was
+                never called or :meth:`iter_fit_async` was interrupted before its
+                first result).
+
+        .. versionadded:: 1.9.0
+        """
+        if self._fitted_range is None:
+            raise RuntimeError("Nothing to refit: call fit() first")
+
+        if (self._xmin, self._xmax) == self._fitted_range:
+            # same data, hence same maximum likelihood parameters
+            if self.bins != self._fitted_bins:
+                self._update_histogram_metrics()
+        else:
+            distributions = [name for name in self.distributions if self.fit_status.get(name) not in ("screened", "pruned")]
+            distributions = self._filter_candidates(distributions)
+            starts = guess_starts(distributions, DataSummary.from_sorted(self._get_sorted_data()))
+            starts.update({name: param for name, param in self.fitted_param.items() if name in distributions})
+            starts = self._cover_data(starts)
+            data, mode = self._get_fit_data()
+            results = self._run(distributions, data, self.x, self.y, starts, progress, max_workers, prefer, pool, cache, mode)
+            self._store_results(results)
+        self._update_df_errors()
+        self._release_sorted_data()
+
+    async def iter_fit_async(
+        self,
+        max_workers: int = -1,
+        pool: FitPool | None = None,
+        deadline: float | None = None,
+        ks_method: str = "auto",
+    ) -> AsyncIterator[tuple[str, str]]:
+        """Fit all distributions without blocking the event loop, yielding each result as it completes.
+
+        The fits run in a :class:`~fitter.pool.FitPool` (*pool* if given, a new
+        one otherwise), driven from a thread of the event loop's default
+        executor. After each result, the result attributes (:attr:`df_errors`,
+        :attr:`fitted_param`, :attr:`fit_status`...) are updated, so that partial
+        rankings are available with :meth:`get_best` or :meth:`summary`::
+
+            async with contextlib.aclosing(f.iter_fit_async(deadline=10)) as results:
+                async for distribution, status in results:
+                    print(distribution, status, f.get_best())
+
+        Cancelling the task iterating (or leaving the loop and closing the
+        iterator) kills the fits still running. When *deadline* is reached, the
+        iteration ends and the distributions not fitted yet get the "timeout"
+        status.
+
+        The workers of the pool are started from that thread: see the note of
+        :class:`~fitter.pool.FitPool` on start methods and threads.
+
+        Args:
+            max_workers: Number of worker processes of the new pool (-1 for all CPUs).
+            pool: A :class:`~fitter.pool.FitPool` to run the fits in.
+            deadline: Maximum time (seconds) for the whole run. None means no limit
+                (each fit is still limited by :attr:`timeout`).
+            ks_method: See :meth:`fit`.
+
+        Yields:
+            Tuples (distribution, status) in the order of completion.
+
+        .. versionadded:: 1.9.0
+        """
+        if ks_method not in ("auto", "exact", "asymp"):
+            raise ValueError(f"ks_method must be 'auto', 'exact' or 'asymp', not {ks_method!r}")
+        self._ks_method = ks_method
+        distributions = self._filter_candidates(self.distributions)
+        starts = self._cover_data(guess_starts(distributions, DataSummary.from_sorted(self._get_sorted_data())))
+        # previous results of the candidates would mix with the partial rankings
+        for distribution in distributions:
+            self._forget(distribution)
+        self._update_df_errors()
+
+        loop = asyncio.get_running_loop()
+        end = None if deadline is None else loop.time() + deadline
+        queue: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        done = object()
+
+        def put(item: Any) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:  # pragma: no cover
+                pass  # event loop closed
+
+        def produce(pool: FitPool | None) -> None:
+            own_pool = pool is None
+            if own_pool:
+                pool = FitPool(max_workers=max_workers)
+            try:
+                data, mode = self._get_fit_data()
+                for result in self._iter_pool(pool, distributions, data, self.x, self.y, starts, stop, mode):
+                    put(result)
+            except Exception as error:  # pragma: no cover
+                put(error)
+            finally:
+                if own_pool:
+                    pool.close()
+                put(done)
+
+        producer = loop.run_in_executor(None, produce, pool)
+        remaining = set(distributions)
+        try:
+            while remaining:
+                try:
+                    item = await asyncio.wait_for(queue.get(), None if end is None else max(0.0, end - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+                if item is done:
+                    break
+                if isinstance(item, Exception):  # pragma: no cover
+                    raise item
+                self._store_results([item])
+                self._update_df_errors()
+                remaining.discard(item[0])
+                yield item[0], item[2]
+        finally:
+            # kill the fits still running and wait for the pool to be released
+            stop.set()
+            await asyncio.shield(producer)
+            self._release_sorted_data()
+        for distribution in remaining:
+            if self.verbose:
+                logger.warning(f"SKIPPED {distribution}: deadline={deadline}s reached")
+            self._results.set(distribution, "timeout")
+        self._update_df_errors()
+
+    async def fit_async(
+        self,
+        max_workers: int = -1,
+        pool: FitPool | None = None,
+        deadline: float | None = None,
+        ks_method: str = "auto",
+    ) -> None:
+        """Fit all distributions without blocking the event loop.
+
+        Awaitable counterpart of :meth:`fit` for asyncio applications, without
+        the screening, racing and cache options. See :meth:`iter_fit_async` for
+        the arguments, cancellation and the deadline.
+
+        .. versionadded:: 1.9.0
+        """
+        async with contextlib.aclosing(self.iter_fit_async(max_workers, pool, deadline, ks_method)) as results:
+            async for _ in results:
+                pass
+
+    def _forget(self, distribution: str) -> None:
+        """Remove the results of a distribution."""
+        self._results.remove(distribution)
+        self.timings.pop(distribution, None)
+
+    def _filter_candidates(self, distributions: list[str]) -> list[str]:
+        """Return the *distributions* that can be fitted to the data (see :func:`~fitter.catalog.filter_candidates`).
+
+        The others are given the "skipped" status and the reason is stored in :attr:`skipped`.
+        """
+        kept, skipped = filter_candidates(distributions, self._get_sorted_data())
+        for distribution in kept:
+            self.skipped.pop(distribution, None)
+        for distribution, reason in skipped.items():
+            if self.verbose:
+                logger.warning(f"SKIPPED {distribution}: {reason}")
+            self.skipped[distribution] = reason
+            self._results.set(distribution, "skipped")
+        return kept
+
+    def _cover_data(self, starts: dict[str, tuple]) -> dict[str, tuple]:
+        """Move the starting points whose support does not contain the data (see :func:`~fitter.catalog.cover_data`)."""
+        data = self._get_sorted_data()
+        return {name: cover_data(name, start, data[0], data[-1]) for name, start in starts.items()}
+
+    def _update_histogram_metrics(self) -> None:
+        """Recompute the sum of squared errors and KL divergence on the current histogram."""
+        eps = 1e-10
+        for distribution, param in self.fitted_param.items():
+            if self.fit_status[distribution] != "success":
+                continue
+            pdf_fitted = getattr(scipy.stats, distribution).pdf(self.x, *param)
+            self._results.set_metric(distribution, "sumsquare_error", np.sum((pdf_fitted - self.y) ** 2))
+            self._results.set_metric(distribution, "kl_div", kl_div(pdf_fitted + eps, self.y + eps))
+        self._fitted_bins = self.bins
+
+    def _store_results(self, results: list[tuple[str, tuple | None, str, dict]]) -> None:
+        """Store the raw results of :meth:`_run` (the PDFs are dropped, see :attr:`fitted_pdf`)."""
+        for distribution, values, status, timings in results:
+            self.timings[distribution] = timings
             if values is not None:
-                (
-                    param,
-                    pdf_fitted,
-                    sq_error,
-                    aic,
-                    bic,
-                    kullback_leibler,
-                    ks_stat,
-                    ks_pval,
-                ) = values
-
-                self.fitted_param[distribution] = param
-                self.fitted_pdf[distribution] = pdf_fitted
-                self._fitted_errors[distribution] = sq_error
-                self._aic[distribution] = aic
-                self._bic[distribution] = bic
-                self._kldiv[distribution] = kullback_leibler
-                self._ks_stat[distribution] = ks_stat
-                self._ks_pval[distribution] = ks_pval
+                param, _, *metrics = values
+                self._results.set(distribution, status, param, metrics)
             else:
-                # Assign infinity for failed fits
-                self._fitted_errors[distribution] = np.inf
-                self._aic[distribution] = np.inf
-                self._bic[distribution] = np.inf
-                self._kldiv[distribution] = np.inf
-                self._ks_stat[distribution] = np.inf
-                self._ks_pval[distribution] = 0.0
-
-        # Create results DataFrame
-        self.df_errors: pd.DataFrame = pd.DataFrame(
-            {
-                "sumsquare_error": self._fitted_errors,
-                "aic": self._aic,
-                "bic": self._bic,
-                "kl_div": self._kldiv,
-                "ks_statistic": self._ks_stat,
-                "ks_pvalue": self._ks_pval,
-            }
-        )
-        self.df_errors.sort_index(inplace=True)
+                self._results.set(distribution, status)
+        self._fitted_range = (self._xmin, self._xmax)
+        self._fitted_bins = self.bins
+
+    def _update_df_errors(self) -> None:
+        """Build :attr:`df_errors` from the results."""
+        self.df_errors: pd.DataFrame = self._results.to_dataframe()
+
+    @property
+    def df_timings(self) -> pd.DataFrame:
+        """Wall and CPU time (seconds) of each stage of the fits, per distribution.
+
+        The stages are ``fit`` (parameter estimation), ``pdf`` (PDF on the
+        histogram, sum of squared errors and KL divergence), ``logpdf``
+        (likelihood, AIC and BIC), ``cdf_check`` and ``ks``. The ``iterations``
+        column holds the number of iterations of the optimizer (missing for
+        closed-form estimators) and ``pid``/``tid`` identify the worker.
+        Distributions killed by the pool have no timings.
+
+        .. versionadded:: 1.9.0
+        """
+        return timings_to_dataframe(self.timings)
+
+    def save_trace(self, filename: str | os.PathLike) -> None:
+        """Save the timings of the last fit as a Chrome trace (JSON).
+
+        The file can be opened with ``chrome://tracing``, https://ui.perfetto.dev
+        or https://www.speedscope.app to see how the fits were scheduled over
+        the workers (see :mod:`fitter.profiling`).
+
+        .. versionadded:: 1.9.0
+        """
+        write_chrome_trace(self.timings, filename)
 
     def plot_pdf(
         self,
@@ -521,6 +1616,8 @@ class Fitter:
             method: Metric to use for ranking distributions ('sumsquare_error', 'aic', 'bic', etc.).
 
         """
+        from matplotlib import pyplot as plt
+
         assert Nbest > 0, "Nbest must be positive"
         Nbest = min(Nbest, len(self.distributions))
 
@@ -591,7 +1688,8 @@ class Fitter:
         Args:
             Nbest: Number of best distributions to include in summary.
             lw: Line width for plots.
-            plot: If True, create histogram and PDF overlay plot.
+            plot: If True, create histogram and PDF overlay plot. If False,
+                matplotlib is not imported.
             method: Metric to use for ranking distributions.
             clf: If True, clear figure before plotting.
 
@@ -600,6 +1698,8 @@ class Fitter:
 
         """
         if plot:
+            from matplotlib import pyplot as plt
+
             if clf:
                 plt.clf()
             self.hist()
@@ -619,7 +1719,7 @@ class Fitter:
         func: Any,
         args: tuple = (),
         kwargs: dict[str, Any] | None = None,
-        timeout: int = 30,
+        timeout: int | None = 30,
     ) -> Any:
         """Execute a function with a timeout limit.
 
@@ -627,7 +1727,8 @@ class Fitter:
             func: Function to execute.
             args: Positional arguments for the function.
             kwargs: Keyword arguments for the function.
-            timeout: Maximum execution time in seconds.
+            timeout: Maximum execution time in seconds. If None, the function
+                is called directly.
 
         Returns:
             Result of the function call.
@@ -635,11 +1736,19 @@ class Fitter:
         Raises:
             TimeoutError: If function execution exceeds timeout.
 
+        Note:
+            The thread running *func* cannot be stopped: on timeout, it keeps
+            running in the background. Use ``fit(prefer="sandbox")`` to kill
+            fits that exceed the timeout.
+
         """
         if kwargs is None:
             kwargs = {}
+        if timeout is None:
+            return func(*args, **kwargs)
         with multiprocessing.pool.ThreadPool(1) as pool:
-            async_result = pool.apply_async(func, args, kwargs)
+            # run in the caller's context, so that np.errstate applies to the fit
+            async_result = pool.apply_async(contextvars.copy_context().run, (func, *args), kwargs)
             return async_result.get(timeout=timeout)
 
 
@@ -0,0 +1,195 @@
+"""Starting points of the numerical fits from moments and quantiles.
+
+Without starting values, :meth:`scipy.stats.rv_continuous.fit` starts the
+optimizer from generic guesses that are often far from the solution, which
+costs many iterations (or a timeout) for heavy-tailed or skewed distributions.
+This module keeps a registry of moment- or quantile-matching guesses. They are
+computed from a :class:`DataSummary`, built once from the sorted data and shared
+by all the distributions::
+
+    >>> summary = DataSummary.from_sorted(np.sort(data))
+    >>> starts = guess_starts(["t", "chi2", "genpareto"], summary)
+    >>> df, loc, scale = starts["t"]
+
+A guess function takes a :class:`DataSummary` and returns the parameters in the
+order used by scipy (shapes, loc, scale), or None when it does not apply. New
+guesses can be added with :func:`register_guess`. Distributions with a
+closed-form estimator (see :mod:`fitter.estimators`) do not need a guess.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+__all__ = ["GUESSES", "DataSummary", "get_guess", "guess_starts", "register_guess"]
+
+_EULER_GAMMA = 0.5772156649015329
+
+
+@dataclass(frozen=True)
+class DataSummary:
+    """Summary statistics of the data used by the guesses"""
+
+    n: int
+    min: float
+    max: float
+    mean: float
+    std: float
+    #: sample skewness (biased)
+    skew: float
+    #: sample excess kurtosis (biased)
+    kurtosis: float
+    median: float
+    #: interquartile range
+    iqr: float
+
+    @classmethod
+    def from_sorted(cls, data: np.ndarray) -> DataSummary:
+        """Compute the summary of sorted data (a single pass for the moments)."""
+        n = len(data)
+        mean = float(np.mean(data))
+        deviations = data - mean
+        m2 = float(np.mean(deviations**2))
+        m3 = float(np.mean(deviations**3))
+        m4 = float(np.mean(deviations**4))
+        q1, median, q3 = (float(data[min(n - 1, int(q * n))]) for q in (0.25, 0.5, 0.75))
+        return cls(
+            n=n,
+            min=float(data[0]),
+            max=float(data[-1]),
+            mean=mean,
+            std=float(np.sqrt(m2)),
+            skew=m3 / m2**1.5 if m2 > 0 else 0.0,
+            kurtosis=m4 / m2**2 - 3 if m2 > 0 else 0.0,
+            median=median,
+            iqr=q3 - q1,
+        )
+
+
+#: registry of starting point guesses, indexed by scipy distribution name
+GUESSES: dict[str, Callable[[DataSummary], tuple | None]] = {}
+
+
+def register_guess(name: str) -> Callable:
+    """Decorator registering a starting point guess for the distribution *name*.
+
+    Args:
+        name: Name of the scipy.stats distribution.
+
+    Returns:
+        Decorator that stores the function in :data:`GUESSES`.
+
+    """
+
+    def decorator(func: Callable[[DataSummary], tuple | None]) -> Callable[[DataSummary], tuple | None]:
+        GUESSES[name] = func
+        return func
+
+    return decorator
+
+
+def get_guess(name: str) -> Callable[[DataSummary], tuple | None] | None:
+    """Return the guess function of the distribution *name* or None if there is none."""
+    return GUESSES.get(name)
+
+
+def guess_starts(distributions: list[str], summary: DataSummary) -> dict[str, tuple]:
+    """Return the starting points of the *distributions* that have a (valid) guess.
+
+    Args:
+        distributions: Names of the distributions.
+        summary: Summary of the data.
+
+    Returns:
+        Dictionary of starting parameters (shapes, loc, scale) indexed by name.
+
+    """
+    starts = {}
+    if not summary.std > 0:
+        return starts
+    for name in distributions:
+        guess = GUESSES.get(name)
+        if guess is None:
+            continue
+        start = guess(summary)
+        if start is not None and np.all(np.isfinite(start)) and start[-1] > 0:
+            starts[name] = tuple(float(value) for value in start)
+    return starts
+
+
+@register_guess("cauchy")
+def _guess_cauchy(s: DataSummary) -> tuple:
+    # quartiles of the Cauchy distribution are loc -/+ scale
+    return s.median, s.iqr / 2
+
+
+@register_guess("hypsecant")
+def _guess_hypsecant(s: DataSummary) -> tuple:
+    return s.median, s.std * 2 / np.pi
+
+
+@register_guess("genextreme")
+def _guess_genextreme(s: DataSummary) -> tuple:
+    # start from the moments of the Gumbel distribution (null shape), mirrored
+    # for left skewed data
+    scale = s.std * np.sqrt(6) / np.pi
+    loc = s.mean - _EULER_GAMMA * scale if s.skew >= 0 else s.mean + _EULER_GAMMA * scale
+    return 0.0, loc, scale
+
+
+@register_guess("t")
+def _guess_t(s: DataSummary) -> tuple:
+    # excess kurtosis of Student's t is 6 / (df - 4); the IQR is robust to the tails
+    df = 4 + 6 / s.kurtosis if s.kurtosis > 0.1 else 60.0
+    return df, s.median, s.iqr / (2 * _t_q75(df))
+
+
+def _t_q75(df: float) -> float:
+    from scipy.stats import t
+
+    return float(t.ppf(0.75, df))
+
+
+@register_guess("chi2")
+def _guess_chi2(s: DataSummary) -> tuple | None:
+    # skewness of chi2 is sqrt(8 / df)
+    if s.skew <= 0:
+        return None
+    df = 8 / s.skew**2
+    scale = s.std / np.sqrt(2 * df)
+    return df, s.mean - df * scale, scale
+
+
+@register_guess("invgauss")
+def _guess_invgauss(s: DataSummary) -> tuple | None:
+    # mean mu * scale, variance mu**3 * scale**2, skewness 3 * sqrt(mu)
+    if s.skew <= 0:
+        return None
+    mu = (s.skew / 3) ** 2
+    scale = s.std / mu**1.5
+    return mu, s.mean - mu * scale, scale
+
+
+@register_guess("genpareto")
+def _guess_genpareto(s: DataSummary) -> tuple:
+    # moments of the excesses over the minimum: mean sigma / (1 - c) and
+    # squared coefficient of variation 1 / (1 - 2c)
+    loc = s.min - 1e-3 * (s.max - s.min)
+    excess = s.mean - loc
+    c = min(0.45, (1 - excess**2 / s.std**2) / 2)
+    return c, loc, excess * (1 - c)
+
+
+@register_guess("beta")
+def _guess_beta(s: DataSummary) -> tuple | None:
+    # moments of the data rescaled to a slightly wider interval than their range
+    margin = 1e-3 * (s.max - s.min)
+    loc, scale = s.min - margin, s.max - s.min + 2 * margin
+    m, v = (s.mean - loc) / scale, (s.std / scale) ** 2
+    common = m * (1 - m) / v - 1
+    if common <= 0:
+        return None
+    return m * common, (1 - m) * common, loc, scale
@@ -1,19 +1,28 @@
-"""Histogram fitting module for Gaussian distributions.
+"""Histogram fitting module for Gaussian distributions and other curves.
 
 This module provides functionality to fit Gaussian distributions to histogram data,
 with support for error estimation through Monte Carlo sampling.
+
+Other families of curves can be fitted: the models of :data:`HISTFIT_MODELS`
+("normal", "lognormal", "gamma" and the two-component Gaussian "mixture") and
+the ones added with :func:`register_model`. A model provides its values and
+their analytic Jacobian for a batch of parameters, which the vectorized
+Levenberg-Marquardt solver of :func:`fit_curves` needs, and a starting point
+computed from the histogram.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 import scipy.optimize  # BUGFIX: Missing import caused runtime error
+import scipy.special
 import scipy.stats
-from matplotlib import pyplot as plt
 
-__all__ = ["HistFit"]
+__all__ = ["HISTFIT_MODELS", "HistFit", "HistModel", "fit_curves", "fit_gaussians", "get_model", "register_model"]
 
 
 class HistFit:
@@ -37,6 +46,10 @@ class HistFit:
         >>> hf.fit(error_rate=0.03, Nfit=20)
         >>> print(hf.mu, hf.sigma, hf.amplitude)
 
+        Headless (no matplotlib), plotting later if needed:
+        >>> hf.fit(error_rate=0.03, Nfit=1000, plot=False)
+        >>> hf.plot()
+
         Using pre-computed histogram:
         >>> Y, X, _ = plt.hist(data, bins=30, density=True)
         >>> hf = HistFit(X=X, Y=Y)
@@ -60,6 +73,7 @@ class HistFit:
         X: np.ndarray | None = None,
         Y: np.ndarray | None = None,
         bins: int | None = None,
+        model: str = "normal",
     ) -> None:
         """Initialize HistFit with either raw data or pre-computed histogram.
 
@@ -68,11 +82,14 @@ class HistFit:
             X: Pre-computed histogram bin edges or centers.
             Y: Pre-computed probability density values.
             bins: Number of bins if data is provided (passed to histogram function).
+            model: Name of the fitted curve (see :data:`HISTFIT_MODELS`).
 
         Raises:
-            ValueError: If neither data nor (X, Y) are provided.
+            ValueError: If neither data nor (X, Y) are provided, or if the model is unknown.
 
+        .. versionchanged:: 1.9.0 add *model*.
         """
+        self.model: HistModel = get_model(model)
         self.data = np.asarray(data) if data is not None else None
         
         if data is not None:
@@ -110,7 +127,14 @@ class HistFit:
             self.guess_std = float(np.sqrt(np.average((self.X - np.average(self.X, weights=self.Y))**2, weights=self.Y)))
             self.guess_amp = 1.0
 
-        self.func = self._func_normal
+        # starting point of all the fits (replicates included)
+        if model == "normal":
+            self.start: tuple = (self.guess_mean, self.guess_std, self.guess_amp)
+        else:
+            start = self.model.guess(self.X, self.Y)
+            if start is None:
+                raise ValueError(f"The {model} model cannot be fitted to this histogram")
+            self.start = tuple(float(value) for value in start)
 
     def fit(
         self,
@@ -119,113 +143,409 @@ class HistFit:
         Nfit: int = 100,
         error_kwargs: dict[str, Any] | None = None,
         fit_kwargs: dict[str, Any] | None = None,
-    ) -> tuple[float, float, float]:
-        """Fit Gaussian distribution to histogram data with error estimation.
+        plot: bool = True,
+        max_workers: int = 1,
+    ) -> tuple[float, ...]:
+        """Fit the model (a Gaussian by default) to histogram data with error estimation.
 
         Performs multiple fits with added noise to estimate parameter uncertainty.
-        Creates two figures: one showing individual fits, another showing uncertainty bands.
+        The histogram is fitted first, from :attr:`start`; its solution is the
+        starting point of the *Nfit* Monte Carlo replicates, which are solved
+        together by a vectorized Levenberg-Marquardt algorithm (see
+        :func:`fit_curves`). Unless *plot* is False, creates two figures with
+        :meth:`plot`: one showing individual fits, another showing uncertainty
+        bands. With *plot* set to False, matplotlib is not imported; the figures
+        can be made later by calling :meth:`plot`.
+
+        The parameters of the replicates are stored in :attr:`replicates` and,
+        for each parameter of the model, in an attribute named after it with an
+        "s" suffix (e.g. :attr:`mus`); their averages are stored in an attribute
+        named after the parameter (e.g. :attr:`mu`).
 
         Args:
-            error_rate: Relative error to add as Gaussian noise (e.g., 0.05 = 5%).
+            error_rate: Standard deviation of the Gaussian noise added to the densities.
             semilogy: If True, use logarithmic y-axis for the plot.
             Nfit: Number of Monte Carlo iterations for error estimation.
             error_kwargs: Plotting kwargs for individual noisy fits (default: thin black transparent lines).
             fit_kwargs: Plotting kwargs for final averaged fit (default: thick red line).
+            plot: If False, only compute the fits (headless mode).
+            max_workers: Number of threads solving chunks of replicates (-1 for all CPUs).
 
         Returns:
-            Tuple of (mu, sigma, amplitude) from the averaged fit.
+            Tuple of the averaged parameters, e.g. (mu, sigma, amplitude) for the Gaussian.
+
+        .. versionchanged:: 1.9.0 the replicates are fitted together; add *plot*
+            and *max_workers*.
+        """
+        # the fit of the histogram is a better start than the guess for all the replicates
+        params, _ = fit_curves(self.X, self.Y, self.start, model=self.model.name)
+        start = tuple(params[0]) if self.model.valid(params).all() else self.start
+
+        # stacked noise of all the replicates
+        self.E: np.ndarray = np.random.normal(0, error_rate, (Nfit, self.N))
+        self.replicates, self.converged = fit_curves(self.X, self.Y + self.E, start, model=self.model.name, max_workers=max_workers)
+        self.fits: np.ndarray = self.model.evaluate(self.X, self.replicates)[0]
+
+        # Compute mean parameters from all fits (numpy vectorized operations)
+        for name, column in zip(self.model.params, self.replicates.T):
+            setattr(self, f"{name}s", column)
+            setattr(self, name, float(np.mean(column)))
+
+        if plot:
+            self.plot(semilogy, error_kwargs, fit_kwargs)
+        return tuple(getattr(self, name) for name in self.model.params)
+
+    def plot(
+        self,
+        semilogy: bool = False,
+        error_kwargs: dict[str, Any] | None = None,
+        fit_kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        """Plot the results of :meth:`fit`: the Monte Carlo fits in figure 1 and the uncertainty bands in figure 2.
+
+        Args:
+            semilogy: If True, use logarithmic y-axis for the fits.
+            error_kwargs: Plotting kwargs for individual noisy fits (default: thin black transparent lines).
+            fit_kwargs: Plotting kwargs for final averaged fit (default: thick red line).
+
+        .. versionadded:: 1.9.0
+        """
+        from matplotlib import pyplot as plt
+
+        plt.figure(1)
+        plt.clf()
+        self.plot_fits(semilogy, error_kwargs, fit_kwargs)
+        plt.figure(2)
+        plt.clf()
+        self.plot_bands(fit_kwargs)
+
+    def plot_fits(
+        self,
+        semilogy: bool = False,
+        error_kwargs: dict[str, Any] | None = None,
+        fit_kwargs: dict[str, Any] | None = None,
+    ) -> None:
+        """Plot the histogram, the Monte Carlo fits and the averaged fit in the current figure.
 
+        See :meth:`plot` for the arguments.
+
+        .. versionadded:: 1.9.0
         """
+        from matplotlib import pyplot as plt
+
         # Handle mutable default arguments (PEP best practice)
         if error_kwargs is None:
             error_kwargs = {"lw": 1, "color": "black", "alpha": 0.2}
         if fit_kwargs is None:
             fit_kwargs = {"lw": 2, "color": "red"}
-        # Pre-allocate arrays for better performance (avoid dynamic resizing)
-        self.mus: np.ndarray = np.zeros(Nfit)
-        self.sigmas: np.ndarray = np.zeros(Nfit)
-        self.amplitudes: np.ndarray = np.zeros(Nfit)
-        self.fits: np.ndarray = np.zeros((Nfit, self.N))
 
-        plt.figure(1)
-        plt.clf()
         # Use width based on actual bin spacing for proper visualization
         bin_width = np.diff(self.X).mean() if len(self.X) > 1 else 0.85
         plt.bar(self.X, self.Y, width=bin_width * 0.85, ec="k")
-
-        for i in range(Nfit):
-            # Add Gaussian noise for error estimation (vectorized for speed)
-            self.E: np.ndarray = np.random.normal(0, error_rate, self.N)
-            
-            # Perform least squares optimization
-            self.result = scipy.optimize.least_squares(
-                self.func,
-                (self.guess_mean, self.guess_std, self.guess_amp),
-            )
-
-            mu, sigma, amplitude = self.result["x"]
-            # Cache the PDF calculation to avoid computing twice
-            fitted_curve = amplitude * scipy.stats.norm.pdf(self.X, mu, sigma)
-            plt.plot(self.X, fitted_curve, **error_kwargs)
-            
-            # Store results in pre-allocated arrays (much faster than append)
-            self.sigmas[i] = sigma
-            self.amplitudes[i] = amplitude
-            self.mus[i] = mu
-            self.fits[i] = fitted_curve
-
-        # Compute mean parameters from all fits (numpy vectorized operations)
-        self.sigma: float = float(np.mean(self.sigmas))
-        self.amplitude: float = float(np.mean(self.amplitudes))
-        self.mu: float = float(np.mean(self.mus))
+        # all the replicates in a single call
+        plt.plot(self.X, self.fits.T, **error_kwargs)
 
         # Plot final averaged fit
-        final_fit = self.amplitude * scipy.stats.norm.pdf(self.X, self.mu, self.sigma)
-        plt.plot(self.X, final_fit, **fit_kwargs)
+        plt.plot(self.X, self._final_fit(), **fit_kwargs)
         if semilogy:
             plt.yscale("log")
         plt.grid(True)
 
-        # Create uncertainty visualization figure
-        plt.figure(2)
-        plt.clf()
-        
+    def plot_bands(self, fit_kwargs: dict[str, Any] | None = None) -> None:
+        """Plot the 1, 2 and 3 sigma bands of the Monte Carlo fits and the averaged fit in the current figure.
+
+        Args:
+            fit_kwargs: Plotting kwargs for final averaged fit (default: thick red line).
+
+        .. versionadded:: 1.9.0
+        """
+        from matplotlib import pyplot as plt
+
+        if fit_kwargs is None:
+            fit_kwargs = {"lw": 2, "color": "red"}
+
         # Compute mean and std across all Monte Carlo fits (vectorized)
         M = np.mean(self.fits, axis=0)
         S = np.std(self.fits, axis=0)
-        
+
         # Plot confidence bands: 3σ (~99.7%), 2σ (~95%), 1σ (~68%)
         plt.fill_between(self.X, M - 3 * S, M + 3 * S, color="gray", alpha=0.3, label="3σ")
         plt.fill_between(self.X, M - 2 * S, M + 2 * S, color="gray", alpha=0.4, label="2σ")
         plt.fill_between(self.X, M - S, M + S, color="gray", alpha=0.5, label="1σ")
-        
-        # Plot final fit line (use cached calculation)
-        plt.plot(self.X, final_fit, **fit_kwargs, label="Mean fit")
+
+        plt.plot(self.X, self._final_fit(), **fit_kwargs, label="Mean fit")
         plt.grid(True)
         plt.legend()
 
-        return self.mu, self.sigma, self.amplitude
+    def _final_fit(self) -> np.ndarray:
+        """Return the averaged fit on the bin centers."""
+        mean = np.array([[getattr(self, name) for name in self.model.params]])
+        return self.model.evaluate(self.X, mean)[0][0]
 
-    def _func_normal(self, param: tuple[float, float, float]) -> np.ndarray:
-        """Objective function for least squares fitting of Gaussian distribution.
 
-        Computes the squared residuals between the fitted Gaussian and the observed
-        histogram data (with added noise for error estimation).
+@dataclass(frozen=True)
+class HistModel:
+    """A family of curves fitted by :class:`HistFit`"""
 
-        Args:
-            param: Tuple of (mu, sigma, amplitude) parameters to optimize.
+    #: name of the model in :data:`HISTFIT_MODELS`
+    name: str
+    #: names of the parameters
+    params: tuple[str, ...]
+    #: function of the points x (length m) and parameters (shape (n, k)) returning
+    #: the curves (shape (n, m)) and their Jacobian (shape (n, m, k))
+    evaluate: Callable[[np.ndarray, np.ndarray], tuple[np.ndarray, np.ndarray]]
+    #: function of a histogram (x, y) returning a starting point
+    guess: Callable[[np.ndarray, np.ndarray], tuple]
+    #: function of the parameters (shape (n, k)) returning the mask of the valid rows
+    valid: Callable[[np.ndarray], np.ndarray]
 
-        Returns:
-            Array of squared residuals for least squares optimization.
 
-        Note:
-            For a normalized Gaussian, amplitude would be 1/(sqrt(2π)·σ),
-            but here we allow it to be a free parameter for flexibility.
+#: registry of the models of :class:`HistFit`, indexed by name
+HISTFIT_MODELS: dict[str, HistModel] = {}
 
-        """
-        mu, sigma, A = param
-        # Vectorized computation (much faster than Python sum/loop)
-        # Returns residual vector for scipy.optimize.least_squares
-        fitted = A * scipy.stats.norm.pdf(self.X, mu, sigma)
-        observed = self.Y + self.E
-        return fitted - observed
+
+def register_model(model: HistModel) -> HistModel:
+    """Add a model to :data:`HISTFIT_MODELS` (replacing any model of the same name).
+
+    Args:
+        model: The model.
+
+    Returns:
+        The model.
+
+    """
+    HISTFIT_MODELS[model.name] = model
+    return model
+
+
+def get_model(name: str) -> HistModel:
+    """Return the model *name* of :data:`HISTFIT_MODELS`.
+
+    Raises:
+        ValueError: If there is no such model.
+
+    """
+    try:
+        return HISTFIT_MODELS[name]
+    except KeyError:
+        raise ValueError(f"Unknown model {name!r}; available models: {', '.join(sorted(HISTFIT_MODELS))}") from None
+
+
+def _moments(x: np.ndarray, y: np.ndarray) -> tuple[float, float, float]:
+    """Return the area, mean and standard deviation of a histogram (negative values ignored)."""
+    weights = np.clip(y, 0, None)
+    width = float(np.mean(np.diff(x))) if len(x) > 1 else 1.0
+    mean = float(np.average(x, weights=weights))
+    std = float(np.sqrt(np.average((x - mean) ** 2, weights=weights)))
+    return float(np.sum(weights)) * width, mean, std
+
+
+def _normal(x: np.ndarray, params: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    mu, sigma, amplitude = params[:, 0:1], params[:, 1:2], params[:, 2:3]
+    z = (x - mu) / sigma
+    pdf = np.exp(-0.5 * z**2) / (np.sqrt(2 * np.pi) * sigma)
+    curve = amplitude * pdf
+    return curve, np.stack([curve * z / sigma, curve * (z**2 - 1) / sigma, pdf], axis=-1)
+
+
+def _guess_normal(x: np.ndarray, y: np.ndarray) -> tuple:
+    area, mean, std = _moments(x, y)
+    return mean, std, area
+
+
+def _lognormal(x: np.ndarray, params: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # density of a variable whose logarithm is normal (mu, sigma); null for x <= 0
+    mu, sigma, amplitude = params[:, 0:1], params[:, 1:2], params[:, 2:3]
+    positive = x > 0
+    log_x = np.log(np.where(positive, x, 1.0))
+    z = (log_x - mu) / sigma
+    pdf = np.where(positive, np.exp(-0.5 * z**2) / (np.sqrt(2 * np.pi) * sigma * np.where(positive, x, 1.0)), 0.0)
+    curve = amplitude * pdf
+    return curve, np.stack([curve * z / sigma, curve * (z**2 - 1) / sigma, pdf], axis=-1)
+
+
+def _guess_lognormal(x: np.ndarray, y: np.ndarray) -> tuple | None:
+    positive = x > 0
+    if not positive.any():
+        return None
+    # moments of log(x), with the probability of each bin as weight
+    _, mean, std = _moments(np.log(x[positive]), y[positive])
+    return mean, std, _moments(x, y)[0]
+
+
+def _gamma(x: np.ndarray, params: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    shape, scale, amplitude = params[:, 0:1], params[:, 1:2], params[:, 2:3]
+    positive = x > 0
+    log_x = np.log(np.where(positive, x, 1.0))
+    log_pdf = (shape - 1) * log_x - x / scale - scipy.special.gammaln(shape) - shape * np.log(scale)
+    pdf = np.where(positive, np.exp(log_pdf), 0.0)
+    curve = amplitude * pdf
+    d_shape = curve * (log_x - scipy.special.digamma(shape) - np.log(scale))
+    d_scale = curve * (x / scale - shape) / scale
+    return curve, np.stack([d_shape, d_scale, pdf], axis=-1)
+
+
+def _guess_gamma(x: np.ndarray, y: np.ndarray) -> tuple | None:
+    area, mean, std = _moments(x, y)
+    if mean <= 0 or std <= 0:
+        return None
+    # moment matching: mean = shape * scale, variance = shape * scale**2
+    return (mean / std) ** 2, std**2 / mean, area
+
+
+def _mixture(x: np.ndarray, params: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    first, first_jacobian = _normal(x, params[:, :3])
+    second, second_jacobian = _normal(x, params[:, 3:])
+    return first + second, np.concatenate([first_jacobian, second_jacobian], axis=-1)
+
+
+def _guess_mixture(x: np.ndarray, y: np.ndarray) -> tuple:
+    # components centered on the quartiles of the histogram
+    area, _, std = _moments(x, y)
+    cdf = np.cumsum(np.clip(y, 0, None))
+    cdf = cdf / cdf[-1]
+    lower, upper = x[np.searchsorted(cdf, 0.25)], x[np.searchsorted(cdf, 0.75)]
+    return lower, std / 2, area / 2, upper, std / 2, area / 2
+
+
+register_model(HistModel("normal", ("mu", "sigma", "amplitude"), _normal, _guess_normal, lambda p: p[:, 1] > 0))
+register_model(HistModel("lognormal", ("mu", "sigma", "amplitude"), _lognormal, _guess_lognormal, lambda p: p[:, 1] > 0))
+register_model(HistModel("gamma", ("shape", "scale", "amplitude"), _gamma, _guess_gamma, lambda p: (p[:, 0] > 0) & (p[:, 1] > 0)))
+register_model(
+    HistModel(
+        "mixture",
+        ("mu1", "sigma1", "amplitude1", "mu2", "sigma2", "amplitude2"),
+        _mixture,
+        _guess_mixture,
+        lambda p: (p[:, 1] > 0) & (p[:, 4] > 0),
+    )
+)
+
+
+def _levenberg_marquardt(
+    model: HistModel, x: np.ndarray, Y: np.ndarray, params: np.ndarray, max_iter: int, ftol: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Least squares fits of the model to each row of *Y*, all at once (see :func:`fit_curves`)."""
+    n, k = params.shape
+    damping = np.full(n, 1e-3)
+    with np.errstate(all="ignore"):
+        curves, jacobian = model.evaluate(x, params)
+    residuals = curves - Y
+    cost = np.sum(residuals**2, axis=1)
+    converged = np.zeros(n, dtype=bool)
+    # rows that cannot improve anymore (damping too large), left unconverged
+    stalled = np.zeros(n, dtype=bool)
+    eye = np.eye(k)
+    for _ in range(max_iter):
+        active = ~(converged | stalled)
+        if not active.any():
+            break
+        J, r, p = jacobian[active], residuals[active], params[active]
+        JTJ = np.einsum("nki,nkj->nij", J, J)
+        JTr = np.einsum("nki,nk->ni", J, r)
+        # Marquardt scaling of the damping by the diagonal of J^T J
+        diagonal = np.maximum(np.einsum("nii->ni", JTJ), 1e-12)
+        lhs = JTJ + damping[active, None, None] * diagonal[:, :, None] * eye
+        with np.errstate(all="ignore"):
+            try:
+                step = np.linalg.solve(lhs, -JTr[..., None])[..., 0]
+            except np.linalg.LinAlgError:
+                step = np.stack([np.linalg.lstsq(a, -b, rcond=None)[0] for a, b in zip(lhs, JTr)])
+            trial = p + step
+            trial_curves, trial_jacobian = model.evaluate(x, trial)
+            trial_residuals = trial_curves - Y[active]
+            trial_cost = np.sum(trial_residuals**2, axis=1)
+        # steps leading to invalid parameters or a worse fit are rejected
+        accept = model.valid(trial) & np.isfinite(trial_cost) & (trial_cost <= cost[active])
+        rows = np.flatnonzero(active)
+        improvement = cost[active] - trial_cost
+        # only accepted steps can end a fit (a rejected step shrinks as the damping grows)
+        small = accept & ((improvement <= ftol * cost[active]) | (np.abs(step) <= ftol * (np.abs(p) + ftol)).all(axis=1))
+        accepted = rows[accept]
+        params[accepted] = trial[accept]
+        curves[accepted] = trial_curves[accept]
+        jacobian[accepted] = trial_jacobian[accept]
+        residuals[accepted] = trial_residuals[accept]
+        cost[accepted] = trial_cost[accept]
+        damping[rows] = np.where(accept, damping[rows] / 10, damping[rows] * 10)
+        converged[rows[small]] = True
+        # no progress possible anymore: stop iterating on these rows
+        stalled[rows[~small & (damping[rows] > 1e12)]] = True
+    return params, converged
+
+
+def fit_curves(
+    x: np.ndarray,
+    Y: np.ndarray,
+    start: tuple,
+    model: str = "normal",
+    max_iter: int = 200,
+    ftol: float = 1e-10,
+    max_workers: int = 1,
+    chunk_size: int = 1000,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Fit a model of :data:`HISTFIT_MODELS` to each row of *Y* by least squares.
+
+    All the rows are solved together by a vectorized Levenberg-Marquardt
+    algorithm with the analytic Jacobian of the model: each iteration costs a few
+    array operations and a batch of k x k linear solves (k parameters), whatever
+    the number of rows. The rows that do not converge within *max_iter*
+    iterations (or stop improving) are fitted again with
+    :func:`scipy.optimize.least_squares`, and are flagged as not converged if
+    this fails too.
+
+    Args:
+        x: Points of the curves (bin centers), of length m.
+        Y: Curves to fit, of shape (n, m).
+        start: Starting point of all the fits.
+        model: Name of the model.
+        max_iter: Maximum number of iterations.
+        ftol: Relative tolerance on the cost and the parameters.
+        max_workers: Number of threads solving chunks of rows (-1 for all CPUs).
+        chunk_size: Number of rows per chunk when *max_workers* is not 1.
+
+    Returns:
+        Tuple (parameters of shape (n, k), convergence flags of shape (n,)).
+
+    .. versionadded:: 1.9.0
+    """
+    hist_model = get_model(model)
+    x = np.asarray(x, dtype=float)
+    Y = np.atleast_2d(np.asarray(Y, dtype=float))
+    params = np.tile(np.asarray(start, dtype=float), (len(Y), 1))
+    if max_workers == 1 or len(Y) <= chunk_size:
+        params, converged = _levenberg_marquardt(hist_model, x, Y, params, max_iter, ftol)
+    else:
+        from joblib import Parallel, delayed
+
+        chunks = range(0, len(Y), chunk_size)
+        # numpy releases the GIL in the batched operations
+        results = Parallel(n_jobs=max_workers, prefer="threads")(
+            delayed(_levenberg_marquardt)(hist_model, x, Y[i : i + chunk_size], params[i : i + chunk_size], max_iter, ftol)
+            for i in chunks
+        )
+        params = np.concatenate([chunk for chunk, _ in results])
+        converged = np.concatenate([chunk for _, chunk in results])
+
+    for row in np.flatnonzero(~converged):
+        with np.errstate(all="ignore"):
+            try:
+                result = scipy.optimize.least_squares(
+                    lambda p, y=Y[row]: hist_model.evaluate(x, p[None])[0][0] - y,
+                    start,
+                    jac=lambda p: hist_model.evaluate(x, p[None])[1][0],
+                )
+            except ValueError:
+                # residuals not finite at the starting point
+                continue
+        params[row] = result.x
+        converged[row] = result.success
+    return params, converged
+
+
+def fit_gaussians(x: np.ndarray, Y: np.ndarray, start: tuple[float, float, float], **kwargs: Any) -> tuple[np.ndarray, np.ndarray]:
+    """Fit ``A * norm.pdf(x, mu, sigma)`` to each row of *Y* (see :func:`fit_curves`).
+
+    .. versionadded:: 1.9.0
+    """
+    return fit_curves(x, Y, start, model="normal", **kwargs)
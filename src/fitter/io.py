@@ -0,0 +1,200 @@
+"""Reading data for the fitter, possibly by chunks.
+
+Supported inputs are, based on the file extension:
+
+- ``.npy`` files, memory-mapped (no copy until the data is used),
+- Parquet (``.parquet``) and Arrow/Feather (``.arrow``, ``.feather``) files,
+  which require the optional :mod:`pyarrow` dependency,
+- raw binary buffers of floats (``.bin``, ``.raw``, ``.dat``), memory-mapped,
+- anything else is read as delimited text without header, with the C parser of
+  pandas (one column only).
+
+:func:`read_column` returns the whole column as a NumPy array while
+:func:`iter_chunks` iterates over it by chunks, for data that do not fit in memory.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+__all__ = ["iter_chunks", "read_column"]
+
+#: extensions of files read as raw binary buffers
+RAW_EXTENSIONS: frozenset[str] = frozenset({".bin", ".raw", ".dat"})
+#: extensions of files read with pyarrow
+ARROW_EXTENSIONS: frozenset[str] = frozenset({".parquet", ".arrow", ".feather"})
+
+
+def _select_column(array: np.ndarray, column: int) -> np.ndarray:
+    """Return the 1-indexed *column* of a 2-D array (1-D arrays are returned as is)."""
+    if array.ndim == 1:
+        return array
+    if not 1 <= column <= array.shape[1]:
+        raise IndexError(f"Column {column} does not exist in the data.")
+    return array[:, column - 1]
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow.feather
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as err:  # pragma: no cover
+        raise ImportError("Reading Parquet/Arrow files requires pyarrow: pip install pyarrow") from err
+    return pyarrow
+
+
+def _arrow_column_index(schema: Any, column: int | str) -> int:
+    """Index of *column* (1-indexed position or name) in an Arrow schema."""
+    if isinstance(column, str):
+        if column not in schema.names:
+            raise IndexError(f"Column {column} does not exist in the data.")
+        return schema.names.index(column)
+    if not 1 <= column <= len(schema.names):
+        raise IndexError(f"Column {column} does not exist in the data.")
+    return column - 1
+
+
+def _check_text_column(path: Path, column: int, delimiter: str) -> None:
+    """Raise IndexError if the first line of a text file has less than *column* fields."""
+    with path.open("r", encoding="utf-8") as handle:
+        n_fields = len(handle.readline().split(delimiter))
+    if not 1 <= column <= n_fields:
+        raise IndexError(f"Column {column} does not exist in the data.")
+
+
+def _check_text_fields(path: Path, column: int, delimiter: str) -> None:
+    """Raise IndexError if a (non-blank) line of a text file has less than *column* fields.
+
+    The CSV reader fills the missing fields of short lines with NaN: this is only
+    called when the column has NaN values.
+    """
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip() and len(line.split(delimiter)) < column:
+                raise IndexError(f"Column {column} does not exist in the data.")
+
+
+def read_column(
+    source: str | os.PathLike,
+    column: int | str = 1,
+    delimiter: str = ",",
+    dtype: str | np.dtype = "float64",
+) -> np.ndarray:
+    """Read one column of a data file as a 1-D array.
+
+    ``.npy`` and raw binary files are memory-mapped: no data is read until used.
+    Other formats are read with vectorized readers and a single copy.
+
+    Args:
+        source: File name. The format is deduced from the extension (see module documentation).
+        column: Column to read, 1-indexed (or a column name for Parquet/Arrow files).
+            Ignored for 1-D ``.npy`` and raw binary files.
+        delimiter: Column delimiter of text files.
+        dtype: Data type of raw binary files.
+
+    Returns:
+        The values of the column.
+
+    Raises:
+        IndexError: If the column does not exist (in any line of text files).
+        ValueError: If the values cannot be converted to floats.
+        TypeError: If *dtype* is not a valid data type.
+
+    """
+    path = Path(source)
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        return _select_column(np.load(path, mmap_mode="r"), column)
+    if suffix in RAW_EXTENSIONS:
+        return np.memmap(path, dtype=dtype, mode="r")
+    if suffix in ARROW_EXTENSIONS:
+        pa = _import_pyarrow()
+        if suffix == ".parquet":
+            parquet_file = pa.parquet.ParquetFile(path)
+            name = parquet_file.schema_arrow.names[_arrow_column_index(parquet_file.schema_arrow, column)]
+            array = parquet_file.read(columns=[name]).column(0)
+        else:
+            table = pa.feather.read_table(path, memory_map=True)
+            array = table.column(_arrow_column_index(table.schema, column))
+        return array.to_numpy().astype(float, copy=False)
+
+    import pandas as pd
+
+    _check_text_column(path, column, delimiter)
+    frame = pd.read_csv(path, sep=delimiter, header=None, usecols=[column - 1], dtype=float, engine="c")
+    values = frame.iloc[:, 0].to_numpy()
+    if np.isnan(values).any():
+        _check_text_fields(path, column, delimiter)
+    return values
+
+
+def iter_chunks(
+    source: str | os.PathLike | Iterable,
+    chunksize: int = 1_000_000,
+    column: int | str = 1,
+    delimiter: str = ",",
+    dtype: str | np.dtype = "float64",
+) -> Iterator[np.ndarray]:
+    """Iterate over the data of *source* by chunks of float values.
+
+    Args:
+        source: A file name (see :func:`read_column`) or an iterable of array-like chunks.
+        chunksize: Number of values per chunk when reading a file.
+        column: Column to read (1-indexed, or a name for Parquet/Arrow files).
+        delimiter: Column delimiter of text files.
+        dtype: Data type of raw binary files.
+
+    Yields:
+        1-D float arrays.
+
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        for chunk in source:
+            yield np.asarray(chunk, dtype=float).ravel()
+        return
+
+    path = Path(source)
+    suffix = path.suffix.lower()
+    if suffix == ".npy" or suffix in RAW_EXTENSIONS:
+        array = read_column(path, column=column, dtype=dtype)
+        for start in range(0, len(array), chunksize):
+            yield np.asarray(array[start : start + chunksize], dtype=float)
+        return
+
+    if suffix == ".parquet":
+        pa = _import_pyarrow()
+        parquet_file = pa.parquet.ParquetFile(path)
+        name = parquet_file.schema_arrow.names[_arrow_column_index(parquet_file.schema_arrow, column)]
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=[name]):
+            yield batch.column(0).to_numpy().astype(float, copy=False)
+        return
+    if suffix in ARROW_EXTENSIONS:
+        pa = _import_pyarrow()
+        # record batches of the memory-mapped file, converted one at a time
+        with pa.memory_map(str(path)) as source_file:
+            reader = pa.ipc.open_file(source_file)
+            index = _arrow_column_index(reader.schema, column)
+            for i in range(reader.num_record_batches):
+                values = reader.get_batch(i).column(index).to_numpy(zero_copy_only=False).astype(float, copy=False)
+                for start in range(0, len(values), chunksize):
+                    yield values[start : start + chunksize]
+        return
+
+    import pandas as pd
+
+    _check_text_column(path, column, delimiter)
+    reader = pd.read_csv(path, sep=delimiter, header=None, usecols=[column - 1], dtype=float, chunksize=chunksize)
+    checked = False
+    with reader:
+        for frame in reader:
+            values = frame.iloc[:, 0].to_numpy()
+            if not checked and np.isnan(values).any():
+                _check_text_fields(path, column, delimiter)
+                checked = True
+            yield values
@@ -22,7 +22,6 @@ allowing users to fit various statistical distributions to their data.
 
 from __future__ import annotations
 
-import csv
 import sys
 from pathlib import Path
 from typing import Any
@@ -79,6 +78,13 @@ def main() -> None:  # pragma: no cover
     show_default=True,
     help="Column delimiter (comma by default)",
 )
+@click.option(
+    "--dtype",
+    type=click.STRING,
+    default="float64",
+    show_default=True,
+    help="Data type of raw binary input files (.bin, .raw, .dat)",
+)
 @click.option(
     "--distributions",
     type=click.STRING,
@@ -105,6 +111,12 @@ def main() -> None:  # pragma: no cover
     show_default=True,
     help="Enable verbose output",
 )
+@click.option(
+    "--plot/--no-plot",
+    default=True,
+    show_default=True,
+    help="Save a figure of the best fits (--no-plot skips matplotlib entirely)",
+)
 @click.option(
     "--output-image",
     type=click.STRING,
@@ -113,11 +125,11 @@ def main() -> None:  # pragma: no cover
     help="Output image filename (png, jpg, svg, or pdf)",
 )
 def fitdist(**kwargs: Any) -> None:
-    """Fit statistical distributions to data from a CSV file.
+    """Fit statistical distributions to data from a CSV, NPY, Parquet, Arrow or raw binary file.
 
     Args:
         **kwargs: Command-line arguments including filename, column_number,
-                  delimiter, distributions, tag, progress, verbose, and output_image.
+                  delimiter, dtype, distributions, tag, progress, verbose, plot and output_image.
 
     Raises:
         FileNotFoundError: If the input file does not exist.
@@ -126,8 +138,6 @@ def fitdist(**kwargs: Any) -> None:
         ValueError: If data cannot be converted to float.
 
     """
-    from matplotlib.pyplot import savefig  # Lazy import for performance
-
     filename = Path(kwargs["filename"])
     
     # Validate input file exists
@@ -138,34 +148,28 @@ def fitdist(**kwargs: Any) -> None:
     col = kwargs["column_number"]
     delimiter = kwargs["delimiter"]
     
-    # Read CSV data - optimized with buffered reading
+    # Read the data column: .npy and raw binary files are memory-mapped, Parquet/Arrow
+    # files are read with pyarrow and text files with a vectorized CSV reader
+    from fitter.io import read_column
+
     try:
-        with filename.open("r", encoding="utf-8") as csvfile:
-            reader = csv.reader(csvfile, delimiter=delimiter)
-            # Pre-allocate list for better performance
-            data = []
-            for row in reader:
-                try:
-                    data.append(float(row[col - 1]))
-                except (IndexError, ValueError) as e:
-                    if isinstance(e, IndexError):
-                        click.echo(
-                            f"Error: Column {col} does not exist in the data.",
-                            err=True,
-                        )
-                    else:
-                        click.echo(
-                            f"Error: Cannot convert value to float in column {col}.",
-                            err=True,
-                        )
-                    sys.exit(1)
-    except OSError as e:
+        data = read_column(filename, column=col, delimiter=delimiter, dtype=kwargs["dtype"])
+    except IndexError:
+        click.echo(f"Error: Column {col} does not exist in the data.", err=True)
+        sys.exit(1)
+    except ValueError:
+        click.echo(f"Error: Cannot convert value to float in column {col}.", err=True)
+        sys.exit(1)
+    except TypeError:
+        click.echo(f"Error: Invalid data type '{kwargs['dtype']}'.", err=True)
+        sys.exit(1)
+    except (OSError, ImportError) as e:
         click.echo(f"Error reading file: {e}", err=True)
         sys.exit(1)
 
     # Validate output extension - use pathlib for robust path handling
     outfile = Path(kwargs["output_image"])
-    if outfile.suffix.lstrip(".") not in VALID_IMAGE_EXTENSIONS:
+    if kwargs["plot"] and outfile.suffix.lstrip(".") not in VALID_IMAGE_EXTENSIONS:
         extensions = ", ".join(sorted(VALID_IMAGE_EXTENSIONS))
         click.echo(
             f"Error: Output file must have one of these extensions: {extensions}",
@@ -189,15 +193,18 @@ def fitdist(**kwargs: Any) -> None:
     
     fit = Fitter(data, distributions=distributions)
     fit.fit(progress=progress)
-    fit.summary()
+    fit.summary(plot=kwargs["plot"])
 
     if verbose:
         click.echo()
 
     # Save output image
-    if verbose:
-        click.echo(f"Saved image in {outfile}; use --output-image to change the name")
-    savefig(outfile, dpi=200)  # Use Path object directly
+    if kwargs["plot"]:
+        from matplotlib.pyplot import savefig  # Lazy import for performance
+
+        if verbose:
+            click.echo(f"Saved image in {outfile}; use --output-image to change the name")
+        savefig(outfile, dpi=200)  # Use Path object directly
 
     # Extract best fit results - avoid multiple list() conversions
     best = fit.get_best()
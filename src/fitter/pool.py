@@ -0,0 +1,337 @@
+#  This file is part of the fitter software
+#
+#  Copyright (c) 2014-2025
+#
+#  File author(s): Thomas Cokelaer <cokelaer@gmail.com>
+#
+#  Distributed under the GPLv3 License.
+#  See accompanying file LICENSE.txt or copy at
+#      http://www.gnu.org/licenses/gpl-3.0.html
+#
+#  source: https://github.com/cokelaer/fitter
+#  Documentation: http://packages.python.org/fitter
+#  Package: http://pypi.python.org/fitter
+#
+##############################################################################
+"""Supervised pool of worker processes with hard timeouts.
+
+Timeouts implemented with threads (see :meth:`fitter.Fitter._with_timeout`) only
+stop *waiting* for a result: the computation keeps running in the background and
+holds a CPU until the process exits. The :class:`FitPool` defined here runs each
+task in a dedicated worker process instead. When a task overruns its timeout,
+the worker is killed and replaced by a fresh one, so that the CPU is released
+immediately.
+
+Workers are long-lived: the same pool can be shared by many :class:`~fitter.Fitter`
+instances and calls to :meth:`~fitter.Fitter.fit`. Large arrays are published once
+with :meth:`FitPool.share` as memory-mapped files (in ``/dev/shm`` when available)
+and the workers attach to them without copying, instead of receiving a pickled
+copy of the data with every task.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from typing import Any
+
+import numpy as np
+
+__all__ = ["FitPool", "SharedArray"]
+
+
+@dataclass(frozen=True)
+class SharedArray:
+    """Handle on an array published with :meth:`FitPool.share`.
+
+    The handle is cheap to pickle. Workers of the pool replace it by a read-only
+    memory-mapped view of the array before calling the task function.
+    """
+
+    filename: str
+
+
+def _worker_loop(conn: Connection) -> None:
+    """Main loop of a worker process: run tasks received on *conn* until told to stop."""
+    # arrays attached by the previous task; kept while tasks keep using them
+    attached: dict[str, np.ndarray] = {}
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+        index, func, args = message
+        filenames = {arg.filename for arg in args if isinstance(arg, SharedArray)}
+        attached = {name: array for name, array in attached.items() if name in filenames}
+        try:
+            for name in filenames - set(attached):
+                attached[name] = np.load(name, mmap_mode="r")
+            args = tuple(attached[arg.filename] if isinstance(arg, SharedArray) else arg for arg in args)
+            reply = (index, "success", func(*args))
+        except Exception as err:
+            reply = (index, "failed", f"{type(err).__name__}: {err}")
+        conn.send(reply)
+
+
+class _Worker:
+    """A worker process and the parent end of its pipe."""
+
+    def __init__(self, context: Any) -> None:
+        self.conn, child_conn = context.Pipe(duplex=True)
+        self.process = context.Process(target=_worker_loop, args=(child_conn,), name="FitPoolWorker", daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def stop(self) -> None:
+        """Ask the worker to exit and wait for it."""
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():  # pragma: no cover
+            self.kill()
+        self.conn.close()
+
+    def kill(self) -> None:
+        """Kill the worker immediately, whatever it is doing."""
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class FitPool:
+    """Pool of worker processes that kills tasks running longer than a timeout.
+
+    Workers are started lazily (up to *max_workers*) and are reused from one call
+    to another until :meth:`close` is called. A task that exceeds its timeout is
+    reported with the ``"timeout"`` status; its worker is killed and recycled.
+
+    ::
+
+        >>> import time
+        >>> from fitter import FitPool
+        >>> with FitPool(max_workers=2) as pool:
+        ...     results = sorted(pool.imap_unordered(time.sleep, [(0,), (60,)], timeout=1))
+        >>> [status for _, status, _ in results]
+        ['success', 'timeout']
+
+    :attr:`n_killed` counts the workers killed since the pool was created.
+
+    A pool is meant to be long-lived and shared, e.g. in a service fitting many
+    data sets back to back::
+
+        pool = FitPool(max_workers=4)
+        for data in datasets:
+            f = Fitter(data)
+            f.fit(pool=pool)
+        pool.close()
+
+    .. note:: Workers are started with the default start method of the platform
+        ('fork' on Linux before Python 3.14). Forking a process that runs
+        other threads (e.g. a pool shared by several threads, or used by
+        :meth:`~fitter.Fitter.iter_fit_async`) may deadlock, and Python 3.12+
+        warns about it. Such programs can pass ``context="forkserver"`` or
+        ``"spawn"``; the workers then import the main module of the program,
+        whose code must be guarded by ``if __name__ == "__main__":``.
+    """
+
+    def __init__(self, max_workers: int = -1, context: str | None = None, max_nbytes: int = 1_000_000) -> None:
+        """.. rubric:: Constructor
+
+        :param int max_workers: maximum number of worker processes (-1 for all CPUs).
+        :param str context: multiprocessing start method ('fork', 'spawn',
+            'forkserver'). If None, use the platform default (see the note on
+            threads above).
+        :param int max_nbytes: arrays larger than this are published with
+            :meth:`share` by :meth:`fitter.Fitter.fit` rather than sent to every task.
+        """
+        if max_workers is None or max_workers < 1:
+            max_workers = os.cpu_count() or 1
+        self.max_workers: int = max_workers
+        self.max_nbytes: int = max_nbytes
+        self._context = multiprocessing.get_context(context)
+        self._workers: list[_Worker] = []
+        self._idle: list[_Worker] = []
+        # guards the lists of workers; notified when a worker becomes idle
+        self._lock = threading.Condition()
+        self._tmpdir: str | None = None
+        self.n_killed: int = 0
+
+    def __enter__(self) -> FitPool:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop all worker processes and remove shared arrays. The pool can still be used afterwards."""
+        with self._lock:
+            for worker in self._workers:
+                worker.stop()
+            self._workers = []
+            self._idle = []
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+
+    def share(self, array: np.ndarray) -> SharedArray:
+        """Publish an array once for all the workers of the pool.
+
+        The array is written to a memory-mapped file (in ``/dev/shm`` when
+        available, so that it stays in RAM). Tasks receiving the returned handle as
+        argument get a read-only view on that file.
+
+        Args:
+            array: Array to publish.
+
+        Returns:
+            Picklable handle to pass to :meth:`imap_unordered` tasks. Call
+            :meth:`release` once it is not needed anymore.
+
+        """
+        with self._lock:
+            if self._tmpdir is None:
+                self._tmpdir = tempfile.mkdtemp(prefix="fitter-", dir="/dev/shm" if os.path.isdir("/dev/shm") else None)
+        filename = os.path.join(self._tmpdir, f"{uuid.uuid4().hex}.npy")
+        np.save(filename, np.ascontiguousarray(array))
+        return SharedArray(filename)
+
+    def release(self, shared: SharedArray) -> None:
+        """Remove an array published with :meth:`share`."""
+        try:
+            os.remove(shared.filename)
+        except FileNotFoundError:  # pragma: no cover
+            pass
+
+    def _acquire(self, block: bool) -> _Worker | None:
+        """Take an idle worker, starting a new one if possible.
+
+        If all the workers are busy, wait for one if *block* is True, return None otherwise.
+        """
+        with self._lock:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._workers) < self.max_workers:
+                    worker = _Worker(self._context)
+                    self._workers.append(worker)
+                    return worker
+                if not block:
+                    return None
+                self._lock.wait()
+
+    def _give_back(self, worker: _Worker) -> None:
+        """Return a worker taken with :meth:`_acquire`."""
+        with self._lock:
+            self._idle.append(worker)
+            self._lock.notify()
+
+    def _recycle(self, worker: _Worker) -> _Worker:
+        """Kill a worker and replace it by a fresh one."""
+        worker.kill()
+        new = _Worker(self._context)
+        with self._lock:
+            self.n_killed += 1
+            self._workers[self._workers.index(worker)] = new
+        return new
+
+    def imap_unordered(
+        self,
+        func: Callable,
+        tasks: Iterable[tuple],
+        timeout: float | None = None,
+        stop: threading.Event | None = None,
+    ) -> Iterator[tuple[int, str, Any]]:
+        """Run ``func(*args)`` for each *args* in *tasks*, yielding results as they complete.
+
+        Tasks are consumed lazily, only when a worker is free.
+
+        Args:
+            func: Picklable function to run in the workers.
+            tasks: Iterable of argument tuples. :class:`SharedArray` arguments are
+                replaced by the corresponding arrays in the workers.
+            timeout: Maximum time (seconds) allowed for each task. None means no limit.
+            stop: Event that ends the iteration (and kills the running tasks) when
+                set, e.g. from another thread.
+
+        Yields:
+            Tuples (index, status, result) where index is the position of the task in
+            *tasks* and status is ``"success"``, ``"failed"`` (result is then the error
+            message) or ``"timeout"`` (result is None).
+
+        Note:
+            If the iteration is stopped early, the tasks still running are killed.
+            Several threads may iterate over the same pool at the same time: the
+            workers are then shared between them.
+
+        """
+        tasks = enumerate(tasks)
+        busy: dict[_Worker, tuple[int, float | None]] = {}
+        exhausted = False
+        try:
+            while True:
+                if stop is not None and stop.is_set():
+                    return
+                while not exhausted:
+                    # only wait for a worker (used by another thread) if none is running our tasks
+                    worker = self._acquire(block=not busy)
+                    if worker is None:
+                        break
+                    try:
+                        index, args = next(tasks)
+                    except StopIteration:
+                        exhausted = True
+                        self._give_back(worker)
+                        break
+                    try:
+                        worker.conn.send((index, func, args))
+                    except OSError:
+                        # the worker died while idle: replace it
+                        worker = self._recycle(worker)
+                        worker.conn.send((index, func, args))
+                    busy[worker] = (index, None if timeout is None else time.monotonic() + timeout)
+
+                if not busy:
+                    return
+
+                deadlines = [deadline for _, deadline in busy.values() if deadline is not None]
+                wait_time = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                if not exhausted and len(busy) < self.max_workers:
+                    # workers used by other threads may become idle meanwhile
+                    wait_time = 0.05 if wait_time is None else min(wait_time, 0.05)
+                if stop is not None:
+                    wait_time = 0.1 if wait_time is None else min(wait_time, 0.1)
+                ready = wait([worker.conn for worker in busy], timeout=wait_time)
+
+                for worker in [worker for worker in busy if worker.conn in ready]:
+                    index, _ = busy.pop(worker)
+                    try:
+                        _, status, result = worker.conn.recv()
+                    except (EOFError, OSError):
+                        # the worker died (e.g., segmentation fault or out of memory)
+                        worker = self._recycle(worker)
+                        status, result = "failed", "worker process died"
+                    self._give_back(worker)
+                    yield index, status, result
+
+                now = time.monotonic()
+                for worker, (index, deadline) in list(busy.items()):
+                    if deadline is not None and now >= deadline:
+                        del busy[worker]
+                        self._give_back(self._recycle(worker))
+                        yield index, "timeout", None
+        finally:
+            # results of the remaining tasks are not wanted anymore
+            for worker in busy:
+                self._give_back(self._recycle(worker))
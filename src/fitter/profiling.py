@@ -0,0 +1,127 @@
+"""Timing of the fitting stages.
+
+Each fit run by :class:`~fitter.Fitter` records the wall and CPU time of its
+stages (``fit``, ``pdf``, ``logpdf``, ``cdf_check`` and ``ks``), the number of
+iterations of the optimizer and the process/thread that ran it. They are
+available as a DataFrame in :attr:`fitter.Fitter.df_timings` and can be exported
+in the Chrome trace event format, readable by ``chrome://tracing``, Perfetto or
+speedscope, to see how the fits were scheduled over the workers::
+
+    f = Fitter(data)
+    f.fit()
+    f.df_timings.sort_values("total_wall")
+    f.save_trace("fit.json")
+
+The time spent outside of the stages (pickling, dispatching the tasks, waiting
+for a worker) shows as gaps between fits in the trace.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+__all__ = ["StageTimer", "timings_to_dataframe", "write_chrome_trace"]
+
+
+class StageTimer:
+    """Record the wall and CPU time of the successive stages of a fit
+
+    ::
+
+        >>> timer = StageTimer()
+        >>> with timer("fit"):
+        ...     param = dist.fit(data)
+        >>> timer.to_dict()
+
+    CPU times are those of the whole process, so they include other threads when
+    fits run in threads.
+    """
+
+    def __init__(self) -> None:
+        """.. rubric:: Constructor"""
+        #: list of (stage, start timestamp, wall time, CPU time)
+        self.stages: list[tuple[str, float, float, float]] = []
+        #: number of iterations of the optimizer, if any
+        self.iterations: int | None = None
+
+    @contextlib.contextmanager
+    def __call__(self, stage: str) -> Iterator[None]:
+        start, wall, cpu = time.time(), time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.stages.append((stage, start, time.perf_counter() - wall, time.process_time() - cpu))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the timings as a picklable dictionary."""
+        return {
+            "pid": os.getpid(),
+            "tid": threading.get_native_id(),
+            "iterations": self.iterations,
+            "stages": list(self.stages),
+        }
+
+
+def timings_to_dataframe(timings: dict[str, dict[str, Any]]) -> Any:
+    """Convert timings (indexed by distribution) to a DataFrame.
+
+    Args:
+        timings: Dictionary of :meth:`StageTimer.to_dict` results.
+
+    Returns:
+        DataFrame with one row per distribution and the columns ``<stage>_wall``,
+        ``<stage>_cpu`` (seconds), ``total_wall``, ``total_cpu``, ``iterations``,
+        ``pid`` and ``tid``.
+
+    """
+    import pandas as pd
+
+    rows = {}
+    for name, timing in timings.items():
+        row: dict[str, Any] = {}
+        for stage, _, wall, cpu in timing.get("stages", []):
+            row[f"{stage}_wall"] = wall
+            row[f"{stage}_cpu"] = cpu
+        row["total_wall"] = sum(stage[2] for stage in timing.get("stages", []))
+        row["total_cpu"] = sum(stage[3] for stage in timing.get("stages", []))
+        row["iterations"] = timing.get("iterations")
+        row["pid"] = timing.get("pid")
+        row["tid"] = timing.get("tid")
+        rows[name] = row
+    return pd.DataFrame.from_dict(rows, orient="index").sort_index()
+
+
+def write_chrome_trace(timings: dict[str, dict[str, Any]], filename: str | os.PathLike) -> None:
+    """Save timings in the Chrome trace event format.
+
+    Each fit is a slice on the track of the process/thread that ran it, with its
+    stages as nested slices.
+
+    Args:
+        timings: Dictionary of :meth:`StageTimer.to_dict` results, indexed by distribution.
+        filename: Output JSON file.
+
+    """
+    events = []
+    for name, timing in timings.items():
+        stages = timing.get("stages", [])
+        if not stages:
+            continue
+        common = {"pid": timing["pid"], "tid": timing["tid"], "ph": "X"}
+        start = min(stage[1] for stage in stages)
+        end = max(stage[1] + stage[2] for stage in stages)
+        events.append(
+            {**common, "name": name, "cat": "fit", "ts": start * 1e6, "dur": (end - start) * 1e6, "args": {"iterations": timing.get("iterations")}}
+        )
+        for stage, stage_start, wall, cpu in stages:
+            events.append(
+                {**common, "name": stage, "cat": "stage", "ts": stage_start * 1e6, "dur": wall * 1e6, "args": {"distribution": name, "cpu": cpu}}
+            )
+    with open(filename, "w") as handle:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, handle)
@@ -0,0 +1,227 @@
+"""Compact storage of the results of a fit.
+
+:class:`ResultTable` keeps the status, metrics and parameters of all the
+distributions fitted by a :class:`~fitter.Fitter` in a few NumPy arrays (one
+row per distribution) instead of one dictionary per quantity:
+
+- the status as a small integer code (see :data:`STATUSES`),
+- the goodness-of-fit metrics in a float array (see :data:`METRICS`),
+- the parameters in a float array padded with NaN.
+
+The dictionaries of the :class:`~fitter.Fitter` (:attr:`~fitter.Fitter.fit_status`,
+:attr:`~fitter.Fitter.fitted_param` and :attr:`~fitter.Fitter.fitted_pdf`) are
+read-only views on the table. The PDFs are not stored: :class:`PDFView` computes
+them on the current histogram when they are accessed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = ["METRICS", "STATUSES", "PDFView", "ParamView", "ResultTable", "StatusView"]
+
+#: goodness-of-fit metrics, in the order of the columns of :attr:`ResultTable.metrics`
+METRICS = ("sumsquare_error", "aic", "bic", "kl_div", "ks_statistic", "ks_pvalue")
+
+#: outcomes of a fit, indexed by their code in :attr:`ResultTable.status`
+STATUSES = ("success", "failed", "timeout", "screened", "pruned", "skipped")
+
+_STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+# metrics of the distributions without a successful fit
+_FAILED_METRICS = (np.inf, np.inf, np.inf, np.inf, np.inf, 0.0)
+
+
+class ResultTable:
+    """Status, metrics and parameters of fitted distributions, one row per distribution
+
+    ::
+
+        >>> table = ResultTable()
+        >>> table.set("norm", "success", (0.0, 1.0), (0.01, 10.0, 12.0, 0.1, 0.02, 0.9))
+        >>> table.set("cauchy", "timeout")
+        >>> table.param("norm"), table.status_of("cauchy")
+        ((0.0, 1.0), 'timeout')
+
+    The arrays grow (by doubling) as distributions are added; removed rows are
+    replaced by the last one.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        """.. rubric:: Constructor
+
+        :param int capacity: initial number of rows.
+        """
+        #: row of each distribution
+        self.index: dict[str, int] = {}
+        #: distribution of each row
+        self.names: list[str] = []
+        #: status code of each row (see :data:`STATUSES`)
+        self.status = np.zeros(capacity, dtype=np.uint8)
+        #: metrics of each row (see :data:`METRICS`)
+        self.metrics = np.empty((capacity, len(METRICS)))
+        #: parameters of each row, padded with NaN
+        self.params = np.full((capacity, 0), np.nan)
+        #: number of parameters of each row (-1 if the fit has no parameters)
+        self.n_params = np.full(capacity, -1, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.index
+
+    def _row(self, name: str) -> int:
+        """Return the row of *name*, adding one if needed."""
+        row = self.index.get(name)
+        if row is not None:
+            return row
+        row = len(self.names)
+        if row == len(self.status):
+            capacity = 2 * row
+            self.status = np.resize(self.status, capacity)
+            self.metrics = np.resize(self.metrics, (capacity, len(METRICS)))
+            self.params = np.vstack([self.params, np.full((capacity - row, self.params.shape[1]), np.nan)])
+            self.n_params = np.resize(self.n_params, capacity)
+        self.index[name] = row
+        self.names.append(name)
+        return row
+
+    def set(self, name: str, status: str, param: tuple | None = None, metrics: tuple | None = None) -> None:
+        """Store the result of a fit.
+
+        Args:
+            name: Name of the distribution.
+            status: Outcome of the fit (see :data:`STATUSES`).
+            param: Fitted parameters, or None if the fit did not succeed.
+            metrics: Metrics in the order of :data:`METRICS`. If None, the metrics
+                of a failed fit (infinite errors and null p-value) are used.
+
+        """
+        row = self._row(name)
+        self.status[row] = _STATUS_CODES[status]
+        self.metrics[row] = _FAILED_METRICS if metrics is None else metrics
+        if param is None:
+            self.n_params[row] = -1
+            self.params[row] = np.nan
+            return
+        k = len(param)
+        if k > self.params.shape[1]:
+            padding = np.full((len(self.params), k - self.params.shape[1]), np.nan)
+            self.params = np.hstack([self.params, padding])
+        self.params[row] = np.nan
+        self.params[row, :k] = param
+        self.n_params[row] = k
+
+    def set_metric(self, name: str, metric: str, value: float) -> None:
+        """Change one metric of the distribution *name*."""
+        self.metrics[self.index[name], METRICS.index(metric)] = value
+
+    def remove(self, name: str) -> None:
+        """Remove the row of *name*, if any."""
+        row = self.index.pop(name, None)
+        if row is None:
+            return
+        last = len(self.names) - 1
+        if row != last:
+            moved = self.names[last]
+            self.names[row] = moved
+            self.index[moved] = row
+            for column in (self.status, self.metrics, self.params, self.n_params):
+                column[row] = column[last]
+        self.names.pop()
+        self.n_params[last] = -1
+
+    def status_of(self, name: str) -> str:
+        """Return the status of the distribution *name*."""
+        return STATUSES[self.status[self.index[name]]]
+
+    def param(self, name: str) -> tuple | None:
+        """Return the parameters of the distribution *name*, or None if it has none."""
+        row = self.index[name]
+        k = self.n_params[row]
+        return None if k < 0 else tuple(float(value) for value in self.params[row, :k])
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Return the metrics as a DataFrame indexed by distribution (sorted)."""
+        import pandas as pd
+
+        n = len(self.names)
+        return pd.DataFrame(self.metrics[:n].copy(), index=pd.Index(self.names, dtype=object), columns=list(METRICS)).sort_index()
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the arrays (bytes)."""
+        return sum(column.nbytes for column in (self.status, self.metrics, self.params, self.n_params))
+
+
+class StatusView(Mapping):
+    """Read-only mapping of the status of each distribution of a :class:`ResultTable`"""
+
+    def __init__(self, table: ResultTable) -> None:
+        self._table = table
+
+    def __getitem__(self, name: str) -> str:
+        if name not in self._table:
+            raise KeyError(name)
+        return self._table.status_of(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._table.names))
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class ParamView(Mapping):
+    """Read-only mapping of the parameters of the distributions of a :class:`ResultTable` that have some"""
+
+    def __init__(self, table: ResultTable) -> None:
+        self._table = table
+
+    def __getitem__(self, name: str) -> tuple:
+        param = self._table.param(name) if name in self._table else None
+        if param is None:
+            raise KeyError(name)
+        return param
+
+    def __iter__(self) -> Iterator[str]:
+        table = self._table
+        return iter([name for name, row in table.index.items() if table.n_params[row] >= 0])
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._table.n_params[: len(self._table)] >= 0))
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class PDFView(ParamView):
+    """Read-only mapping of the PDFs of the fitted distributions, computed when accessed
+
+    :param table: results of the fits.
+    :param x: function returning the points where the PDFs are evaluated (e.g.
+        the current bin centers).
+    """
+
+    def __init__(self, table: ResultTable, x: Callable[[], np.ndarray]) -> None:
+        super().__init__(table)
+        self._x = x
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        import scipy.stats
+
+        param = super().__getitem__(name)
+        return getattr(scipy.stats, name).pdf(self._x(), *param)
+
+    def __repr__(self) -> str:
+        return f"PDFView({list(self)})"
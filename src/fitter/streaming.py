@@ -0,0 +1,189 @@
+"""One-pass summaries of data streams.
+
+:class:`StreamSummary` accumulates, chunk after chunk, everything the
+:class:`~fitter.Fitter` needs from data that may not fit in memory:
+
+- the minimum, maximum and first four moments (merged with the pairwise formulas
+  of Chan et al. and Pébay),
+- a fine histogram whose range grows with the data (the bin width doubles when
+  a chunk falls outside of the current range), from which histograms with any
+  number of bins over any range can be derived,
+- a uniform random sample of bounded size (reservoir sampling), used for the
+  likelihood-based fits and metrics.
+
+Memory usage only depends on the reservoir size and histogram resolution, not
+on the size of the stream.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+__all__ = ["StreamSummary"]
+
+
+class StreamSummary:
+    """Accumulate summary statistics, histogram and a reservoir sample of a stream
+
+    ::
+
+        >>> summary = StreamSummary(sample_size=10000)
+        >>> for chunk in chunks:
+        ...     summary.update(chunk)
+        >>> summary.n, summary.mean, summary.std
+        >>> y, edges = summary.histogram(bins=100)
+
+    """
+
+    def __init__(self, sample_size: int = 100_000, resolution: int = 8192, random_state: int | None = None) -> None:
+        """.. rubric:: Constructor
+
+        :param int sample_size: size of the reservoir sample.
+        :param int resolution: number of bins of the internal histogram. The data
+            range always spans at least half of them.
+        :param int random_state: seed of the reservoir sampling.
+        """
+        self.sample_size = sample_size
+        self.resolution = resolution
+        self._rng = np.random.default_rng(random_state)
+        self._reservoir = np.empty(sample_size)
+
+        #: number of values seen so far
+        self.n: int = 0
+        self.min: float = np.inf
+        self.max: float = -np.inf
+        self.mean: float = 0.0
+        # sums of powers of the deviations from the mean
+        self._m2 = self._m3 = self._m4 = 0.0
+
+        self._lo: float | None = None
+        self._width: float = 1.0
+        self._counts = np.zeros(resolution, dtype=np.int64)
+
+    @property
+    def var(self) -> float:
+        """Population variance."""
+        return self._m2 / self.n if self.n else np.nan
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation."""
+        return float(np.sqrt(self.var))
+
+    @property
+    def skew(self) -> float:
+        """Sample skewness (biased, as :func:`scipy.stats.skew`)."""
+        return float(np.sqrt(self.n) * self._m3 / self._m2**1.5) if self._m2 > 0 else np.nan
+
+    @property
+    def kurtosis(self) -> float:
+        """Excess kurtosis (biased, as :func:`scipy.stats.kurtosis`)."""
+        return float(self.n * self._m4 / self._m2**2 - 3) if self._m2 > 0 else np.nan
+
+    @property
+    def sample(self) -> np.ndarray:
+        """Uniform random sample of (at most :attr:`sample_size`) values of the stream."""
+        return self._reservoir[: min(self.n, self.sample_size)]
+
+    def update(self, chunk: np.ndarray) -> None:
+        """Add a chunk of values to the summary.
+
+        Raises:
+            ValueError: If the chunk has NaN or infinite values (the summary is
+                then left unchanged).
+
+        """
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        if not len(chunk):
+            return
+        if not np.all(np.isfinite(chunk)):
+            raise ValueError("The data contain NaN or infinite values")
+        self._update_reservoir(chunk)
+        self._update_moments(chunk)
+        self.min = min(self.min, float(chunk.min()))
+        self.max = max(self.max, float(chunk.max()))
+        self._update_histogram(chunk)
+
+    def _update_reservoir(self, chunk: np.ndarray) -> None:
+        # algorithm R, vectorized: the i-th value of the stream replaces a random
+        # element of the reservoir with probability sample_size / (i + 1)
+        k = self.sample_size
+        free = max(0, min(k - self.n, len(chunk)))
+        self._reservoir[self.n : self.n + free] = chunk[:free]
+        rest = chunk[free:]
+        if len(rest):
+            positions = self._rng.integers(0, self.n + free + np.arange(1, len(rest) + 1))
+            keep = positions < k
+            self._reservoir[positions[keep]] = rest[keep]
+
+    def _update_moments(self, chunk: np.ndarray) -> None:
+        n_a, n_b = self.n, len(chunk)
+        mean_b = float(chunk.mean())
+        deviations = chunk - mean_b
+        m2_b = float(np.sum(deviations**2))
+        m3_b = float(np.sum(deviations**3))
+        m4_b = float(np.sum(deviations**4))
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        m2_a, m3_a = self._m2, self._m3
+        self._m4 += (
+            m4_b
+            + delta**4 * n_a * n_b * (n_a**2 - n_a * n_b + n_b**2) / n**3
+            + 6 * delta**2 * (n_a**2 * m2_b + n_b**2 * m2_a) / n**2
+            + 4 * delta * (n_a * m3_b - n_b * m3_a) / n
+        )
+        self._m3 += m3_b + delta**3 * n_a * n_b * (n_a - n_b) / n**2 + 3 * delta * (n_a * m2_b - n_b * m2_a) / n
+        self._m2 += m2_b + delta**2 * n_a * n_b / n
+        self.mean += delta * n_b / n
+        self.n = n
+
+    def _update_histogram(self, chunk: np.ndarray) -> None:
+        if self._lo is None:
+            # the first chunk spans half of the bins; there is room on the right
+            self._lo = float(chunk.min())
+            span = float(chunk.max()) - self._lo
+            self._width = (span if span > 0 else max(abs(self._lo), 1.0) * 1e-6) * 2 / self.resolution
+        # double the bin width (merging pairs of bins) until the chunk fits
+        while chunk.min() < self._lo or chunk.max() >= self._lo + self._width * self.resolution:
+            zeros = np.zeros_like(self._counts)
+            if chunk.min() < self._lo:
+                self._lo -= self._width * self.resolution
+                counts = np.concatenate([zeros, self._counts])
+            else:
+                counts = np.concatenate([self._counts, zeros])
+            self._counts = counts.reshape(-1, 2).sum(axis=1)
+            self._width *= 2
+        index = np.minimum(((chunk - self._lo) / self._width).astype(np.intp), self.resolution - 1)
+        self._counts += np.bincount(index, minlength=self.resolution)
+
+    def histogram(self, bins: int = 100, xmin: float | None = None, xmax: float | None = None, density: bool = True) -> tuple[np.ndarray, np.ndarray]:
+        """Histogram of all the values seen so far, as :func:`numpy.histogram`.
+
+        Counts are derived from the internal histogram, interpolating linearly
+        within its bins, so they are approximate when the edges do not coincide
+        with the data minimum or maximum.
+
+        Args:
+            bins: Number of bins.
+            xmin: Lower edge (data minimum if None).
+            xmax: Upper edge (data maximum if None).
+            density: If True, return the probability density instead of counts.
+
+        Returns:
+            Tuple (values, bin_edges).
+
+        """
+        xmin = self.min if xmin is None else xmin
+        xmax = self.max if xmax is None else xmax
+        edges = np.linspace(xmin, xmax, bins + 1)
+        fine_edges = self._lo + self._width * np.arange(self.resolution + 1)
+        cumulative = np.concatenate([[0], np.cumsum(self._counts)])
+        at_edges = np.interp(edges, fine_edges, cumulative)
+        # the data extremes are known exactly
+        at_edges[edges <= self.min] = 0
+        at_edges[edges >= self.max] = self.n
+        counts = np.diff(at_edges)
+        if density:
+            total = counts.sum()
+            counts = counts / (total * np.diff(edges)) if total > 0 else counts
+        return counts, edges
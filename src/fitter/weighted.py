@@ -0,0 +1,130 @@
+"""Fits on weighted data.
+
+Heavily quantized data have few distinct values repeated many times. Such data
+can be given as distinct values and weights (their counts), e.g. from
+:func:`numpy.unique`, so that the likelihood and the Kolmogorov-Smirnov
+statistic are evaluated once per distinct value::
+
+    log L = sum_i weights_i * log f(values_i)
+
+The distributions are fitted by maximizing this weighted likelihood, starting
+from a small representative sample of the data (see :func:`weighted_sample`).
+See the *weights* and *deduplicate* arguments of :class:`fitter.Fitter`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+__all__ = ["deduplicate", "fit_weighted", "weighted_ks_statistic", "weighted_loglikelihood", "weighted_sample"]
+
+# cost of a value outside the support during the fits (as in scipy.stats)
+_PENALTY = np.log(np.finfo(float).max) * 100
+
+
+def deduplicate(values: np.ndarray, weights: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Collapse repeated values, summing their weights.
+
+    Args:
+        values: Data values.
+        weights: Weights of the values (1 for each value if None).
+
+    Returns:
+        Tuple (sorted distinct values, weights).
+
+    """
+    if weights is None:
+        unique, counts = np.unique(values, return_counts=True)
+        return unique, counts.astype(float)
+    unique, inverse = np.unique(values, return_inverse=True)
+    return unique, np.bincount(inverse.ravel(), weights=weights, minlength=len(unique))
+
+
+def weighted_sample(values: np.ndarray, weights: np.ndarray, size: int) -> np.ndarray:
+    """Return *size* sorted points following the weighted data.
+
+    The points are the weighted quantiles at probabilities ``(i + 0.5) / size``
+    (no randomness), so that each value appears in proportion to its weight.
+
+    Args:
+        values: Sorted values.
+        weights: Weights of the values.
+        size: Number of points.
+
+    Returns:
+        Sorted array of *size* points.
+
+    """
+    cumulative = np.cumsum(weights, dtype=float)
+    positions = (np.arange(size) + 0.5) / size * cumulative[-1]
+    return values[np.minimum(np.searchsorted(cumulative, positions), len(values) - 1)]
+
+
+def weighted_loglikelihood(dist: Any, param: tuple, values: np.ndarray, weights: np.ndarray) -> float:
+    """Log-likelihood of the weighted *values* under ``dist(*param)``."""
+    with np.errstate(all="ignore"):
+        return float(np.sum(weights * dist.logpdf(values, *param)))
+
+
+def weighted_ks_statistic(cdf: np.ndarray, weights: np.ndarray) -> float:
+    """Kolmogorov-Smirnov statistic of weighted data.
+
+    Args:
+        cdf: Fitted CDF at the sorted distinct values.
+        weights: Weights of the values.
+
+    Returns:
+        The largest difference between the fitted and the (weighted) empirical CDF,
+        equal to the statistic of the data with each value repeated as many times
+        as its weight.
+
+    """
+    cumulative = np.cumsum(weights, dtype=float)
+    empirical = cumulative / cumulative[-1]
+    d_plus = np.max(empirical - cdf)
+    d_minus = np.max(cdf - (empirical - weights / cumulative[-1]))
+    return float(max(d_plus, d_minus))
+
+
+def fit_weighted(
+    dist: Any,
+    values: np.ndarray,
+    weights: np.ndarray,
+    start: tuple,
+    optimizer: Callable | None = None,
+) -> tuple:
+    """Maximize the weighted likelihood (see :func:`weighted_loglikelihood`).
+
+    Args:
+        dist: A scipy.stats distribution.
+        values: Distinct values.
+        weights: Weights of the values.
+        start: Starting parameters (shapes, loc, scale).
+        optimizer: Function ``optimizer(func, x0)`` returning the minimum of *func*
+            (:func:`scipy.optimize.fmin` by default, as scipy's ``fit``).
+
+    Returns:
+        The fitted parameters.
+
+    """
+    if optimizer is None:
+        from scipy.optimize import fmin
+
+        def optimizer(func, x0):
+            return fmin(func, x0, disp=0)
+
+    def negative_loglikelihood(param: np.ndarray) -> float:
+        # as scipy's fit, values outside the support are penalized instead of
+        # giving an infinite cost, so that the optimizer can move back to the data
+        *shapes, loc, scale = param
+        if scale <= 0 or not dist._argcheck(*shapes):
+            return np.inf
+        with np.errstate(all="ignore"):
+            logpdf = dist.logpdf(values, *param)
+        finite = np.isfinite(logpdf)
+        return float(-np.sum(weights[finite] * logpdf[finite]) + np.sum(weights[~finite]) * _PENALTY)
+
+    return tuple(float(value) for value in optimizer(negative_loglikelihood, np.asarray(start, dtype=float)))
@@ -0,0 +1,34 @@
+import numpy as np
+from scipy import stats
+
+from fitter import BatchFitter, Fitter
+
+
+def test_batch_fitter():
+    samples = {f"s{i}": stats.gamma.rvs(2, loc=1, scale=2, size=100 + 20 * i, random_state=i) for i in range(4)}
+    samples["empty"] = []
+    samples["constant"] = [2.0, 2.0, 2.0]
+    bf = BatchFitter(samples, distributions=["norm", "gamma", "expon"])
+    bf.fit(max_workers=2)
+    assert len(bf.df_errors) == 6 * 3
+    failed = bf.df_errors[bf.df_errors["sample"].isin(["empty", "constant"])]
+    assert (failed["status"] == "failed").all()
+    assert np.isinf(failed["aic"]).all()
+
+    # same results as one Fitter per sample
+    f = Fitter(samples["s1"], distributions=["norm", "gamma", "expon"], verbose=False)
+    f.fit()
+    df = bf.df_errors[bf.df_errors["sample"] == "s1"].set_index("distribution")[f.df_errors.columns]
+    assert np.allclose(df.loc[f.df_errors.index], f.df_errors, rtol=1e-4)
+    assert np.allclose(bf.fitted_param[("s1", "norm")], f.fitted_param["norm"])
+
+    best = bf.get_best(method="aic")
+    assert list(best.index) == list(samples)
+    assert best.loc["s0", "distribution"] in ("gamma", "norm", "expon")
+
+
+def test_batch_sequence():
+    bf = BatchFitter([[1.0, 2.0, 3.0, 4.0], [2.0, 3.0, 5.0]], distributions="norm")
+    bf.fit(max_workers=1)
+    assert list(bf.df_errors["sample"]) == [0, 1]
+    assert (bf.df_errors["status"] == "success").all()
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from fitter.binned import BinnedData, binned_ks_statistic, binned_loglikelihood, fit_binned, histogram_sample
+
+
+def test_histogram_sample():
+    sample = histogram_sample(np.array([0.0, 1.0, 2.0]), np.array([1, 3]), 8)
+    assert np.all(np.diff(sample) >= 0)
+    assert np.sum(sample < 1) == 2
+
+    binned = BinnedData([0, 1, 2, 3, 4], [0, 10, 30, 0])
+    assert (binned.n, binned.min, binned.max) == (40, 1.0, 3.0)
+    with pytest.raises(ValueError):
+        BinnedData([0, 1], [1, 2])
+    with pytest.raises(ValueError):
+        BinnedData([0, 1, 2], [0, 0])
+
+
+def test_fit_binned():
+    counts, edges = np.histogram(stats.norm.rvs(3, 2, size=100_000, random_state=0), bins=50)
+    lower, upper = edges[:-1], edges[1:]
+    param = fit_binned(stats.norm, lower, upper, counts, (0.0, 1.0))
+    assert np.allclose(param, (3, 2), atol=0.05)
+    assert binned_loglikelihood(stats.norm, param, lower, upper, counts) > binned_loglikelihood(stats.norm, (3.5, 2), lower, upper, counts)
+    assert binned_loglikelihood(stats.uniform, (0, 1), lower, upper, counts) == -np.inf
+    assert binned_ks_statistic(stats.norm.cdf(edges, *param), counts) < 0.01
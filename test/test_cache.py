@@ -0,0 +1,52 @@
+import numpy as np
+from scipy import stats
+
+from fitter import FitCache, Fitter
+
+
+def test_cache(tmp_path):
+    data = stats.gamma.rvs(2, loc=1.5, scale=2, size=2000, random_state=0)
+    cache = FitCache(tmp_path)
+    f = Fitter(data, distributions=["gamma", "norm"], timeout=10)
+    f.fit(cache=cache)
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+    g = Fitter(data, distributions=["gamma", "norm", "expon"], timeout=10)
+    g.fit(cache=cache)
+    assert len(list(tmp_path.glob("*.json"))) == 3
+    assert g.fitted_param["gamma"] == f.fitted_param["gamma"]
+    assert np.allclose(g.fitted_pdf["norm"], f.fitted_pdf["norm"])
+    assert np.allclose(g.df_errors.loc[["gamma", "norm"]], f.df_errors)
+
+    # different bins, different entries
+    h = Fitter(data, distributions=["norm"], bins=50)
+    h.fit(cache=cache)
+    assert len(list(tmp_path.glob("*.json"))) == 4
+
+
+def test_cache_eviction(tmp_path):
+    cache = FitCache(tmp_path, max_size=0)
+    cache.set("abc", "norm", (0.0, 1.0), (1.0, 2.0, 3.0, 4.0, 0.1, 0.5), "success")
+    assert cache.get("abc", "norm") == ((0.0, 1.0), (1.0, 2.0, 3.0, 4.0, 0.1, 0.5), "success")
+    cache.evict()
+    assert cache.get("abc", "norm") is None
+
+
+def test_cache_transient_failures(tmp_path, monkeypatch):
+    data = stats.norm.rvs(size=500, random_state=0)
+    f = Fitter(data, distributions=["gamma", "norm", "expon"])
+    results = [("gamma", None, "failed", {}), ("norm", None, "failed", {"rejected": True}), ("expon", None, "timeout", {})]
+    monkeypatch.setattr(Fitter, "_run", lambda self, distributions, *args, **kwargs: [r for r in results if r[0] in distributions])
+    cache = FitCache(tmp_path)
+    f._run_cached(cache, f.distributions, f._get_fit_data()[0], f.x, f.y, {}, False, 1, "threads", None)
+    # only the rejection by the CDF check is deterministic
+    assert [path.name.split("-")[-1] for path in tmp_path.glob("*.json")] == ["norm.json"]
+
+
+def test_cache_size(tmp_path):
+    cache = FitCache(tmp_path)
+    cache.set("abc", "norm", (0.0, 1.0), (1.0, 2.0, 3.0, 4.0, 0.1, 0.5), "success")
+    cache.evict()
+    cache.set("abc", "expon", (0.0, 1.0), (1.0, 2.0, 3.0, 4.0, 0.1, 0.5), "success")
+    cache.set("abc", "norm", (0.5, 1.0), (1.0, 2.0, 3.0, 4.0, 0.1, 0.5), "success")
+    assert cache._size == sum(path.stat().st_size for path in tmp_path.glob("*.json"))
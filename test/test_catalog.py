@@ -0,0 +1,57 @@
+import numpy as np
+
+from fitter import catalog
+
+
+def test_catalog(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    catalog.get_catalog.cache_clear()
+    try:
+        entries = catalog.get_catalog()
+        # nothing is written unless asked
+        assert not list(tmp_path.glob("fitter/catalog-*.json"))
+        gamma = entries["gamma"]
+        assert gamma.params == ("a", "loc", "scale")
+        assert gamma.support == (0.0, np.inf)
+        assert not gamma.discrete
+        assert gamma.fit_cost == "low"
+        assert entries["poisson"].discrete
+        assert entries["genpareto"].shape_dependent_support
+        assert entries["levy_stable"].unstable and entries["levy_stable"].fit_cost == "high"
+
+        # objects that are not distributions are not listed
+        distributions = catalog.get_distributions()
+        assert "rv_histogram" not in distributions and "poisson" not in distributions
+        assert "norm" in distributions
+
+        # read back from the file
+        assert catalog.save_catalog().exists()
+        catalog.get_catalog.cache_clear()
+        assert catalog.get_catalog() == entries
+    finally:
+        catalog.get_catalog.cache_clear()
+
+
+def test_filter_candidates():
+    data = np.sort(np.array([1.0, 1.0, 2.0, 3.0, 3.0]))
+    kept, skipped = catalog.filter_candidates(["norm", "poisson", "unknown", "gausshyper"], data)
+    assert kept == ["norm"]
+    assert set(skipped) == {"poisson", "unknown", "gausshyper"}
+
+    kept, skipped = catalog.filter_candidates(["norm"], np.ones(10))
+    assert skipped == {"norm": "constant data"}
+
+
+def test_cover_data():
+    from scipy import stats
+
+    # beta start on [0, 1] for data on [2, 5]
+    start = catalog.cover_data("beta", (2.0, 3.0, 0.0, 1.0), 2.0, 5.0)
+    assert start[:2] == (2.0, 3.0)
+    assert np.all(stats.beta.pdf([2.0, 5.0], *start) > 0)
+    # lower bound only
+    start = catalog.cover_data("gamma", (2.0, 1.0, 1.0), 2.0, 5.0)
+    assert start == (2.0, 1.0, 1.0)
+    start = catalog.cover_data("gamma", (2.0, 3.0, 1.0), -2.0, 5.0)
+    assert stats.gamma.pdf(-2.0, *start) > 0
+    assert catalog.cover_data("norm", (0.0, 1.0), -10.0, 10.0) == (0.0, 1.0)
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+import scipy.stats
+
+from fitter.estimators import ESTIMATORS, get_estimator, register_estimator
+
+
+@pytest.mark.parametrize("name", sorted(ESTIMATORS))
+def test_estimators_match_scipy(name):
+    # the fast estimators must reach (at least) the likelihood of the generic fit
+    dist = getattr(scipy.stats, name)
+    data = scipy.stats.gamma.rvs(3, loc=1.5, scale=2, size=2000, random_state=0)
+    param = get_estimator(name)(data)
+    expected = dist.fit(data)
+    loglik = dist.logpdf(data, *param).sum()
+    assert loglik >= dist.logpdf(data, *expected).sum() - 1e-6 * abs(loglik)
+
+
+def test_gamma_fallback():
+    # shape below 1: unbounded likelihood, the generic fit must be used
+    data = scipy.stats.gamma.rvs(0.8, size=2000, random_state=0)
+    assert get_estimator("gamma")(data) is None
+
+
+def test_register_estimator():
+    @register_estimator("dummy")
+    def fit_dummy(data):
+        return (0, 1)
+
+    try:
+        assert get_estimator("dummy") is fit_dummy
+    finally:
+        del ESTIMATORS["dummy"]
+    assert get_estimator("dummy") is None
+    assert np.isclose(get_estimator("norm")(np.array([1.0, 2.0, 3.0]))[0], 2)
@@ -1,3 +1,5 @@
+import pytest
+
 from fitter import Fitter, get_common_distributions, get_distributions
 
 
@@ -145,3 +147,239 @@ def test_cdf_bounds_validation():
         cdf_at_data = fitted_dist.cdf(data)
         assert np.all(cdf_at_data <= 1), "Fitted geninvgauss CDF must not exceed 1"
         assert np.all(cdf_at_data >= 0), "Fitted geninvgauss CDF must not be below 0"
+
+
+def test_subsample_screening():
+    from scipy import stats
+
+    data = stats.gamma.rvs(2, loc=1.5, scale=2, size=20000, random_state=1)
+    f = Fitter(data, distributions=["gamma", "norm", "uniform", "expon"], verbose=False)
+    f.fit(subsample=1000, top_k=2, method="aic")
+    assert len(f.df_screening) == 4
+    assert "gamma" in f.fitted_param
+    # screened-out distributions are not fitted on the full data
+    assert (f.df_errors["aic"] == float("inf")).sum() == 2
+
+    # winners have the same metrics as a plain fit
+    g = Fitter(data, distributions=["gamma"], verbose=False)
+    g.fit()
+    assert abs(f.df_errors.loc["gamma", "aic"] - g.df_errors.loc["gamma", "aic"]) < 1e-3 * abs(g.df_errors.loc["gamma", "aic"])
+
+
+def test_sandbox():
+    from scipy import stats
+
+    data = stats.norm.rvs(size=3000, random_state=0)
+    f = Fitter(data, distributions=["norm", "levy_stable"], timeout=1, verbose=False)
+    f.fit(prefer="sandbox")
+    assert f.fit_status == {"norm": "success", "levy_stable": "timeout"}
+    assert f.df_errors.loc["levy_stable", "aic"] == float("inf")
+    assert "norm" in f.fitted_param
+
+
+def test_refit():
+    import numpy as np
+    from scipy import stats
+
+    data = stats.gamma.rvs(2, loc=1.5, scale=2, size=5000, random_state=0)
+    f = Fitter(data, distributions=["gamma", "norm"], timeout=10)
+    with pytest.raises(RuntimeError):
+        f.refit()
+    f.fit()
+    param = f.fitted_param["gamma"]
+
+    # the sorted copy of the data is not kept
+    assert f._sorted_data is None
+
+    f.bins = 30
+    assert len(f.x) == 30
+    f.refit()
+    assert f.fitted_param["gamma"] == param
+    assert len(f.fitted_pdf["gamma"]) == 30
+    g = Fitter(data, distributions=["gamma", "norm"], bins=30, timeout=10)
+    g.fit()
+    assert np.allclose(f.df_errors["sumsquare_error"], g.df_errors["sumsquare_error"])
+
+    f.xmax = 10
+    f.refit()
+    assert f.fitted_param["gamma"] != param
+    assert f.df_errors.loc["norm", "aic"] != g.df_errors.loc["norm", "aic"]
+
+
+def test_race():
+    from scipy import stats
+
+    data = stats.gamma.rvs(2, loc=1.5, scale=2, size=20000, random_state=0)
+    f = Fitter(data, distributions=["gamma", "norm", "uniform", "cauchy"], timeout=10)
+    f.fit(race=True, subsample=2000, top_k=1, method="aic")
+    assert list(f.get_best(method="aic")) == ["gamma"]
+    assert f.df_screening is not None
+    assert "pruned" in f.fit_status.values()
+    assert f.fit_status["gamma"] == "success"
+
+
+def test_ks_method():
+    import numpy as np
+    from scipy import stats
+
+    from fitter.fitter import _kstest_sorted
+
+    data = np.sort(stats.norm.rvs(size=500, random_state=0))
+    cdf = stats.norm.cdf(data)
+    expected = stats.kstest(data, "norm", method="exact")
+    assert np.allclose(_kstest_sorted(data, cdf, "exact"), (expected.statistic, expected.pvalue))
+    expected = stats.kstest(data, "norm", method="asymp")
+    assert np.allclose(_kstest_sorted(data, cdf, "asymp"), (expected.statistic, expected.pvalue))
+
+    f = Fitter(data[::-1], distributions=["norm"])
+    f.fit(ks_method="asymp")
+    assert np.isclose(f.df_errors.loc["norm", "ks_statistic"], stats.kstest(data, "norm", f.fitted_param["norm"]).statistic)
+
+
+def test_skipped():
+    f = Fitter([1, 1, 2, 2, 3, 3], distributions=["norm", "poisson", "gausshyper"])
+    f.fit()
+    assert f.fit_status == {"norm": "success", "poisson": "skipped", "gausshyper": "skipped"}
+    assert set(f.skipped) == {"poisson", "gausshyper"}
+    assert list(f.get_best()) == ["norm"]
+
+
+def test_concurrent_fits():
+    import warnings
+    from concurrent.futures import ThreadPoolExecutor
+
+    from scipy import stats
+
+    from fitter import FitPool
+
+    datasets = [stats.gamma.rvs(2, scale=seed + 1, size=1000, random_state=seed) for seed in range(4)]
+    distributions = ["gamma", "norm", "lognorm"]
+
+    def fit(data, **kwargs):
+        f = Fitter(data, distributions=distributions, timeout=30)
+        f.fit(**kwargs)
+        return f.fitted_param
+
+    expected = [fit(data, max_workers=1) for data in datasets]
+    filters = list(warnings.filters)
+    with FitPool(max_workers=2) as pool, ThreadPoolExecutor(4) as executor:
+        for kwargs in ({"prefer": "threads", "max_workers": 2}, {"pool": pool}):
+            results = list(executor.map(lambda data: fit(data, **kwargs), datasets))
+            for params, reference in zip(results, expected):
+                for name in distributions:
+                    assert params[name] == pytest.approx(reference[name], rel=1e-6)
+    assert warnings.filters == filters
+
+
+def test_fit_async():
+    import asyncio
+    import contextlib
+    import time
+
+    from scipy import stats
+
+    from fitter import FitPool
+
+    data = stats.gamma.rvs(2, scale=2, size=2000, random_state=0)
+
+    async def collect(f, **kwargs):
+        async with contextlib.aclosing(f.iter_fit_async(**kwargs)) as results:
+            return [item async for item in results]
+
+    f = Fitter(data, distributions=["gamma", "norm", "lognorm"], timeout=30)
+    results = asyncio.run(collect(f, max_workers=2))
+    assert sorted(results) == [("gamma", "success"), ("lognorm", "success"), ("norm", "success")]
+    assert list(f.get_best(method="aic")) in (["gamma"], ["lognorm"])
+
+    # the slow fit is killed at the deadline
+    f = Fitter(data, distributions=["norm", "levy_stable"], timeout=600)
+    with FitPool(max_workers=2) as pool:
+        t0 = time.time()
+        asyncio.run(f.fit_async(pool=pool, deadline=3))
+        assert time.time() - t0 < 30
+        assert f.fit_status == {"norm": "success", "levy_stable": "timeout"}
+        assert pool.n_killed == 1
+
+        # and when the task is cancelled
+        async def cancel():
+            task = asyncio.create_task(f.fit_async(pool=pool))
+            await asyncio.sleep(2)
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel())
+        assert pool.n_killed == 2
+
+
+def test_from_histogram():
+    import numpy as np
+    from scipy import stats
+
+    data = stats.gamma.rvs(2, loc=1.5, scale=2, size=200_000, random_state=0)
+    counts, edges = np.histogram(data, bins=80)
+    f = Fitter.from_histogram(counts, edges, distributions=["gamma", "norm", "poisson"], timeout=30)
+    f.fit()
+    assert list(f.get_best(method="aic")) == ["gamma"]
+    assert np.allclose(f.fitted_param["gamma"], (2, 1.5, 2), rtol=0.05)
+    assert f.fit_status["poisson"] == "skipped"
+    assert np.allclose(f.y * np.diff(edges), counts / counts.sum())
+
+    with pytest.raises(ValueError):
+        f.bins = 20
+    with pytest.raises(ValueError):
+        f.fit(race=True)
+
+    # the range selects bins
+    with pytest.raises(ValueError):
+        f.xmin = 100
+    assert f.xmin == edges[0]
+    f.xmax = 10
+    f.refit()
+    assert f.x.max() < 10 and f.fit_status["gamma"] == "success"
+
+
+def test_weights():
+    import numpy as np
+    from scipy import stats
+
+    data = np.round(stats.gamma.rvs(2, loc=1.5, scale=2, size=20_000, random_state=0), 1)
+    f = Fitter(data, distributions=["gamma", "norm"], timeout=30)
+    f.fit()
+    g = Fitter(data, distributions=["gamma", "norm"], deduplicate=True, timeout=30)
+    assert len(g._data) == len(np.unique(data))
+    g.fit()
+    assert np.allclose(g.fitted_param["norm"], f.fitted_param["norm"], rtol=1e-3)
+    columns = ["sumsquare_error", "aic", "bic", "ks_statistic"]
+    assert np.allclose(g.df_errors[columns], f.df_errors[columns], rtol=1e-3)
+    assert np.allclose(g.y, f.y) and list(g.get_best(method="aic")) == ["gamma"]
+
+    values, counts = np.unique(data, return_counts=True)
+    h = Fitter(values, weights=counts, distributions=["gamma", "norm"], timeout=30)
+    h.fit()
+    assert np.allclose(h.df_errors, g.df_errors)
+
+    # the workers are told how to fit the data, rather than guessing from its shape
+    weighted, mode = h._get_fit_data()
+    assert mode == "weighted"
+    assert Fitter._fit_single_distribution("norm", weighted, h.x, h.y, 30, False, mode="weighted")[2] == "success"
+    assert Fitter._fit_single_distribution("norm", weighted, h.x, h.y, 30, False)[2] == "failed"
+
+    # "auto" keeps data with mostly distinct values
+    assert Fitter(data + np.arange(len(data)), deduplicate="auto")._weights is None
+    with pytest.raises(ValueError):
+        Fitter(values, weights=counts[1:])
+
+
+def test_column_vector():
+    import numpy as np
+    from scipy import stats
+
+    data = stats.gamma.rvs(2, scale=2, size=(3000, 1), random_state=0)
+    f = Fitter(data, distributions=["gamma", "norm"], timeout=30)
+    f.fit()
+    assert f._data.ndim == 1
+    g = Fitter(data.ravel(), distributions=["gamma", "norm"], timeout=30)
+    g.fit()
+    assert np.allclose(f.df_errors, g.df_errors)
+    assert 0 < f.df_errors.loc["gamma", "ks_statistic"] < 0.05
@@ -0,0 +1,39 @@
+import numpy as np
+from scipy import stats
+
+from fitter.catalog import cover_data
+from fitter.guesses import GUESSES, DataSummary, guess_starts
+
+
+def test_summary():
+    data = np.sort(stats.gamma.rvs(2, size=10000, random_state=0))
+    summary = DataSummary.from_sorted(data)
+    assert np.isclose(summary.mean, data.mean())
+    assert np.isclose(summary.std, data.std())
+    assert np.isclose(summary.skew, stats.skew(data))
+    assert np.isclose(summary.kurtosis, stats.kurtosis(data))
+    assert np.isclose(summary.median, np.median(data), rtol=1e-3)
+
+
+def test_guesses():
+    frozen = {
+        "t": stats.t(5, 1, 2),
+        "cauchy": stats.cauchy(2, 3),
+        "chi2": stats.chi2(5, 1, 2),
+        "invgauss": stats.invgauss(0.5, 1, 2),
+        "genpareto": stats.genpareto(0.2, 1, 2),
+        "beta": stats.beta(2, 5, 1, 3),
+    }
+    for name, dist in frozen.items():
+        data = np.sort(dist.rvs(size=20000, random_state=1))
+        start = guess_starts([name], DataSummary.from_sorted(data))[name]
+        assert len(start) == len(dist.args)
+        assert np.allclose(start, dist.args, rtol=0.5, atol=0.5), name
+        # once moved to cover the data (as in Fitter), a valid starting point
+        start = cover_data(name, start, data[0], data[-1])
+        assert np.isfinite(getattr(stats, name).logpdf(data, *start).sum())
+
+    # every guess handles any data
+    data = np.sort(stats.norm.rvs(size=1000, random_state=0))
+    starts = guess_starts(list(GUESSES), DataSummary.from_sorted(data))
+    assert all(start[-1] > 0 for start in starts.values())
@@ -20,3 +20,68 @@ def test2():
     hf = HistFit(X=X, Y=Y)
     hf.fit(error_rate=0.03, Nfit=20, semilogy=True)
     print(hf.mu, hf.sigma, hf.amplitude)
+
+
+def test_headless():
+    import numpy as np
+    import scipy.optimize
+    import scipy.stats
+
+    from fitter import HistFit
+    from fitter.histfit import fit_gaussians
+
+    data = scipy.stats.norm.rvs(2, 3.4, size=10000, random_state=0)
+    hf = HistFit(data, bins=30)
+    hf.fit(error_rate=0.03, Nfit=200, plot=False, max_workers=2)
+    assert hf.fits.shape == (200, 30)
+    assert hf.converged.all()
+    assert abs(hf.mu - 2) < 0.3 and abs(hf.sigma - 3.4) < 0.3
+
+    # same solutions as scipy's least squares
+    noisy = hf.Y + hf.E[:10]
+    params, _ = fit_gaussians(hf.X, noisy, (hf.guess_mean, hf.guess_std, 1.0))
+    for row, y in zip(params, noisy):
+        expected = scipy.optimize.least_squares(lambda p: p[2] * scipy.stats.norm.pdf(hf.X, p[0], p[1]) - y, (hf.guess_mean, hf.guess_std, 1.0)).x
+        assert np.allclose(row, expected, rtol=1e-3)
+
+    # figures built afterwards from the stored results
+    hf.plot(semilogy=True)
+
+
+def test_models():
+    import numpy as np
+    import pytest
+
+    from fitter import HistFit
+    from fitter.histfit import HISTFIT_MODELS
+
+    # analytic Jacobians match finite differences
+    x = np.linspace(0.1, 10, 40)
+    starts = {"normal": (3, 1.5, 2), "lognormal": (1, 0.5, 2), "gamma": (2.5, 1.2, 2), "mixture": (2, 0.7, 1, 6, 1.2, 2)}
+    for name, model in HISTFIT_MODELS.items():
+        params = np.array([starts[name]], dtype=float)
+        _, jacobian = model.evaluate(x, params)
+        for j, h in enumerate(np.eye(params.shape[1]) * 1e-6):
+            numerical = (model.evaluate(x, params + h)[0] - model.evaluate(x, params - h)[0]) / 2e-6
+            assert np.allclose(jacobian[..., j], numerical, atol=1e-6)
+
+    rng = np.random.default_rng(0)
+    hf = HistFit(rng.gamma(2.5, 1.2, 20000), bins=40, model="gamma")
+    shape, scale, _ = hf.fit(error_rate=0.01, Nfit=50, plot=False)
+    assert abs(shape - 2.5) < 0.2 and abs(scale - 1.2) < 0.1
+    assert hf.shapes.shape == (50,)
+
+    hf = HistFit(np.r_[rng.normal(2, 0.7, 8000), rng.normal(6, 1.2, 12000)], bins=40, model="mixture")
+    hf.fit(error_rate=0.01, Nfit=50, plot=False)
+    assert abs(hf.mu1 - 2) < 0.2 and abs(hf.mu2 - 6) < 0.2
+
+    with pytest.raises(ValueError):
+        HistFit([1.0, 2.0, 3.0], bins=3, model="unknown")
+
+    # failures are not reported as converged
+    from fitter.histfit import fit_curves
+
+    Y = HISTFIT_MODELS["normal"].evaluate(x, np.array([[3.0, 1.5, 2.0]]))[0]
+    params, converged = fit_curves(x, np.vstack([Y, np.full_like(Y, np.nan)]), (2.0, 1.0, 1.0))
+    assert converged.tolist() == [True, False]
+    assert np.allclose(params[0], (3, 1.5, 2))
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+
+# modules that must not be loaded by "import fitter"
+HEAVY = ("scipy.stats", "pandas", "matplotlib.pyplot", "joblib", "tqdm")
+
+
+def _run(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+
+def test_lazy_import():
+    code = "import sys, fitter; print(sorted(m for m in %r if m in sys.modules))" % (HEAVY,)
+    assert _run(code).strip() == "[]"
+
+    # fitting without plotting and without progress bar does not need them either
+    code = (
+        "import sys, fitter\n"
+        "fitter.Fitter([1.0, 2.0, 2.5, 3.0], distributions=['norm'], verbose=False).fit(prefer='threads')\n"
+        "print(sorted(m for m in ('matplotlib.pyplot', 'tqdm') if m in sys.modules))"
+    )
+    assert _run(code).strip() == "[]"
+
+    # headless mode
+    code = (
+        "import sys, fitter\n"
+        "f = fitter.Fitter([1.0, 2.0, 2.5, 3.0], distributions=['norm'], verbose=False)\n"
+        "f.fit(prefer='threads')\n"
+        "f.summary(plot=False)\n"
+        "fitter.HistFit([1.0, 2.0, 2.5, 3.0, 2.2], bins=3).fit(Nfit=5, plot=False)\n"
+        "print('matplotlib' in sys.modules)"
+    )
+    assert _run(code).strip() == "False"
+
+
+def test_import_time():
+    code = "import time; start = time.perf_counter(); import fitter; print(time.perf_counter() - start)"
+    assert float(_run(code)) < 0.5
+
+
+def test_lazy_attributes():
+    import fitter
+
+    assert "Fitter" in dir(fitter)
+    assert fitter.Fitter.__name__ == "Fitter"
+    try:
+        fitter.Unknown
+    except AttributeError:
+        pass
+    else:  # pragma: no cover
+        raise AssertionError
+
+
+def test_lazy_submodules():
+    code = (
+        "import fitter\n"
+        "print(fitter.fitter.Fitter is fitter.Fitter, fitter.histfit.HistFit.__name__, 'histfit' in dir(fitter))"
+    )
+    assert _run(code).split() == ["True", "HistFit", "True"]
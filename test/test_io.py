@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from fitter import Fitter
+from fitter.io import iter_chunks, read_column
+
+
+def test_read_column(tmp_path):
+    data = np.random.default_rng(0).normal(size=(1000, 2))
+
+    np.save(tmp_path / "data.npy", data)
+    column = read_column(tmp_path / "data.npy", column=2)
+    assert np.array_equal(column, data[:, 1])
+    with pytest.raises(IndexError):
+        read_column(tmp_path / "data.npy", column=3)
+
+    data[:, 0].tofile(tmp_path / "data.bin")
+    assert isinstance(read_column(tmp_path / "data.bin"), np.memmap)
+    assert np.array_equal(read_column(tmp_path / "data.bin"), data[:, 0])
+    data[:, 0].astype("float32").tofile(tmp_path / "data32.raw")
+    assert np.allclose(read_column(tmp_path / "data32.raw", dtype="float32"), data[:, 0])
+
+    np.savetxt(tmp_path / "data.txt", data, delimiter=";")
+    assert np.allclose(read_column(tmp_path / "data.txt", column=2, delimiter=";"), data[:, 1])
+    with pytest.raises(IndexError):
+        read_column(tmp_path / "data.txt", column=3, delimiter=";")
+    (tmp_path / "ragged.csv").write_text("1,2\n3,4\n5\n6,7\n")
+    with pytest.raises(IndexError):
+        read_column(tmp_path / "ragged.csv", column=2)
+    with pytest.raises(IndexError):
+        list(iter_chunks(tmp_path / "ragged.csv", column=2))
+    (tmp_path / "bad.csv").write_text("1,2\n3,x\n")
+    with pytest.raises(ValueError):
+        read_column(tmp_path / "bad.csv", column=2)
+
+    chunks = list(iter_chunks(tmp_path / "data.txt", chunksize=300, column=2, delimiter=";"))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+
+
+def test_read_arrow(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.feather
+    import pyarrow.parquet
+
+    values = np.arange(100.0)
+    table = pa.table({"a": values, "b": 2 * values})
+    pyarrow.parquet.write_table(table, tmp_path / "data.parquet")
+    pyarrow.feather.write_feather(table, tmp_path / "data.feather")
+    assert np.array_equal(read_column(tmp_path / "data.parquet", column="b"), 2 * values)
+    assert np.array_equal(read_column(tmp_path / "data.feather", column=2), 2 * values)
+    assert sum(len(chunk) for chunk in iter_chunks(tmp_path / "data.parquet", chunksize=30)) == 100
+
+    # Arrow files are read by record batch
+    pyarrow.feather.write_feather(table, tmp_path / "batches.feather", chunksize=40)
+    chunks = list(iter_chunks(tmp_path / "batches.feather", chunksize=30, column="b"))
+    assert [len(chunk) for chunk in chunks] == [30, 10, 30, 10, 20]
+    assert np.array_equal(np.concatenate(chunks), 2 * values)
+
+
+def test_fitter_from_file(tmp_path):
+    data = np.random.default_rng(0).normal(size=1000)
+    np.save(tmp_path / "data.npy", data)
+    f = Fitter(tmp_path / "data.npy", distributions="norm")
+    # no filtering: the memory-mapped data is used without copy
+    assert f._data is f._alldata
+    assert not f._data.flags.owndata
+    f.fit()
+    assert np.allclose(f.fitted_param["norm"], (data.mean(), data.std()))
+
+    f = Fitter(data.tobytes(), distributions="norm")
+    assert np.array_equal(f._data, data)
@@ -18,7 +18,7 @@ def setup_teardown():
     yield
 
     # remove files left by testing
-    filenames = ["test.csv", "fitter.log", "fitter.png"]
+    filenames = ["test.csv", "test.npy", "fitter.log", "fitter.png"]
     for filename in filenames:
         file = Path(filename)
         if file.exists():
@@ -44,3 +44,46 @@ def test_main_app(setup_teardown):
 
     results = runner.invoke(fitdist, ["test.csv", "--output-image", "test.dummy"])
     assert results.exit_code == 1
+
+
+def test_main_no_plot(setup_teardown):
+    from click.testing import CliRunner
+
+    runner = CliRunner()
+    results = runner.invoke(fitdist, ["test.csv", "--no-plot", "--output-image", "nofile.png"])
+    assert results.exit_code == 0
+    assert "Best fit is" in results.output
+    assert not Path("nofile.png").exists()
+
+
+def test_main_npy(setup_teardown):
+    import numpy as np
+    from click.testing import CliRunner
+
+    np.save("test.npy", np.loadtxt("test.csv", delimiter=","))
+    runner = CliRunner()
+    results = runner.invoke(fitdist, ["test.npy", "--no-verbose", "--column-number", 2])
+    assert results.exit_code == 0
+
+    results = runner.invoke(fitdist, ["test.npy", "--no-verbose", "--column-number", 3])
+    assert results.exit_code == 1
+
+
+def test_main_errors(setup_teardown):
+    import numpy as np
+    from click.testing import CliRunner
+
+    runner = CliRunner()
+    # a line without the column is an error, not a NaN value
+    Path("test.csv").write_text("1,2\n3,4\n5\n6,7\n")
+    results = runner.invoke(fitdist, ["test.csv", "--no-verbose", "--column-number", 2])
+    assert results.exit_code == 1
+    assert "Column 2 does not exist" in results.output
+
+    np.arange(10.0).tofile("test.bin")
+    try:
+        results = runner.invoke(fitdist, ["test.bin", "--no-verbose", "--dtype", "notatype"])
+    finally:
+        Path("test.bin").unlink()
+    assert results.exit_code == 1
+    assert "Invalid data type" in results.output
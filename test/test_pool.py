@@ -0,0 +1,76 @@
+import math
+import multiprocessing
+import time
+
+from fitter import FitPool
+
+
+def test_pool():
+    with FitPool(max_workers=2) as pool:
+        results = sorted(pool.imap_unordered(math.sqrt, [(4,), (-1,), (9,)]))
+        assert [status for _, status, _ in results] == ["success", "failed", "success"]
+        assert results[0][2] == 2
+
+        # the worker running the long task is killed and replaced
+        pids = {worker.process.pid for worker in pool._workers}
+        t0 = time.time()
+        results = sorted(pool.imap_unordered(time.sleep, [(0,), (60,)], timeout=1))
+        assert time.time() - t0 < 30
+        assert [status for _, status, _ in results] == ["success", "timeout"]
+        assert pool.n_killed == 1
+        assert pids != {worker.process.pid for worker in pool._workers}
+
+        # the pool is still usable
+        results = list(pool.imap_unordered(math.sqrt, [(16,)]))
+        assert results == [(0, "success", 4)]
+
+
+def test_shared_array():
+    import numpy as np
+
+    data = np.arange(1000.0)
+    with FitPool(max_workers=1) as pool:
+        shared = pool.share(data)
+        results = list(pool.imap_unordered(np.sum, [(shared,), (shared,)]))
+        assert [result for _, _, result in results] == [data.sum(), data.sum()]
+        pool.release(shared)
+
+
+def test_pool_reused_by_fitter():
+    from scipy import stats
+
+    from fitter import Fitter
+
+    data = stats.gamma.rvs(2, loc=1.5, scale=2, size=200000, random_state=0)
+    with FitPool(max_workers=2, max_nbytes=1000) as pool:
+        f = Fitter(data, distributions=["norm", "expon", "uniform"], verbose=False)
+        f.fit(pool=pool)
+        pids = {worker.process.pid for worker in pool._workers}
+        g = Fitter(data[:1000], distributions=["norm", "expon", "uniform"], verbose=False)
+        g.fit(pool=pool)
+        assert pids == {worker.process.pid for worker in pool._workers}
+        assert f.fit_status["norm"] == "success"
+        assert g.fit_status["norm"] == "success"
+
+
+def test_pool_stop():
+    import threading
+
+    stop = threading.Event()
+    with FitPool(max_workers=2) as pool:
+        threading.Timer(1, stop.set).start()
+        t0 = time.time()
+        results = list(pool.imap_unordered(time.sleep, [(0,), (60,)], stop=stop))
+        assert time.time() - t0 < 30
+        assert results == [(0, "success", None)]
+        assert pool.n_killed == 1
+
+
+def test_pool_dead_worker():
+    with FitPool(max_workers=1) as pool:
+        assert pool._context.get_start_method() == multiprocessing.get_start_method()
+        assert list(pool.imap_unordered(math.sqrt, [(4,)])) == [(0, "success", 2.0)]
+        # a worker dying while idle is replaced
+        pool._workers[0].process.kill()
+        pool._workers[0].process.join()
+        assert list(pool.imap_unordered(math.sqrt, [(9,)])) == [(0, "success", 3.0)]
@@ -0,0 +1,22 @@
+import json
+
+from scipy import stats
+
+from fitter import Fitter
+
+
+def test_timings(tmp_path):
+    data = stats.gamma.rvs(2, loc=1.5, scale=2, size=1000, random_state=0)
+    f = Fitter(data, distributions=["gamma", "norm", "beta"], timeout=10)
+    f.fit()
+    df = f.df_timings
+    assert set(df.index) == {"gamma", "norm", "beta"}
+    for stage in ("fit", "pdf", "logpdf", "cdf_check", "ks"):
+        assert (df[f"{stage}_wall"] >= 0).all()
+    # closed-form estimator for norm, optimizer otherwise
+    assert df.loc["beta", "iterations"] > 0
+    assert df["iterations"].isna()["norm"]
+
+    f.save_trace(tmp_path / "trace.json")
+    events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+    assert {event["name"] for event in events} >= {"gamma", "fit", "ks"}
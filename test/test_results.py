@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from fitter.results import PDFView, ParamView, ResultTable, StatusView
+
+
+def test_result_table():
+    table = ResultTable(capacity=2)
+    table.set("norm", "success", (0.0, 1.0), (0.1, 10.0, 12.0, 0.2, 0.05, 0.5))
+    table.set("gamma", "success", (2.0, 0.0, 1.0), (0.2, 11.0, 13.0, 0.3, 0.06, 0.4))
+    table.set("cauchy", "timeout")
+    assert len(table) == 3
+    assert table.param("norm") == (0.0, 1.0)
+    assert table.param("gamma") == (2.0, 0.0, 1.0)
+    assert table.param("cauchy") is None
+    assert table.status_of("cauchy") == "timeout"
+
+    df = table.to_dataframe()
+    assert list(df.index) == ["cauchy", "gamma", "norm"]
+    assert df.loc["cauchy", "aic"] == np.inf and df.loc["cauchy", "ks_pvalue"] == 0
+    table.set_metric("norm", "aic", 5.0)
+    assert table.to_dataframe().loc["norm", "aic"] == 5.0
+
+    table.remove("norm")
+    assert "norm" not in table
+    assert table.param("cauchy") is None and table.param("gamma") == (2.0, 0.0, 1.0)
+    table.set("gamma", "failed")
+    assert table.param("gamma") is None
+
+
+def test_views():
+    from scipy import stats
+
+    table = ResultTable()
+    table.set("norm", "success", (0.0, 1.0), (0.1, 10.0, 12.0, 0.2, 0.05, 0.5))
+    table.set("poisson", "skipped")
+    x = np.linspace(-2, 2, 5)
+    assert StatusView(table) == {"norm": "success", "poisson": "skipped"}
+    assert dict(ParamView(table)) == {"norm": (0.0, 1.0)}
+    pdf = PDFView(table, lambda: x)
+    assert list(pdf) == ["norm"]
+    assert np.allclose(pdf["norm"], stats.norm.pdf(x))
+    with pytest.raises(KeyError):
+        pdf["poisson"]
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from fitter import Fitter
+from fitter.streaming import StreamSummary
+
+
+def test_stream_summary():
+    data = stats.gamma.rvs(2, loc=1.5, scale=2, size=100000, random_state=0)
+    summary = StreamSummary(sample_size=1000, random_state=0)
+    for chunk in np.array_split(data, 37):
+        summary.update(chunk)
+    assert summary.n == len(data)
+    assert summary.min == data.min() and summary.max == data.max()
+    assert np.isclose(summary.mean, data.mean())
+    assert np.isclose(summary.std, data.std())
+    assert np.isclose(summary.skew, stats.skew(data))
+    assert np.isclose(summary.kurtosis, stats.kurtosis(data))
+    assert len(summary.sample) == 1000
+    assert np.isin(summary.sample, data).all()
+
+    counts, edges = summary.histogram(bins=50, density=False)
+    expected, _ = np.histogram(data, bins=50)
+    assert counts.sum() == len(data)
+    assert np.abs(counts - expected).max() < 0.01 * expected.max()
+
+
+def test_stream_summary_growing_range():
+    summary = StreamSummary(sample_size=10, random_state=0)
+    for chunk in ([5.0, 6.0], [-100.0], [1e4, 3.0]):
+        summary.update(chunk)
+    counts, _ = summary.histogram(bins=4, density=False)
+    assert list(counts) == [4, 0, 0, 1]
+    assert sorted(summary.sample) == [-100.0, 3.0, 5.0, 6.0, 1e4]
+
+
+def test_from_stream(tmp_path):
+    data = stats.gamma.rvs(2, loc=1.5, scale=2, size=20000, random_state=0)
+    filename = tmp_path / "data.npy"
+    np.save(filename, data)
+    f = Fitter.from_stream(filename, sample_size=5000, chunksize=3000, distributions=["gamma"], random_state=0)
+    assert f.stream_summary.n == len(data)
+    assert len(f._data) == 5000
+    assert f.xmin == data.min() and f.xmax == data.max()
+    f.fit()
+    assert f.fit_status["gamma"] == "success"
+
+    # text files and iterables of chunks
+    np.savetxt(tmp_path / "data.csv", np.column_stack([data, data * 2]), delimiter=",")
+    f = Fitter.from_stream(tmp_path / "data.csv", column=2, chunksize=3000)
+    assert f.stream_summary.max == 2 * data.max()
+    f = Fitter.from_stream(np.array_split(data, 10))
+    assert f.stream_summary.n == len(data)
+
+
+def test_stream_summary_not_finite():
+    summary = StreamSummary()
+    summary.update([1.0, 2.0])
+    for chunk in ([1.0, 2.0, np.inf], [np.nan, 3.0]):
+        with pytest.raises(ValueError):
+            summary.update(chunk)
+    assert summary.n == 2 and summary.mean == 1.5
@@ -0,0 +1,32 @@
+import numpy as np
+from scipy import stats
+
+from fitter.weighted import deduplicate, fit_weighted, weighted_ks_statistic, weighted_loglikelihood, weighted_sample
+
+
+def test_deduplicate():
+    values, weights = deduplicate(np.array([2.0, 1.0, 2.0, 3.0, 2.0]))
+    assert values.tolist() == [1, 2, 3] and weights.tolist() == [1, 3, 1]
+    values, weights = deduplicate(np.array([2.0, 1.0, 2.0]), np.array([0.5, 1.0, 2.0]))
+    assert values.tolist() == [1, 2] and weights.tolist() == [1, 2.5]
+
+    sample = weighted_sample(np.array([1.0, 2.0, 3.0]), np.array([1, 2, 1]), 8)
+    assert sample.tolist() == [1, 1, 2, 2, 2, 2, 3, 3]
+
+
+def test_weighted_statistics():
+    data = np.round(stats.norm.rvs(3, 2, size=20_000, random_state=0), 1)
+    values, weights = deduplicate(data)
+    param = fit_weighted(stats.norm, values, weights, (0.0, 1.0))
+    assert np.allclose(param, stats.norm.fit(data), atol=1e-3)
+
+    # same statistics as the repeated values
+    assert np.isclose(weighted_loglikelihood(stats.norm, param, values, weights), stats.norm.logpdf(data, *param).sum())
+    ks = stats.kstest(data, stats.norm(*param).cdf).statistic
+    assert np.isclose(weighted_ks_statistic(stats.norm.cdf(values, *param), weights), ks)
+
+    # starting point whose support does not contain the data
+    data = np.round(stats.gamma.rvs(2, loc=1, size=20_000, random_state=0), 1)
+    values, weights = deduplicate(data)
+    param = fit_weighted(stats.gamma, values, weights, (2.0, 1.5, 1.0))
+    assert np.allclose(param, stats.gamma.fit(data), rtol=1e-3)